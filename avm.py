@@ -420,7 +420,7 @@ def cmd_doctor(args) -> None:
     logger = setup_logging(args.verbose, args.quiet, args.json_logs)
     
     # Run the doctor check
-    results = doctor(logger=logger, project="doctor")
+    results = doctor(logger=logger, project="doctor", deep=not args.quick)
     
     # Exit with error code if any critical checks failed
     critical_components = ["python", "ffmpeg", "ffprobe"]
@@ -758,6 +758,11 @@ Examples:
         action="store_true",
         help="Show detailed information"
     )
+    doctor_parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="Only check that FFmpeg/FFprobe and Chromium are installed; skip running them"
+    )
     
     return parser
 
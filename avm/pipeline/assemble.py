@@ -161,6 +161,8 @@ def _apply_crossfades(
         cmd = [
             "ffmpeg",
             "-y",
+            "-threads",
+            "0",
             "-i",
             str(current_path),
             "-i",
@@ -207,6 +209,8 @@ def _concat_with_demuxer(clips: Sequence[Path], destination: Path) -> None:
     cmd = [
         "ffmpeg",
         "-y",
+        "-threads",
+        "0",
         "-f",
         "concat",
         "-safe",
@@ -246,6 +250,8 @@ def _attach_intro_outro(
                 cmd = [
                     "ffmpeg",
                     "-y",
+                    "-threads",
+                    "0",
                     "-i",
                     str(candidate),
                     "-an",
@@ -324,6 +330,8 @@ def _apply_watermark_if_needed(
     cmd = [
         "ffmpeg",
         "-y",
+        "-threads",
+        "0",
         "-i",
         str(video_path),
         "-i",
@@ -3,12 +3,47 @@ Audio processing: normalization, music ducking, and mastering.
 """
 
 import json
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
 
 from .errors import RenderError
 
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover - optional speedup
+    _json = json
+
+_LOUDNORM_FIELDS = ("input_i", "input_lra", "input_tp", "input_thresh", "target_offset")
+
+# Lossless intermediates at roughly half the size of PCM; level 0 encodes fastest
+_FLAC_ARGS = ("-c:a", "flac", "-compression_level", "0")
+
+# In-process DSP works on 48kHz stereo float32; gains are computed per 10 ms block
+_DSP_RATE = 48000
+_DSP_BLOCK = 480
+
+
+def audio_codec_args(output_path: Path, pcm_codec: str = "pcm_s16le") -> Tuple[str, ...]:
+    """
+    Pick the codec for an intermediate audio file from its extension.
+    
+    Args:
+        output_path: Output file path; ``.flac`` selects FLAC
+        pcm_codec: PCM codec for any other extension (WAV)
+    
+    Returns:
+        FFmpeg codec options
+    """
+    
+    if Path(output_path).suffix.lower() == ".flac":
+        return _FLAC_ARGS
+    return ("-c:a", pcm_codec)
+
 
 def process_audio(voice_wav: Path, music_wav: Optional[Path], 
                   output_voice: Path, output_music: Path,
@@ -16,6 +51,11 @@ def process_audio(voice_wav: Path, music_wav: Optional[Path],
     """
     Process audio: two-pass loudnorm on voice, music ducking with sidechain compression.
     
+    The loudness measurement runs on its own; normalization, ducking and the
+    silent fallback track are then rendered by a single ffmpeg invocation.
+    With ``audio.in_process_dsp`` the stems are rendered by ``_dsp_audio_pass``
+    instead (``export_complete_video`` then muxes them with ``mux_audio_video``).
+    
     Args:
         voice_wav: Path to input voice audio (WAV)
         music_wav: Path to background music (optional)
@@ -26,29 +66,29 @@ def process_audio(voice_wav: Path, music_wav: Optional[Path],
         project: Project name for logging
     """
     
-    if not voice_wav.exists():
+    # One stat serves both the existence check and the loudnorm cache key
+    try:
+        voice_stat = voice_wav.stat()
+    except FileNotFoundError:
         raise RenderError(f"Voice audio file not found: {voice_wav}")
     
     try:
-        # Two-pass loudnorm on voice to I=-14, TP=-1.0, LRA=11; resample to 48kHz stereo
-        _normalize_voice_two_pass(voice_wav, output_voice, config)
-
-        # Determine reference duration from normalized voice
-        voice_duration = _get_audio_duration(output_voice)
-
-        # Process music if provided
-        if music_wav and music_wav.exists():
-            # Trim/loop to duration; apply volume preset; sidechain compress
-            _process_music_with_ducking(
-                music_wav,
-                output_voice,
-                output_music,
-                voice_duration,
-                config
-            )
-        else:
-            # Just produce normalized voice, create silent music track
-            _create_silent_audio(output_music, max(voice_duration, 0.1))
+        if not (music_wav and music_wav.exists()):
+            music_wav = None
+
+        if config.get("audio", {}).get("in_process_dsp"):
+            _dsp_audio_pass(voice_wav, music_wav, output_voice, output_music, config)
+            return output_voice, output_music
+
+        # First loudnorm pass, plus the voice duration (resampling preserves it,
+        # so the source voice sets the music length)
+        measure_data, voice_duration = _measure_and_probe_voice(voice_wav, config, voice_stat)
+
+        cmd = build_audio_pipeline_cmd(
+            config, measure_data, voice_wav, music_wav,
+            output_voice, output_music, voice_duration
+        )
+        _run_audio_pipeline(cmd)
         
         # Return paths for normalized voice and ducked music
         return output_voice, output_music
@@ -57,15 +97,173 @@ def process_audio(voice_wav: Path, music_wav: Optional[Path],
         raise RenderError(f"Audio processing failed: {e}")
 
 
-def _normalize_voice_two_pass(voice_wav: Path, output_voice: Path, 
-                             config: Dict[str, Any]) -> None:
+def build_audio_pipeline_cmd(config: Dict[str, Any], measure_data: Dict[str, float],
+                             voice_wav: Path, music_wav: Optional[Path],
+                             output_voice: Path, output_music: Path,
+                             duration: float) -> List[str]:
     """
-    Two-pass loudness normalization to I=-14, TP=-1.0, LRA=11; resample to 48kHz stereo.
+    Build one ffmpeg command that writes both the normalized voice and the music bed.
+    
+    The normalized voice is split inside the filtergraph so the same samples
+    feed the voice output and the sidechain of the ducking compressor. Without
+    music, a silent bed of matching length is generated from ``anullsrc``.
     
     Args:
+        config: Project configuration
+        measure_data: First-pass loudnorm measurements
         voice_wav: Input voice audio
-        output_voice: Output normalized voice
+        music_wav: Input music audio, or None for a silent bed
+        output_voice: Output normalized voice path
+        output_music: Output ducked (or silent) music path
+        duration: Target music duration in seconds
+    
+    Returns:
+        FFmpeg argument list
+    """
+    
+    target_duration = max(duration, 0.1)
+    voice_chain = _voice_loudnorm_filter(config, measure_data)
+    
+    cmd = ["ffmpeg", "-y", "-threads", "0", "-nostats", "-loglevel", "error",
+           "-i", os.fspath(voice_wav)]
+    
+    if music_wav is not None:
+        filter_complex = (
+            f"[0:a]{voice_chain},asplit=2[voice_out][voice];"
+            + _ducking_filter(config, target_duration, "[voice]", "[1:a]", "[music_out]")
+        )
+        cmd += ["-i", os.fspath(music_wav), "-filter_complex", filter_complex]
+    else:
+        filter_complex = (
+            f"[0:a]{voice_chain}[voice_out];"
+            f"anullsrc=channel_layout=stereo:sample_rate=48000[music_out]"
+        )
+        cmd += ["-filter_complex", filter_complex]
+    
+    cmd += [
+        "-map", "[voice_out]", *audio_codec_args(output_voice), os.fspath(output_voice),
+        "-map", "[music_out]", *audio_codec_args(output_music),
+        "-t", f"{target_duration:.3f}", os.fspath(output_music),
+    ]
+    return cmd
+
+
+def build_audio_graph(config: Dict[str, Any], measure_data: Dict[str, float],
+                      duration: float, has_music: bool,
+                      voice_in: str = "[1:a]", music_in: str = "[2:a]",
+                      out_label: str = "[aout]") -> str:
+    """
+    Build a filter_complex that normalizes, ducks, mixes and limits in one graph.
+    
+    This is the whole chain from ``process_audio`` plus the mix from
+    ``mux_audio_video``, so the muxing ffmpeg can consume the raw voice and
+    music directly. Without music a silent bed of ``duration`` is mixed in,
+    matching the level of the two-step path.
+    
+    Args:
+        config: Project configuration
+        measure_data: First-pass loudnorm measurements
+        duration: Voice duration in seconds
+        has_music: Whether ``music_in`` carries a music input
+        voice_in: Filter pad carrying the raw voice
+        music_in: Filter pad carrying the raw music
+        out_label: Output pad label for the mastered mix
+    
+    Returns:
+        Filtergraph string
+    """
+    
+    target_duration = max(duration, 0.1)
+    voice_chain = _voice_loudnorm_filter(config, measure_data)
+    
+    if has_music:
+        graph = (
+            f"{voice_in}{voice_chain},asplit=2[voice_mix][voice_sc];"
+            + _ducking_filter(config, target_duration, "[voice_sc]", music_in, "[music]")
+            + ";"
+        )
+    else:
+        graph = (
+            f"{voice_in}{voice_chain}[voice_mix];"
+            f"anullsrc=channel_layout=stereo:sample_rate=48000,"
+            f"atrim=0:{target_duration:.3f}[music];"
+        )
+    
+    return graph + (
+        f"[voice_mix][music]amix=inputs=2:weights=1 1:duration=longest,"
+        f"alimiter=limit=-1.0{out_label}"
+    )
+
+
+def plan_audio_graph(voice_wav: Path, music_wav: Optional[Path],
+                     config: Dict[str, Any]) -> str:
+    """
+    Measure the voice and return the fused graph from ``build_audio_graph``.
+    
+    Args:
+        voice_wav: Path to input voice audio
+        music_wav: Path to background music (optional)
         config: Project configuration
+    
+    Returns:
+        Filtergraph reading voice from ``[1:a]`` and music from ``[2:a]``
+    """
+    
+    try:
+        voice_stat = voice_wav.stat()
+    except FileNotFoundError:
+        raise RenderError(f"Voice audio file not found: {voice_wav}")
+    
+    measure_data, voice_duration = _measure_and_probe_voice(voice_wav, config, voice_stat)
+    return build_audio_graph(config, measure_data, voice_duration, music_wav is not None)
+
+
+def _measure_and_probe_voice(voice_wav: Path, config: Dict[str, Any],
+                             stat: os.stat_result) -> Tuple[Dict[str, float], float]:
+    """
+    Run the loudnorm measurement and the duration probe side by side.
+    
+    The two are independent ffmpeg/ffprobe processes, so the probe hides
+    behind the (much longer) measurement pass instead of following it.
+    
+    Args:
+        voice_wav: Input voice audio
+        config: Project configuration
+        stat: ``os.stat`` result for ``voice_wav``
+    
+    Returns:
+        (loudnorm measurements, voice duration in seconds)
+    """
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        duration_future = executor.submit(_get_audio_duration, voice_wav)
+        measure_data = _measure_voice_loudness(voice_wav, config, stat)
+        return measure_data, duration_future.result()
+
+
+def _run_audio_pipeline(cmd: List[str]) -> None:
+    """Run a fused audio pipeline command."""
+    
+    try:
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.PIPE, text=True)
+    except subprocess.CalledProcessError as e:
+        stderr_tail = (e.stderr or "")[-800:]
+        raise RenderError(f"Audio pipeline failed\n{stderr_tail}")
+
+
+def _measure_voice_loudness(voice_wav: Path, config: Dict[str, Any],
+                            stat: Optional[os.stat_result] = None) -> Dict[str, float]:
+    """
+    Run the loudnorm measurement pass over the voice track.
+    
+    Args:
+        voice_wav: Input voice audio
+        config: Project configuration
+        stat: Pre-fetched ``os.stat`` result for ``voice_wav`` (optional)
+    
+    Returns:
+        Parsed measurement data
     """
     
     audio_config = config.get("audio", {})
@@ -73,38 +271,144 @@ def _normalize_voice_two_pass(voice_wav: Path, output_voice: Path,
     target_tp = audio_config.get("target_tp", -1.0)
     target_lra = audio_config.get("target_lra", 11.0)
     
-    # First pass: measure loudness
+    if stat is None:
+        stat = voice_wav.stat()
+    cache_key = [stat.st_size, stat.st_mtime_ns, target_i, target_tp, target_lra]
+    cache_path = voice_wav.with_suffix(".loudnorm.json")
+    cached = _load_loudnorm_cache(cache_path, cache_key)
+    if cached is not None:
+        return cached
+    
     measure_cmd = [
-        "ffmpeg", "-y", "-i", str(voice_wav),
+        "ffmpeg", "-y", "-threads", "0", "-i", os.fspath(voice_wav),
         "-af", f"loudnorm=I={target_i}:TP={target_tp}:LRA={target_lra}:print_format=json",
         "-f", "null", "-"
     ]
     
     try:
         result = subprocess.run(measure_cmd, capture_output=True, text=True, check=True)
-        
-        # Parse measurement data from stderr
-        measure_data = _parse_loudnorm_json(result.stderr)
+    except subprocess.CalledProcessError as e:
+        stderr_tail = (e.stderr or "")[-800:]
+        raise RenderError(f"Voice loudness measurement failed\n{stderr_tail}")
+    
+    # Parse measurement data from stderr
+    measure_data = _parse_loudnorm_json(result.stderr)
+    _save_loudnorm_cache(cache_path, cache_key, measure_data)
+    return measure_data
+
+
+def _load_loudnorm_cache(cache_path: Path, cache_key: List[Any]) -> Optional[Dict[str, float]]:
+    """Return cached loudnorm measurements if they match ``cache_key``."""
+    
+    try:
+        with open(cache_path, "rb") as f:
+            cached = _json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+    
+    if not isinstance(cached, dict) or cached.get("key") != cache_key:
+        return None
+    
+    data = cached.get("measurements")
+    if not isinstance(data, dict):
+        return None
+    
+    try:
+        return {name: float(data[name]) for name in _LOUDNORM_FIELDS}
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _save_loudnorm_cache(cache_path: Path, cache_key: List[Any],
+                         measure_data: Dict[str, float]) -> None:
+    """Persist loudnorm measurements; a read-only source directory is not an error."""
+    
+    try:
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump({"key": cache_key, "measurements": measure_data}, f)
+    except OSError:
+        pass
+
+
+def _voice_loudnorm_filter(config: Dict[str, Any], measure_data: Dict[str, float]) -> str:
+    """
+    Build the second-pass loudnorm filter chain, resampled to 48kHz stereo.
+    
+    Voice that already measures within ``audio.loudnorm_tolerance_lu`` of the
+    target, and whose true peak stays under the ceiling after the gain, only
+    gets a static gain, so the second pass skips loudnorm's look-ahead
+    processing entirely.
+    """
+    
+    audio_config = config.get("audio", {})
+    target_i = audio_config.get("target_lufs", -14.0)
+    target_tp = audio_config.get("target_tp", -1.0)
+    target_lra = audio_config.get("target_lra", 11.0)
+    tolerance = audio_config.get("loudnorm_tolerance_lu", 0.5)
+    
+    gain_db = target_i - measure_data["input_i"]
+    if abs(gain_db) < tolerance and measure_data["input_tp"] + gain_db < target_tp:
+        return (
+            f"volume={gain_db:.2f}dB,"
+            f"aresample=48000,"
+            f"aformat=channel_layouts=stereo"
+        )
+    
+    return (
+        f"loudnorm=I={target_i}:TP={target_tp}:LRA={target_lra}:"
+        f"measured_I={measure_data['input_i']}:"
+        f"measured_LRA={measure_data['input_lra']}:"
+        f"measured_TP={measure_data['input_tp']}:"
+        f"measured_thresh={measure_data['input_thresh']}:"
+        f"offset={measure_data['target_offset']}:"
+        f"linear=true,"
+        f"aresample=48000,"
+        f"aformat=channel_layouts=stereo"
+    )
+
+
+def two_pass_loudnorm_filter(voice_wav: Path, config: Dict[str, Any]) -> str:
+    """
+    Measure ``voice_wav`` (cached per file) and return the second-pass filter.
+    
+    Args:
+        voice_wav: Input voice audio
+        config: Configuration with ``audio.target_lufs``/``target_tp``/``target_lra``
+    
+    Returns:
+        Filter chain for ``-af``, resampled to 48kHz stereo
+    """
+    
+    return _voice_loudnorm_filter(config, _measure_voice_loudness(voice_wav, config))
+
+
+def _normalize_voice_two_pass(voice_wav: Path, output_voice: Path, 
+                             config: Dict[str, Any]) -> None:
+    """
+    Two-pass loudness normalization to I=-14, TP=-1.0, LRA=11; resample to 48kHz stereo.
+    
+    Args:
+        voice_wav: Input voice audio
+        output_voice: Output normalized voice
+        config: Project configuration
+    """
+    
+    try:
+        # First pass: measure loudness
+        measure_data = _measure_voice_loudness(voice_wav, config)
         
         # Second pass: apply normalization with measurements
         apply_cmd = [
-            "ffmpeg", "-y", "-i", str(voice_wav),
-            "-af", (
-                f"loudnorm=I={target_i}:TP={target_tp}:LRA={target_lra}:"
-                f"measured_I={measure_data['input_i']}:"
-                f"measured_LRA={measure_data['input_lra']}:"
-                f"measured_TP={measure_data['input_tp']}:"
-                f"measured_thresh={measure_data['input_thresh']}:"
-                f"offset={measure_data['target_offset']}:"
-                f"linear=true,"
-                f"aresample=48000,"
-                f"aformat=channel_layouts=stereo"
-            ),
-            "-c:a", "pcm_s24le",
-            str(output_voice)
+            "ffmpeg", "-y", "-threads", "0", "-nostats", "-loglevel", "error",
+            "-i", os.fspath(voice_wav),
+            "-af", _voice_loudnorm_filter(config, measure_data),
+            *audio_codec_args(output_voice),
+            os.fspath(output_voice)
         ]
         
-        result = subprocess.run(apply_cmd, check=True, capture_output=True, text=True)
+        # Only the measure pass needs stderr in full; keep this one quiet
+        result = subprocess.run(apply_cmd, check=True, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.PIPE, text=True)
         
     except subprocess.CalledProcessError as e:
         stderr_tail = (e.stderr or "")[-800:]
@@ -134,7 +438,7 @@ def _parse_loudnorm_json(stderr: str) -> Dict[str, float]:
     json_str = stderr[json_start:json_end]
     
     try:
-        data = json.loads(json_str)
+        data = _json.loads(json_str)
         return {
             "input_i": float(data["input_i"]),
             "input_lra": float(data["input_lra"]),
@@ -159,6 +463,49 @@ def _process_music_with_ducking(music_wav: Path, voice_ref_wav: Path, output_mus
         config: Project configuration
     """
     
+    # Guard against invalid duration values
+    target_duration = max(duration, 0.1)
+
+    # Create filter_complex for music processing
+    filter_complex = _ducking_filter(config, target_duration, "[0:a]", "[1:a]", "[out]")
+    
+    cmd = [
+        "ffmpeg", "-y", "-threads", "0", "-nostats", "-loglevel", "error",
+        "-i", os.fspath(voice_ref_wav),  # Input 0: voice (for sidechain)
+        "-i", os.fspath(music_wav),  # Input 1: music
+        "-filter_complex", filter_complex,
+        "-map", "[out]",
+        *audio_codec_args(output_music),
+        "-t", f"{target_duration:.3f}",
+        os.fspath(output_music)
+    ]
+    
+    try:
+        result = subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.PIPE, text=True)
+    except subprocess.CalledProcessError as e:
+        stderr_tail = (e.stderr or "")[-800:]
+        raise RenderError(f"Music processing failed\n{stderr_tail}")
+    except Exception as e:
+        raise RenderError(f"Music processing error: {e}")
+
+
+def _ducking_filter(config: Dict[str, Any], duration: float,
+                    voice_in: str, music_in: str, out_label: str) -> str:
+    """
+    Build the filter_complex fragment that loops, trims and ducks music under voice.
+    
+    Args:
+        config: Project configuration
+        duration: Target music duration in seconds
+        voice_in: Filter pad carrying the sidechain voice
+        music_in: Filter pad carrying the music
+        out_label: Output pad label for the ducked music
+    
+    Returns:
+        Filtergraph string
+    """
+    
     audio_config = config.get("audio", {})
     ducking_config = audio_config.get("ducking", {})
     
@@ -169,41 +516,235 @@ def _process_music_with_ducking(music_wav: Path, voice_ref_wav: Path, output_mus
     attack_ms = ducking_config.get("attack_ms", 50.0)  # Attack time
     release_ms = ducking_config.get("release_ms", 300.0)  # Release time
     
-    # Guard against invalid duration values
-    target_duration = max(duration, 0.1)
-
-    # Create filter_complex for music processing
-    filter_complex = (
-        f"[0:a]aformat=channel_layouts=stereo,aresample=48000[voice];"
-        f"[1:a]aformat=channel_layouts=stereo,aresample=48000,"
+    return (
+        f"{voice_in}aformat=channel_layouts=stereo,aresample=48000[sc_voice];"
+        f"{music_in}aformat=channel_layouts=stereo,aresample=48000,"
         f"volume={music_db}dB,"
         f"aloop=loop=-1:size=0,"
-        f"atrim=0:{target_duration:.3f},"
+        f"atrim=0:{duration:.3f},"
         f"asetpts=N/SR/TB[music_trim];"
-        f"[music_trim][voice]sidechaincompress="
+        f"[music_trim][sc_voice]sidechaincompress="
         f"threshold={threshold}dB:ratio={ratio}:"
         f"attack={attack_ms}:release={release_ms}:makeup=0[ducked];"  # Sidechain compression
-        f"[ducked]alimiter=limit=-1dB,aresample=48000,aformat=channel_layouts=stereo[out]"
+        f"[ducked]alimiter=limit=-1dB,aresample=48000,aformat=channel_layouts=stereo{out_label}"
     )
+
+
+def _dsp_audio_pass(voice_wav: Path, music_wav: Optional[Path],
+                    output_voice: Path, output_music: Path,
+                    config: Dict[str, Any]) -> None:
+    """
+    Normalize, duck and limit in-process on float32 samples.
+    
+    Replaces the loudnorm/sidechaincompress/alimiter graph: ffmpeg only
+    decodes to and encodes from raw float32 pipes, with no measurement pass.
+    Loudness is a gated BS.1770 estimate without K-weighting, so levels can
+    differ from loudnorm by a fraction of an LU on bass-heavy material.
+    
+    Args:
+        voice_wav: Input voice audio
+        music_wav: Input music audio, or None for a silent bed
+        output_voice: Output normalized voice path
+        output_music: Output ducked (or silent) music path
+        config: Project configuration
+    """
+    
+    audio_config = config.get("audio", {})
+    ducking_config = audio_config.get("ducking", {})
+    target_i = audio_config.get("target_lufs", -14.0)
+    target_tp = audio_config.get("target_tp", -1.0)
+    
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        music_future = None
+        if music_wav is not None:
+            # Loop to the voice length; the probe is far cheaper than a decode
+            duration = _get_audio_duration(voice_wav)
+            music_future = executor.submit(_decode_f32, music_wav, duration, True)
+        voice = _decode_f32(voice_wav)
+        
+        loudness = _gated_loudness(voice)
+        if loudness is not None:
+            voice = voice * np.float32(10 ** ((target_i - loudness) / 20))
+        voice = _peak_limit(voice, target_tp)
+        voice_future = executor.submit(_encode_f32, voice, output_voice)
+        
+        if music_future is None:
+            music = np.zeros_like(voice)
+        else:
+            music = _fit_length(music_future.result(), len(voice))
+            music *= np.float32(10 ** (audio_config.get("music_db", -28.0) / 20))
+            
+            threshold = ducking_config.get("threshold", -20.0)
+            # Same units as sidechaincompress: linear amplitude, or dB when <= 0
+            if threshold <= 0:
+                threshold = 10 ** (threshold / 20)
+            envelope = _smooth_envelope(
+                _block_rms(voice),
+                ducking_config.get("attack_ms", 50.0),
+                ducking_config.get("release_ms", 300.0),
+            )
+            ratio = ducking_config.get("ratio", 8.0)
+            gains = np.ones_like(envelope)
+            loud = envelope > threshold
+            gains[loud] = (envelope[loud] / threshold) ** (1.0 / ratio - 1.0)
+            music = _peak_limit(_apply_block_gains(music, gains), -1.0)
+        
+        _encode_f32(music, output_music)
+        voice_future.result()
+
+
+def _decode_f32(audio_path: Path, duration: Optional[float] = None,
+                loop: bool = False) -> np.ndarray:
+    """Decode audio to a (samples, 2) float32 array at 48kHz."""
+    
+    cmd = ["ffmpeg", "-nostdin", "-nostats", "-loglevel", "error"]
+    if loop:
+        cmd += ["-stream_loop", "-1"]
+    cmd += ["-i", os.fspath(audio_path)]
+    if duration is not None:
+        cmd += ["-t", f"{duration:.3f}"]
+    cmd += ["-f", "f32le", "-ac", "2", "-ar", str(_DSP_RATE), "pipe:1"]
+    
+    try:
+        result = subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except subprocess.CalledProcessError as e:
+        stderr_tail = (e.stderr or b"").decode(errors="replace")[-800:]
+        raise RenderError(f"Audio decode failed\n{stderr_tail}")
+    
+    usable = len(result.stdout) - len(result.stdout) % 8
+    return np.frombuffer(result.stdout[:usable], dtype=np.float32).reshape(-1, 2)
+
+
+def _encode_f32(samples: np.ndarray, output_path: Path) -> None:
+    """Encode a (samples, 2) float32 array with the intermediate codec for ``output_path``."""
     
     cmd = [
-        "ffmpeg", "-y",
-        "-i", str(voice_ref_wav),  # Input 0: voice (for sidechain)
-        "-i", str(music_wav),  # Input 1: music
-        "-filter_complex", filter_complex,
-        "-map", "[out]",
-        "-c:a", "pcm_s24le",
-        "-t", f"{target_duration:.3f}",
-        str(output_music)
+        "ffmpeg", "-y", "-nostats", "-loglevel", "error",
+        "-f", "f32le", "-ac", "2", "-ar", str(_DSP_RATE), "-i", "pipe:0",
+        *audio_codec_args(output_path), os.fspath(output_path)
     ]
+    # A flat byte view goes to the pipe without an intermediate bytes copy
+    data = np.ascontiguousarray(samples, dtype=np.float32).view(np.uint8).reshape(-1)
     
     try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        subprocess.run(cmd, input=data, check=True, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.PIPE)
     except subprocess.CalledProcessError as e:
-        stderr_tail = (e.stderr or "")[-800:]
-        raise RenderError(f"Music processing failed\n{stderr_tail}")
-    except Exception as e:
-        raise RenderError(f"Music processing error: {e}")
+        stderr_tail = (e.stderr or b"").decode(errors="replace")[-800:]
+        raise RenderError(f"Audio encode failed\n{stderr_tail}")
+
+
+def _fit_length(samples: np.ndarray, length: int) -> np.ndarray:
+    """Trim or zero-pad ``samples`` to ``length`` frames (always a writable copy)."""
+    
+    fitted = np.zeros((length, samples.shape[1]), dtype=np.float32)
+    count = min(length, len(samples))
+    fitted[:count] = samples[:count]
+    return fitted
+
+
+def _gated_loudness(samples: np.ndarray) -> Optional[float]:
+    """
+    Integrated loudness with BS.1770 gating (absolute -70, relative -10 LU).
+    
+    Blocks are 400 ms with 75% overlap, built from 100 ms mean squares.
+    
+    Returns:
+        Loudness in LUFS, or None for silence
+    """
+    
+    step = _DSP_RATE // 10
+    count = len(samples) // step
+    if count < 4:
+        return None
+    
+    quarter = np.square(samples[:count * step], dtype=np.float64)
+    quarter = quarter.reshape(count, step, -1).mean(axis=1).sum(axis=1)
+    power = np.convolve(quarter, np.full(4, 0.25), mode="valid")
+    
+    with np.errstate(divide="ignore"):
+        block_loudness = -0.691 + 10 * np.log10(power)
+    gated = power[block_loudness > -70.0]
+    if gated.size == 0:
+        return None
+    
+    relative = -0.691 + 10 * np.log10(gated.mean()) - 10.0
+    gated = gated[-0.691 + 10 * np.log10(gated) > relative]
+    return float(-0.691 + 10 * np.log10(gated.mean()))
+
+
+def _block_rms(samples: np.ndarray) -> np.ndarray:
+    """RMS level of each ``_DSP_BLOCK`` block, both channels together."""
+    
+    count = -(-len(samples) // _DSP_BLOCK)
+    padded = _fit_length(samples, count * _DSP_BLOCK)
+    return np.sqrt(np.square(padded).reshape(count, -1).mean(axis=1))
+
+
+def _smooth_envelope(levels: np.ndarray, attack_ms: float, release_ms: float) -> np.ndarray:
+    """One-pole attack/release follower over block levels."""
+    
+    block_ms = 1000.0 * _DSP_BLOCK / _DSP_RATE
+    attack = float(np.exp(-block_ms / max(attack_ms, 1e-3)))
+    release = float(np.exp(-block_ms / max(release_ms, 1e-3)))
+    
+    # The recursion only runs once per block (100 per second), so plain Python is enough
+    envelope = np.empty(len(levels), dtype=np.float32)
+    current = 0.0
+    for i, level in enumerate(levels.tolist()):
+        coef = attack if level > current else release
+        current = coef * current + (1.0 - coef) * level
+        envelope[i] = current
+    return envelope
+
+
+def _apply_block_gains(samples: np.ndarray, gains: np.ndarray) -> np.ndarray:
+    """Apply per-block gains, ramping linearly from each block's gain to the next."""
+    
+    count = len(gains)
+    gains = gains.astype(np.float32)
+    following = np.append(gains[1:], gains[-1:])
+    ramp = np.arange(_DSP_BLOCK, dtype=np.float32) / _DSP_BLOCK
+    curve = (gains[:, None] + (following - gains)[:, None] * ramp).reshape(-1)
+    
+    length = min(len(samples), count * _DSP_BLOCK)
+    out = samples[:length] * curve[:length, None]
+    if length < len(samples):
+        out = np.concatenate([out, samples[length:] * gains[-1]])
+    return out
+
+
+def _peak_limit(samples: np.ndarray, ceiling_db: float, release_ms: float = 50.0) -> np.ndarray:
+    """
+    Sample-peak limiter with one block of look-ahead.
+    
+    Each block's gain also covers its neighbours, so the ramp into and out of a
+    block never exceeds what that block needs; release is smoothed per block.
+    """
+    
+    if len(samples) == 0:
+        return samples
+    
+    ceiling = 10 ** (ceiling_db / 20)
+    count = -(-len(samples) // _DSP_BLOCK)
+    peaks = np.abs(_fit_length(samples, count * _DSP_BLOCK)).reshape(count, -1).max(axis=1)
+    if peaks.max() <= ceiling:
+        return samples
+    
+    raw = np.minimum(1.0, ceiling / np.maximum(peaks, 1e-9))
+    needed = raw.copy()
+    needed[:-1] = np.minimum(needed[:-1], raw[1:])
+    needed[1:] = np.minimum(needed[1:], raw[:-1])
+    
+    release = float(np.exp(-1000.0 * _DSP_BLOCK / _DSP_RATE / release_ms))
+    gains = np.empty(count, dtype=np.float32)
+    current = 1.0
+    for i, need in enumerate(needed.tolist()):
+        current = min(need, release * current + (1.0 - release))
+        gains[i] = current
+    
+    limited = _apply_block_gains(samples, gains)
+    return np.clip(limited, -ceiling, ceiling, out=limited)
 
 
 def _create_silent_audio(output_path: Path, duration: float) -> None:
@@ -216,15 +757,16 @@ def _create_silent_audio(output_path: Path, duration: float) -> None:
     """
     
     cmd = [
-        "ffmpeg", "-y", "-f", "lavfi",
+        "ffmpeg", "-y", "-threads", "0", "-nostats", "-loglevel", "error", "-f", "lavfi",
         "-i", "anullsrc=channel_layout=stereo:sample_rate=48000",
         "-t", str(duration),
-        "-c:a", "pcm_s24le",
-        str(output_path)
+        *audio_codec_args(output_path),
+        os.fspath(output_path)
     ]
     
     try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        result = subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.PIPE, text=True)
     except subprocess.CalledProcessError as e:
         stderr_tail = (e.stderr or "")[-800:]
         raise RenderError(f"Failed to create silent audio\n{stderr_tail}")
@@ -245,7 +787,7 @@ def _get_audio_duration(audio_path: Path) -> float:
     
     cmd = [
         "ffprobe", "-v", "quiet", "-show_entries", "format=duration",
-        "-of", "csv=p=0", str(audio_path)
+        "-of", "csv=p=0", os.fspath(audio_path)
     ]
     
     try:
@@ -275,7 +817,7 @@ def measure_lufs(audio_path: Path, logger=None, project: str = "") -> Dict[str,
     """
     
     cmd = [
-        "ffmpeg", "-y", "-i", str(audio_path),
+        "ffmpeg", "-y", "-threads", "0", "-i", os.fspath(audio_path),
         "-af", "loudnorm=I=-23:TP=-2:LRA=7:print_format=json",
         "-f", "null", "-"
     ]
@@ -325,20 +867,21 @@ def mix_voice_and_music(voice_wav: Path, music_wav: Path, output_wav: Path,
     """
     
     cmd = [
-        "ffmpeg", "-y",
-        "-i", str(voice_wav),
-        "-i", str(music_wav),
+        "ffmpeg", "-y", "-threads", "0", "-nostats", "-loglevel", "error",
+        "-i", os.fspath(voice_wav),
+        "-i", os.fspath(music_wav),
         "-filter_complex", 
         f"[0:a]volume={voice_level}dB[voice];"
         f"[1:a]volume={music_level}dB[music];"
         f"[voice][music]amix=inputs=2:weights=1 1:duration=longest[out]",
         "-map", "[out]",
-        "-c:a", "pcm_s24le",
-        str(output_wav)
+        *audio_codec_args(output_wav, "pcm_s24le"),
+        os.fspath(output_wav)
     ]
     
     try:
-        subprocess.run(cmd, check=True, capture_output=True, text=True)
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.PIPE, text=True)
     except subprocess.CalledProcessError as e:
         stderr_tail = (e.stderr or "")[-800:]
         raise RenderError(f"Audio mixing failed\n{stderr_tail}")
@@ -358,14 +901,16 @@ def apply_final_limiter(audio_path: Path, output_path: Path,
     """
     
     cmd = [
-        "ffmpeg", "-y", "-i", str(audio_path),
+        "ffmpeg", "-y", "-threads", "0", "-nostats", "-loglevel", "error",
+        "-i", os.fspath(audio_path),
         "-af", f"alimiter=limit={limit_db}dB:level=true:mode=compress",
-        "-c:a", "pcm_s24le",
-        str(output_path)
+        *audio_codec_args(output_path, "pcm_s24le"),
+        os.fspath(output_path)
     ]
     
     try:
-        subprocess.run(cmd, check=True, capture_output=True, text=True)
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.PIPE, text=True)
     except subprocess.CalledProcessError as e:
         stderr_tail = (e.stderr or "")[-800:]
         raise RenderError(f"Final limiting failed\n{stderr_tail}")
@@ -393,14 +938,16 @@ def resample_audio(input_path: Path, output_path: Path,
         raise RenderError(f"Unsupported channel count: {channels}")
     
     cmd = [
-        "ffmpeg", "-y", "-i", str(input_path),
+        "ffmpeg", "-y", "-threads", "0", "-nostats", "-loglevel", "error",
+        "-i", os.fspath(input_path),
         "-af", f"aresample={sample_rate},aformat=channel_layouts={channel_layout}",
-        "-c:a", "pcm_s24le",
-        str(output_path)
+        *audio_codec_args(output_path, "pcm_s24le"),
+        os.fspath(output_path)
     ]
     
     try:
-        subprocess.run(cmd, check=True, capture_output=True, text=True)
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.PIPE, text=True)
     except subprocess.CalledProcessError as e:
         stderr_tail = (e.stderr or "")[-800:]
         raise RenderError(f"Audio resampling failed\n{stderr_tail}")
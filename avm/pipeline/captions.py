@@ -1,54 +1,136 @@
 """Caption handling and SRT processing."""
 
+import bisect
+import mmap
+import os
+import re
+import shutil
 import subprocess
+import sys
+from datetime import timedelta as _td
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple
 
+import numpy as np
 import srt
 
+try:
+    from PIL import ImageFont
+    PILLOW_AVAILABLE = True
+except ImportError:
+    PILLOW_AVAILABLE = False
+
 from .errors import RenderError
 
+_SRT_BLOCK = re.compile(
+    rb"(\d+)\n(\d+):(\d\d):(\d\d),(\d\d\d)\s-->\s(\d+):(\d\d):(\d\d),(\d\d\d)\n(.*?)(?=\n\n|\Z)",
+    re.DOTALL,
+)
+_SRT_MMAP_THRESHOLD = 8 * 1024 * 1024
+
+# Static ffmpeg argument runs shared by the caption commands
+_FFMPEG_HEAD = ("ffmpeg", "-y", "-threads", "0", "-nostats", "-loglevel", "error")
+_BURN_HEAD = (*_FFMPEG_HEAD, "-i")
+_BURN_MAP = ("-map", "0:v:0", "-map", "0:a:0?")
+_BURN_TAIL = ("-c:a", "copy", "-movflags", "+faststart")
+_X264_ARGS = ("-c:v", "libx264")
+
+# Hardware H.264 encoders in preference order, with their rate-control flags
+_HW_H264_ARGS = {
+    "h264_nvenc": ("-c:v", "h264_nvenc", "-preset", "p4", "-tune", "hq", "-rc", "vbr"),
+    "h264_videotoolbox": ("-c:v", "h264_videotoolbox"),
+    "h264_qsv": ("-c:v", "h264_qsv"),
+}
+_SOFT_SUB_TAIL = (
+    "-c", "copy",
+    "-c:s", "mov_text",
+    "-metadata:s:s:0", "language=eng",
+    "-movflags", "+faststart",
+)
+
+# Below this many cues NumPy setup costs more than a bisect scan per cue
+_NUMPY_TIMING_MIN = 64
+
+# Per-glyph advance widths keyed on (font_path, font_size)
+_ADVANCE: Dict[Tuple[str, int], Dict[str, float]] = {}
+
+
+def _iter_srt_blocks(data) -> Iterator[Dict[str, Any]]:
+    """Parse well-formed SRT cues straight into caption dicts."""
+
+    for match in _SRT_BLOCK.finditer(data):
+        idx, h1, m1, s1, ms1, h2, m2, s2, ms2, content = match.groups()
+        yield {
+            "index": int(idx),
+            "start": int(h1) * 3600 + int(m1) * 60 + int(s1) + int(ms1) / 1000,
+            "end": int(h2) * 3600 + int(m2) * 60 + int(s2) + int(ms2) / 1000,
+            "content": content.decode("utf-8").strip(),
+        }
+
+
+def iter_captions_srt(srt_path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield caption dicts from an SRT file without building the full list."""
 
-def load_captions_srt(srt_path: Path) -> List[Dict[str, Any]]:
     if not srt_path.exists():
         raise RenderError(f"SRT file not found: {srt_path}")
 
+    matched = False
     try:
-        with open(srt_path, "r", encoding="utf-8") as handle:
-            content = handle.read()
+        with open(srt_path, "rb") as handle:
+            size = os.fstat(handle.fileno()).st_size
+            if size >= _SRT_MMAP_THRESHOLD:
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    for caption in _iter_srt_blocks(data):
+                        matched = True
+                        yield caption
+            else:
+                for caption in _iter_srt_blocks(handle.read()):
+                    matched = True
+                    yield caption
     except OSError as exc:
         raise RenderError(f"Failed to read SRT file: {exc}") from exc
+    except UnicodeDecodeError as exc:
+        raise RenderError(f"Failed to parse SRT file: {exc}") from exc
+
+    if matched:
+        return
+
+    # Fall back to python-srt for anything the fast path does not recognise
+    # (CRLF line endings, malformed spacing, ...).
+    try:
+        content = srt_path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as exc:
+        raise RenderError(f"Failed to read SRT file: {exc}") from exc
 
-    captions: List[Dict[str, Any]] = []
     try:
         for entry in srt.parse(content):
-            captions.append(
-                {
-                    "index": entry.index,
-                    "start": entry.start.total_seconds(),
-                    "end": entry.end.total_seconds(),
-                    "content": entry.content.strip(),
-                }
-            )
+            yield {
+                "index": entry.index,
+                "start": entry.start.total_seconds(),
+                "end": entry.end.total_seconds(),
+                "content": entry.content.strip(),
+            }
     except Exception as exc:
         raise RenderError(f"Failed to parse SRT file: {exc}") from exc
 
-    return captions
+
+def load_captions_srt(srt_path: Path) -> List[Dict[str, Any]]:
+    return list(iter_captions_srt(srt_path))
 
 
 def save_captions_srt(captions: List[Dict[str, Any]], srt_path: Path) -> None:
     """Persist caption entries to disk using python-srt."""
 
-    subtitles: List[srt.Subtitle] = []
-    for entry in captions:
-        subtitles.append(
-            srt.Subtitle(
-                index=entry.get("index", len(subtitles) + 1),
-                start=srt.timedelta(seconds=float(entry["start"])),
-                end=srt.timedelta(seconds=float(entry["end"])),
-                content=entry.get("content", "") or "",
-            )
+    subtitles = (
+        srt.Subtitle(
+            index=entry.get("index", i),
+            start=_td(seconds=float(entry["start"])),
+            end=_td(seconds=float(entry["end"])),
+            content=entry.get("content", "") or "",
         )
+        for i, entry in enumerate(captions, 1)
+    )
 
     try:
         srt_text = srt.compose(subtitles)
@@ -57,69 +139,241 @@ def save_captions_srt(captions: List[Dict[str, Any]], srt_path: Path) -> None:
         raise RenderError(f"Failed to save SRT file: {exc}") from exc
 
 
-def wrap_captions_by_pixel_width(text: str, font_size: int, max_width_px: int) -> List[str]:
-    if not text:
-        return [""]
+def _seconds_to_srt_time(seconds: float) -> str:
+    """Format seconds as an SRT timestamp, clamping negatives to zero."""
+
+    return _ms_to_srt_time(max(int(seconds * 1000), 0))
+
+
+@lru_cache(maxsize=4096)
+def _ms_to_srt_time(ms_total: int) -> str:
+    # Adjacent cues share boundaries, so most end stamps repeat a start stamp
+    s, ms = divmod(ms_total, 1000)
+    m, s = divmod(s, 60)
+    h, m = divmod(m, 60)
+    return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
 
+
+def adjust_caption_timing(
+    captions: List[Dict[str, Any]],
+    slide_transitions: List[float],
+    margin: float = 0.5,
+) -> List[Dict[str, Any]]:
+    """Pull caption edges at least ``margin`` seconds away from slide transitions.
+
+    A transition in the second half of a cue trims its end; one in the first
+    half delays its start. Adjustments that would leave an empty cue are
+    skipped. Small inputs use a bisect scan per cue; larger ones apply each
+    transition to all cues at once with NumPy masks.
+    """
+
+    if not captions:
+        return []
+
+    if len(captions) < _NUMPY_TIMING_MIN:
+        return _adjust_caption_timing_bisect(captions, sorted(slide_transitions), margin)
+
+    starts = np.fromiter((float(c["start"]) for c in captions), float, count=len(captions))
+    ends = np.fromiter((float(c["end"]) for c in captions), float, count=len(captions))
+
+    # Transitions outside the span of all cues can never overlap one
+    tr_sorted = np.sort(np.asarray(slide_transitions, dtype=float))
+    lo = np.searchsorted(tr_sorted, starts.min() - margin, side="left")
+    hi = np.searchsorted(tr_sorted, ends.max() + margin, side="left")
+
+    for t in tr_sorted[lo:hi]:
+        overlap = (starts - margin <= t) & (t < ends + margin)
+        if not overlap.any():
+            continue
+        late = overlap & (t >= (starts + ends) / 2)
+        early = overlap & ~late
+
+        new_ends = np.minimum(ends, t - margin)
+        trim = late & (new_ends > starts)
+        ends[trim] = new_ends[trim]
+
+        new_starts = np.maximum(starts, t + margin)
+        delay = early & (new_starts < ends)
+        starts[delay] = new_starts[delay]
+
+    adjusted = [
+        {**entry, "start": float(start), "end": float(end)}
+        for entry, start, end in zip(captions, starts, ends)
+    ]
+
+    return adjusted
+
+
+@lru_cache(maxsize=64)
+def _max_chars(font_size: int, max_width_px: int) -> int:
     approx_char_width = max(font_size * 0.6, 1)
-    max_chars = max(int(max_width_px / approx_char_width), 1)
+    return max(int(max_width_px / approx_char_width), 1)
+
+
+@lru_cache(maxsize=16)
+def _load_font(font_path: str, font_size: int):
+    return ImageFont.truetype(font_path, font_size)
 
-    words = text.strip().split()
-    if not words:
-        return [""]
 
+def _text_width(font_path: str, font_size: int, text: str) -> float:
+    """Sum cached per-character advances; each glyph is measured once per font."""
+
+    advances = _ADVANCE.setdefault((font_path, font_size), {})
+    total = 0.0
+    for ch in text:
+        width = advances.get(ch)
+        if width is None:
+            width = advances[ch] = _load_font(font_path, font_size).getlength(ch)
+        total += width
+    return total
+
+
+def _wrap_measured(text: str, font_path: str, font_size: int, max_width_px: int) -> List[str]:
+    """Two-line greedy wrap using real glyph advances."""
+
+    def width(s: str) -> float:
+        return _text_width(font_path, font_size, s)
+
+    space = width(" ")
+    words = text.split()
     lines: List[str] = []
     current = ""
-
-    for word in words:
-        trial = f"{current} {word}".strip()
-        if len(trial) <= max_chars:
-            current = trial
+    current_w = 0.0
+    i = 0
+    while i < len(words) and len(lines) < 2:
+        word = words[i]
+        word_w = width(word)
+        if not current:
+            if word_w <= max_width_px:
+                current, current_w = word, word_w
+            else:
+                # Hard-split a word wider than a line
+                cut = 1
+                while cut < len(word) and width(word[: cut + 1]) <= max_width_px:
+                    cut += 1
+                lines.append(word[:cut])
+                words[i] = word[cut:]
+                continue
+        elif current_w + space + word_w <= max_width_px:
+            current += " " + word
+            current_w += space + word_w
         else:
-            if current:
-                lines.append(current)
-                current = word
+            lines.append(current)
+            current, current_w = "", 0.0
+            continue
+        i += 1
+
+    if current and len(lines) < 2:
+        lines.append(current)
+        current = ""
+
+    if current or i < len(words):
+        # Text overflows two lines: mark the cut on the second line
+        ellipsis = "..."
+        while len(ellipsis) > 1 and width(ellipsis) > max_width_px:
+            ellipsis = ellipsis[:-1]
+        last = lines[-1]
+        while last and width(last + ellipsis) > max_width_px:
+            last = last[:-1]
+        lines[-1] = last.rstrip() + ellipsis
+
+    return lines or [""]
+
+
+def _adjust_caption_timing_bisect(
+    captions: List[Dict[str, Any]], tr_sorted: List[float], margin: float
+) -> List[Dict[str, Any]]:
+    adjusted: List[Dict[str, Any]] = []
+    for entry in captions:
+        start = float(entry["start"])
+        end = float(entry["end"])
+
+        lo = bisect.bisect_left(tr_sorted, start - margin)
+        hi = bisect.bisect_left(tr_sorted, end + margin)
+        for t in tr_sorted[lo:hi] if hi > lo else ():
+            if t >= end + margin:
+                break  # end was trimmed by an earlier transition
+            if t >= (start + end) / 2:
+                new_end = min(end, t - margin)
+                if new_end > start:
+                    end = new_end
             else:
-                lines.append(word[:max_chars])
-                current = word[max_chars:]
+                new_start = max(start, t + margin)
+                if new_start < end:
+                    start = new_start
 
-        if len(lines) == 2:
-            break
+        adjusted.append({**entry, "start": start, "end": end})
 
-    if len(lines) < 2 and current:
-        lines.append(current)
+    return adjusted
 
-    if len(lines) > 2:
-        lines = lines[:2]
 
-    if len(lines) == 2:
-        max_second = max_chars
-        if len(lines[1]) > max_second:
-            lines[1] = lines[1][: max(0, max_second - 3)] + "..."
+def wrap_captions_by_pixel_width(
+    text: str, font_size: int, max_width_px: int, font_path: Optional[str] = None
+) -> List[str]:
+    """Wrap caption text to at most two lines of ``max_width_px``.
 
-    return lines or [""]
+    With ``font_path`` and Pillow available, lines are measured with the real
+    glyph advances of that font; otherwise every character is estimated at
+    ``0.6 * font_size`` pixels.
+    """
 
+    if not text:
+        return [""]
 
-def burn_captions(
-    video_in: Path,
-    srt_path: Path,
-    video_out: Path,
-    font: str,
-    size: int,
-    outline: int,
-    safe_bottom_pct: int,
-    watermark_corner: Optional[str] = None,
-) -> None:
-    if not video_in.exists():
-        raise RenderError(f"Input video not found: {video_in}")
-    if not srt_path.exists():
-        raise RenderError(f"SRT file not found: {srt_path}")
+    if font_path and PILLOW_AVAILABLE:
+        try:
+            return _wrap_measured(text, font_path, font_size, max_width_px)
+        except OSError:
+            pass  # Unreadable font file: fall back to the estimate
+
+    max_chars = _max_chars(font_size, max_width_px)
+
+    # Collapse whitespace once, then step through the string by index: jump
+    # max_chars ahead and back off to the last space instead of trial-joining
+    # word by word. Words longer than a line are hard-split.
+    text = " ".join(text.split())
+    n = len(text)
+    if not n:
+        return [""]
 
+    lines: List[str] = []
+    i = 0
+    while i < n and len(lines) < 2:
+        j = i + max_chars
+        if j >= n:
+            lines.append(text[i:])
+            i = n
+        elif text[j] == " ":
+            lines.append(text[i:j])
+            i = j + 1
+        else:
+            k = text.rfind(" ", i, j)
+            if k > i:
+                lines.append(text[i:k])
+                i = k + 1
+            else:
+                lines.append(text[i:j])
+                i = j
+
+    if i < n:
+        # Text overflows two lines: mark the cut on the second line, with a
+        # shorter ellipsis when the line cannot even hold "..."
+        ellipsis = "..."[:max_chars]
+        lines[-1] = lines[-1][: max_chars - len(ellipsis)].rstrip() + ellipsis
+
+    return lines
+
+
+def _caption_margin_v(safe_bottom_pct: int, watermark_corner: Optional[str] = None) -> int:
     margin_v = int(1080 * max(safe_bottom_pct, 0) / 100)
     if watermark_corner and watermark_corner.lower().startswith("bottom"):
         margin_v = int(margin_v * 1.05)
+    return margin_v
 
-    force_style = (
+
+@lru_cache(maxsize=64)
+def _caption_force_style(font: str, size: int, outline: int, margin_v: int) -> str:
+    return (
         f"FontName={font},"
         f"FontSize={size},"
         "PrimaryColour=&H00FFFFFF,"
@@ -129,24 +383,83 @@ def burn_captions(
         f"Alignment=2,MarginV={margin_v}"
     )
 
-    filter_str = f"subtitles={srt_path}:force_style='{force_style}'"
-
-    cmd = [
-        "ffmpeg",
-        "-y",
-        "-i",
-        str(video_in),
-        "-vf",
-        filter_str,
-        "-c:a",
-        "copy",
-        "-c:v",
-        "libx264",
-        str(video_out),
-    ]
+
+@lru_cache(maxsize=1)
+def _ffmpeg_encoders() -> FrozenSet[str]:
+    """Names of the encoders compiled into ffmpeg (empty if it cannot be run)."""
 
     try:
-        subprocess.run(cmd, check=True, capture_output=True, text=True)
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            check=True,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return frozenset()
+
+    return frozenset(
+        fields[1] for fields in map(str.split, result.stdout.splitlines()) if len(fields) > 1
+    )
+
+
+@lru_cache(maxsize=1)
+def _hw_h264_encoder() -> Optional[str]:
+    """Return the first hardware H.264 encoder this ffmpeg build offers, if any."""
+
+    available = _ffmpeg_encoders()
+    candidates = ["h264_nvenc", "h264_qsv"]
+    if sys.platform == "darwin":
+        candidates.insert(0, "h264_videotoolbox")
+    for name in candidates:
+        if name in available:
+            return name
+    return None
+
+
+def hw_h264_args(crf: int, encoder: Optional[str] = None) -> Optional[Tuple[str, ...]]:
+    """Hardware H.264 encoder options at roughly libx264 ``-crf`` quality, or None.
+
+    ``encoder`` (e.g. ``"h264_nvenc"``) asks for that encoder only instead of
+    the preferred available one.
+    """
+
+    if encoder is None:
+        encoder = _hw_h264_encoder()
+    elif encoder not in _HW_H264_ARGS or encoder not in _ffmpeg_encoders():
+        return None
+    if encoder is None:
+        return None
+    if encoder == "h264_nvenc":
+        quality = ("-cq", str(crf), "-b:v", "0")
+    elif encoder == "h264_qsv":
+        quality = ("-global_quality", str(crf), "-preset", "medium")
+    else:
+        # VideoToolbox -q:v runs 1-100, higher is better
+        quality = ("-q:v", str(min(max(100 - 2 * crf, 1), 100)))
+    return (*_HW_H264_ARGS[encoder], *quality)
+
+
+def _video_encoder_args(hw_encode: bool) -> Tuple[str, ...]:
+    if hw_encode:
+        encoder = _hw_h264_encoder()
+        if encoder:
+            return _HW_H264_ARGS[encoder]
+    return _X264_ARGS
+
+
+def _run_burn(cmd: List[str]) -> None:
+    try:
+        subprocess.run(
+            cmd,
+            check=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
     except subprocess.CalledProcessError as exc:
         stderr_tail = (exc.stderr or "")[-800:]
         raise RenderError(f"Failed to burn captions\n{stderr_tail}") from exc
@@ -154,52 +467,197 @@ def burn_captions(
         raise RenderError(f"Caption burning error: {exc}") from exc
 
 
+def _srt_is_empty(srt_path: Path) -> bool:
+    if srt_path.stat().st_size < 8:
+        return True
+    try:
+        return next(iter_captions_srt(srt_path), None) is None
+    except RenderError:
+        return False  # Let libass report the malformed file
+
+
+def subtitles_filter(
+    srt_path: Path,
+    font: str,
+    size: int,
+    outline: int,
+    safe_bottom_pct: int,
+    watermark_corner: Optional[str] = None,
+) -> str:
+    """Return the ``subtitles=`` filter that burns ``srt_path`` in the caption style."""
+
+    margin_v = _caption_margin_v(safe_bottom_pct, watermark_corner)
+    force_style = _caption_force_style(font, size, outline, margin_v)
+    return f"subtitles={srt_path}:force_style='{force_style}'"
+
+
+def burn_captions(
+    video_in: Path,
+    srt_path: Path,
+    video_out: Path,
+    font: str,
+    size: int,
+    outline: int,
+    safe_bottom_pct: int,
+    watermark_corner: Optional[str] = None,
+    hw_encode: bool = False,
+    pre_filters: Optional[str] = None,
+    encoder_args: Optional[Sequence[str]] = None,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+) -> None:
+    if not video_in.exists():
+        raise RenderError(f"Input video not found: {video_in}")
+    if not srt_path.exists():
+        raise RenderError(f"SRT file not found: {srt_path}")
+
+    seek = []
+    if start is not None:
+        seek += ["-ss", f"{start:.3f}"]
+    if end is not None:
+        seek += ["-to", f"{end:.3f}"]
+
+    no_cues = _srt_is_empty(srt_path)
+    if no_cues and not seek and not pre_filters and encoder_args is None:
+        # Nothing to draw or transform: remux instead of a full decode/encode
+        _run_burn([*_BURN_HEAD, str(video_in), "-c", "copy", "-movflags", "+faststart",
+                   str(video_out)])
+        return
+
+    # Without cues the encode still runs for the seek, pre-filters or caller's settings
+    filter_str = pre_filters
+    if not no_cues:
+        filter_str = subtitles_filter(srt_path, font, size, outline, safe_bottom_pct,
+                                      watermark_corner)
+        if pre_filters:
+            # Scale/crop/format in the same graph so the video is decoded once
+            filter_str = f"{pre_filters},{filter_str}"
+        if start:
+            # Input seeking restarts timestamps at zero; shift them back to the
+            # SRT's source timeline for the subtitles filter only
+            filter_str = f"setpts=PTS+{start:.3f}/TB,{filter_str},setpts=PTS-STARTPTS"
+
+    video_filter = ["-vf", filter_str] if filter_str else []
+    head = [*_FFMPEG_HEAD, *seek, "-i", str(video_in), *video_filter, *_BURN_MAP, *_BURN_TAIL]
+    # Callers may pass their own encode settings (e.g. the final export's)
+    retry_x264 = encoder_args is None and hw_encode
+    if encoder_args is None:
+        encoder_args = _video_encoder_args(hw_encode)
+
+    try:
+        _run_burn([*head, *encoder_args, str(video_out)])
+    except RenderError:
+        if not retry_x264 or encoder_args is _X264_ARGS:
+            raise
+        # Encoder is compiled in but the device is missing or busy
+        _run_burn([*head, *_X264_ARGS, str(video_out)])
+
+
+def burn_and_encode(
+    video_in: Path,
+    srt_path: Path,
+    video_out: Path,
+    styles: Dict[str, Any],
+    scale_to: Optional[Tuple[int, int]] = None,
+    crop: Optional[str] = None,
+    watermark_corner: Optional[str] = None,
+    hw_encode: bool = False,
+) -> None:
+    """Crop, scale and burn captions in a single ``-vf`` chain.
+
+    ``crop`` is an ffmpeg ``w:h:x:y`` expression and ``scale_to`` a
+    ``(width, height)`` pair; both run before ``subtitles`` so caption margins
+    apply to the output frame. ``styles`` uses the caption config keys.
+    """
+
+    pre = []
+    if crop:
+        pre.append(f"crop={crop}")
+    if scale_to:
+        pre.append(f"scale={scale_to[0]}:{scale_to[1]}")
+
+    burn_captions(
+        video_in,
+        srt_path,
+        video_out,
+        font=styles.get("font", "Arial"),
+        size=styles.get("font_size", 40),
+        outline=styles.get("stroke_px", 3),
+        safe_bottom_pct=styles.get("safe_bottom_pct", 12),
+        watermark_corner=watermark_corner,
+        hw_encode=hw_encode,
+        pre_filters=",".join(pre) or None,
+    )
+
+
 def attach_soft_subs(video_in: Path, srt_path: Path, video_out: Path) -> None:
     if not video_in.exists():
         raise RenderError(f"Input video not found: {video_in}")
     if not srt_path.exists():
         raise RenderError(f"SRT file not found: {srt_path}")
 
-    embed_cmd = [
-        "ffmpeg",
-        "-y",
-        "-i",
-        str(video_in),
-        "-i",
-        str(srt_path),
-        "-c",
-        "copy",
-        "-c:s",
-        "mov_text",
-        "-metadata:s:s:0",
-        "language=eng",
-        str(video_out),
-    ]
+    embed_cmd = [*_BURN_HEAD, str(video_in), "-i", str(srt_path), *_SOFT_SUB_TAIL, str(video_out)]
 
     try:
-        subprocess.run(embed_cmd, check=True, capture_output=True, text=True)
+        subprocess.run(
+            embed_cmd,
+            check=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
         return
     except subprocess.CalledProcessError:
         pass
 
-    fallback_cmd = [
-        "ffmpeg",
-        "-y",
-        "-i",
-        str(video_in),
-        "-c",
-        "copy",
-        str(video_out),
-    ]
+    fallback_cmd = [*_BURN_HEAD, str(video_in), "-c", "copy", str(video_out)]
 
     try:
-        subprocess.run(fallback_cmd, check=True, capture_output=True, text=True)
+        subprocess.run(
+            fallback_cmd,
+            check=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
     except subprocess.CalledProcessError as exc:
         stderr_tail = (exc.stderr or "")[-800:]
         raise RenderError(f"Failed to attach soft subtitles\n{stderr_tail}") from exc
 
     try:
-        sidecar = video_out.with_suffix(".srt")
-        sidecar.write_text(srt_path.read_text(encoding="utf-8"), encoding="utf-8")
+        _copy_sidecar(srt_path, video_out.with_suffix(".srt"))
     except Exception as exc:
         raise RenderError(f"Failed to create sidecar SRT: {exc}") from exc
+
+
+def _copy_sidecar(src: Path, dst: Path) -> None:
+    """Place ``src`` at ``dst`` via hardlink, kernel sendfile, or a plain copy."""
+
+    if dst.exists() and os.path.samefile(src, dst):
+        return
+    dst.unlink(missing_ok=True)
+
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass  # Cross-device, or links unsupported on this filesystem
+
+    if hasattr(os, "sendfile"):
+        try:
+            with open(src, "rb") as fin, open(dst, "wb") as fout:
+                size = os.fstat(fin.fileno()).st_size
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(fout.fileno(), fin.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            if offset == size:
+                return
+        except OSError:
+            pass
+
+    shutil.copy2(src, dst)
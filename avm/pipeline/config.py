@@ -2,12 +2,28 @@
 Configuration management with proper precedence handling.
 """
 
+import copy
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional speedup
+    FASTJSONSCHEMA_AVAILABLE = False
+
 from .errors import ConfigError
 
+# Parsed YAML keyed by path; entries are reused while (mtime_ns, size) matches
+_YAML_CACHE: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
 
 def load_default_config() -> Dict[str, Any]:
     """Load default configuration values."""
@@ -24,7 +40,19 @@ def load_default_config() -> Dict[str, Any]:
         "burn_captions": False,
         "fps": 30,
         "crf": 18,
-        "preset": "medium",
+        "preset": "veryfast",
+        "hw_encode": False,
+        "export": {
+            "reencode_final": False,
+            "threads": 0,
+            "tune": None,
+            "hw_encode": None,
+            "streaming": False,
+            "fused": False,
+            "parallel_chunks": 0,
+            "parallel_min_sec": 60.0,
+            "trim": None
+        },
         "zoom": 1.10,
         "logo": {
             "path": "examples/logo.png",
@@ -46,6 +74,8 @@ def load_default_config() -> Dict[str, Any]:
         },
         "audio": {
             "target_lufs": -14.0,
+            "loudnorm_tolerance_lu": 0.5,
+            "in_process_dsp": False,
             "music_db": -28,
             "ducking": {
                 "threshold": 0.02,
@@ -63,14 +93,30 @@ def load_default_config() -> Dict[str, Any]:
     }
 
 
+def _load_yaml_cached(path: Path) -> Dict[str, Any]:
+    """Parse a YAML file, reusing the previous parse while the file is unchanged."""
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    
+    cached = _YAML_CACHE.get(path)
+    if cached is None or cached[0] != stamp:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = yaml.load(f, Loader=_YamlLoader) or {}
+        _YAML_CACHE[path] = (stamp, data)
+    else:
+        data = cached[1]
+    
+    # Callers merge and mutate the result; never hand out the cached object
+    return copy.deepcopy(data)
+
+
 def load_styles_config(styles_path: Path) -> Dict[str, Any]:
     """Load styles configuration from YAML file."""
     if not styles_path.exists():
         return {}
     
     try:
-        with open(styles_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f) or {}
+        return _load_yaml_cached(styles_path)
     except yaml.YAMLError as e:
         raise ConfigError(f"Invalid styles YAML: {e}")
     except Exception as e:
@@ -85,8 +131,7 @@ def load_project_config(project_dir: Path) -> Dict[str, Any]:
         return {}
     
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f) or {}
+        return _load_yaml_cached(config_path)
     except yaml.YAMLError as e:
         raise ConfigError(f"Invalid project config YAML: {e}")
     except Exception as e:
@@ -95,19 +140,28 @@ def load_project_config(project_dir: Path) -> Dict[str, Any]:
 
 def merge_configs(*configs: Dict[str, Any]) -> Dict[str, Any]:
     """Merge multiple configuration dictionaries with proper precedence."""
-    result = {}
+    result: Dict[str, Any] = {}
     
+    # Walk nested dictionaries with an explicit stack instead of recursing and
+    # rebuilding every level. Dict values are copied on assignment so later
+    # layers never write into the caller's dictionaries.
     for config in configs:
         if not config:
             continue
-            
-        for key, value in config.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                # Recursively merge nested dictionaries
-                result[key] = merge_configs(result[key], value)
-            else:
-                # Overwrite with new value
-                result[key] = value
+        
+        stack = [(result, config)]
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                if isinstance(value, dict):
+                    if isinstance(dst.get(key), dict):
+                        # Recursively merge nested dictionaries
+                        stack.append((dst[key], value))
+                    else:
+                        dst[key] = copy.deepcopy(value)
+                else:
+                    # Overwrite with new value
+                    dst[key] = value
     
     return result
 
@@ -130,8 +184,58 @@ def load_merged_config(styles_path: Path, project_dir: Path,
     return merged
 
 
+_CONFIG_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "theme": {"enum": ["dark", "light"]},
+        "fps": {"type": "integer", "minimum": 1, "maximum": 120},
+        "crf": {"type": "integer", "minimum": 0, "maximum": 51},
+        "zoom": {"type": "number", "minimum": 1.0, "maximum": 3.0},
+        "audio": {
+            "type": "object",
+            "properties": {
+                "target_lufs": {"type": "number", "minimum": -60, "maximum": 0},
+                "ducking": {
+                    "type": "object",
+                    "properties": {
+                        "threshold": {"type": "number", "minimum": 0, "maximum": 1},
+                        "ratio": {"type": "number", "minimum": 1},
+                    },
+                },
+            },
+        },
+    },
+}
+
+_VALIDATE = fastjsonschema.compile(_CONFIG_SCHEMA) if FASTJSONSCHEMA_AVAILABLE else None
+
+
 def validate_config(config: Dict[str, Any]) -> None:
     """Validate configuration values."""
+    if _VALIDATE is not None:
+        try:
+            _VALIDATE(config)
+        except fastjsonschema.JsonSchemaException as e:
+            raise ConfigError(f"Invalid configuration: {e.message}")
+        return
+    
+    _validate_config_manual(config)
+
+
+def _is_integer(value: Any) -> bool:
+    """JSON Schema "integer": an int or integral float, never a bool."""
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _is_number(value: Any) -> bool:
+    """JSON Schema "number": an int or float, never a bool."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _validate_config_manual(config: Dict[str, Any]) -> None:
+    """Validate configuration values without fastjsonschema (same rules as ``_CONFIG_SCHEMA``)."""
     # Validate theme
     if "theme" in config and config["theme"] not in ["dark", "light"]:
         raise ConfigError(f"Invalid theme: {config['theme']}. Must be 'dark' or 'light'.")
@@ -139,48 +243,59 @@ def validate_config(config: Dict[str, Any]) -> None:
     # Validate FPS
     if "fps" in config:
         fps = config["fps"]
-        if not isinstance(fps, int) or fps < 1 or fps > 120:
+        if not _is_integer(fps) or fps < 1 or fps > 120:
             raise ConfigError(f"Invalid FPS: {fps}. Must be integer between 1-120.")
     
     # Validate CRF
     if "crf" in config:
         crf = config["crf"]
-        if not isinstance(crf, int) or crf < 0 or crf > 51:
+        if not _is_integer(crf) or crf < 0 or crf > 51:
             raise ConfigError(f"Invalid CRF: {crf}. Must be integer between 0-51.")
     
     # Validate zoom
     if "zoom" in config:
         zoom = config["zoom"]
-        if not isinstance(zoom, (int, float)) or zoom < 1.0 or zoom > 3.0:
+        if not _is_number(zoom) or zoom < 1.0 or zoom > 3.0:
             raise ConfigError(f"Invalid zoom: {zoom}. Must be number between 1.0-3.0.")
     
     # Validate audio settings
     if "audio" in config:
         audio = config["audio"]
+        if not isinstance(audio, dict):
+            raise ConfigError(f"Invalid audio settings: {audio}. Must be a mapping.")
+        
         if "target_lufs" in audio:
             lufs = audio["target_lufs"]
-            if not isinstance(lufs, (int, float)) or lufs > 0 or lufs < -60:
+            if not _is_number(lufs) or lufs > 0 or lufs < -60:
                 raise ConfigError(f"Invalid target LUFS: {lufs}. Must be negative number > -60.")
         
         if "ducking" in audio:
             ducking = audio["ducking"]
+            if not isinstance(ducking, dict):
+                raise ConfigError(f"Invalid ducking settings: {ducking}. Must be a mapping.")
+            
             if "threshold" in ducking:
                 threshold = ducking["threshold"]
-                if not isinstance(threshold, (int, float)) or threshold < 0 or threshold > 1:
+                if not _is_number(threshold) or threshold < 0 or threshold > 1:
                     raise ConfigError(f"Invalid threshold: {threshold}. Must be 0-1.")
             
             if "ratio" in ducking:
                 ratio = ducking["ratio"]
-                if not isinstance(ratio, (int, float)) or ratio < 1:
+                if not _is_number(ratio) or ratio < 1:
                     raise ConfigError(f"Invalid ratio: {ratio}. Must be >= 1.")
 
 
+@lru_cache(maxsize=256)
+def _split(key_path: str) -> Tuple[str, ...]:
+    """Split a dot-notation key path once per distinct path."""
+    return tuple(key_path.split('.'))
+
+
 def get_config_value(config: Dict[str, Any], key_path: str, default: Any = None) -> Any:
     """Get configuration value using dot notation (e.g., 'audio.ducking.threshold')."""
-    keys = key_path.split('.')
     value = config
     
-    for key in keys:
+    for key in _split(key_path):
         if isinstance(value, dict) and key in value:
             value = value[key]
         else:
@@ -191,7 +306,7 @@ def get_config_value(config: Dict[str, Any], key_path: str, default: Any = None)
 
 def set_config_value(config: Dict[str, Any], key_path: str, value: Any) -> None:
     """Set configuration value using dot notation."""
-    keys = key_path.split('.')
+    keys = _split(key_path)
     current = config
     
     for key in keys[:-1]:
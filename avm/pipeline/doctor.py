@@ -2,22 +2,129 @@
 Doctor module for checking system dependencies and health.
 """
 
+import json
+import os
+import platform
+import shutil
+import signal
 import subprocess
 import sys
-import platform
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from importlib import metadata
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
 from .errors import AVMError
-
-
-def doctor(logger=None, project: str = "") -> Dict[str, Dict[str, str]]:
+from .io_paths import playwright_browsers_dir
+
+# Upper bounds so a wedged binary or browser cannot hang the health check
+_PROBE_TIMEOUT = 3.0
+_CHROMIUM_TIMEOUT = 5.0
+
+# Common system fonts for captions, grouped by directory for check_fonts
+_FONT_CANDIDATES = (
+    "/System/Library/Fonts/Helvetica.ttc",  # macOS
+    "/System/Library/Fonts/Arial.ttf",      # macOS alternative
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",  # Linux
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",  # Linux alternative
+    "C:/Windows/Fonts/arial.ttf",  # Windows
+    "C:/Windows/Fonts/calibri.ttf"  # Windows alternative
+)
+_FONT_DIRS: Dict[str, set] = {}
+for _font_path in _FONT_CANDIDATES:
+    _font_dir, _font_name = os.path.split(_font_path)
+    _FONT_DIRS.setdefault(_font_dir, set()).add(_font_name)
+del _font_path, _font_dir, _font_name
+
+# Host platform, resolved once; it cannot change during a run
+_SYSTEM = platform.system().lower()
+_IS_MAC, _IS_LINUX, _IS_WINDOWS = _SYSTEM == "darwin", _SYSTEM == "linux", _SYSTEM == "windows"
+
+# Directory holding the avm package, so child checks can import it
+_PACKAGE_ROOT = str(Path(__file__).resolve().parents[2])
+
+# Child-process entry for _call_with_timeout: argv is module, function, JSON args
+_CHILD_CHECK = (
+    "import importlib, json, sys\n"
+    "check = getattr(importlib.import_module(sys.argv[1]), sys.argv[2])\n"
+    "try:\n"
+    "    result = check(*json.loads(sys.argv[3]))\n"
+    "except Exception as e:\n"
+    "    result = (False, 'Installation error', f'Check failed: {e}')\n"
+    "print(json.dumps(list(result)))\n"
+)
+
+# Installation tips per failed component, keyed by _SYSTEM with a "default" fallback
+_FIX_SUGGESTIONS: Dict[str, Dict[str, List[str]]] = {
+    "python": {
+        "default": [
+            "Python 3.11+ is required. Install from:",
+            "• https://python.org/downloads/",
+            "• Use pyenv: pyenv install 3.11.0",
+        ],
+    },
+    "ffmpeg": {
+        "darwin": ["brew install ffmpeg"],
+        "linux": ["sudo apt update && sudo apt install ffmpeg"],
+        "windows": ["Download from https://ffmpeg.org/download.html"],
+        "default": ["Install FFmpeg from https://ffmpeg.org/download.html"],
+    },
+    "ffprobe": {
+        "default": ["FFprobe comes with FFmpeg. Install FFmpeg first."],
+    },
+    "whisper": {
+        "default": ["pip install faster-whisper", "# OR", "pip install openai-whisper"],
+    },
+    "playwright": {
+        "default": ["pip install playwright", "playwright install chromium"],
+    },
+    "fonts": {
+        "darwin": [
+            "Fonts should be available by default.",
+            "If missing, install Xcode Command Line Tools:",
+            "xcode-select --install",
+        ],
+        "linux": [
+            "sudo apt install fonts-dejavu-core",
+            "# OR",
+            "sudo apt install fonts-liberation",
+        ],
+        "windows": [
+            "Windows should have fonts by default.",
+            "If missing, install Arial/Calibri from Windows Fonts.",
+        ],
+    },
+    "yuv420p": {
+        "default": [
+            "yuv420p support comes with FFmpeg.",
+            "Make sure you have a recent FFmpeg version.",
+            "Update FFmpeg if the issue persists.",
+        ],
+    },
+}
+
+# Distributions whose install or removal changes a check's result
+_STAMP_DISTS = ("faster-whisper", "openai-whisper", "playwright", "pillow")
+
+# Status of a check that did not run (shallow mode); neither OK nor FAIL
+_STATUS_SKIPPED = "⏭️ SKIPPED"
+
+# Last doctor() results and the environment stamp they were computed for
+_DOCTOR_CACHE: Dict[str, object] = {}
+
+
+def doctor(logger=None, project: str = "", deep: bool = True) -> Dict[str, Dict[str, str]]:
     """
     Comprehensive system health check for AVM dependencies.
     
     Args:
         logger: Logger instance
         project: Project name for logging
+        deep: Run FFmpeg/FFprobe and launch Chromium; with False only check
+            that they are installed and skip the yuv420p probe
     
     Returns:
         Dictionary with check results for all components
@@ -26,68 +133,18 @@ def doctor(logger=None, project: str = "") -> Dict[str, Dict[str, str]]:
     if logger:
         logger.info("Running AVM Doctor system health check")
     
-    results = {}
-    
-    # Python version check
-    is_ok, version, error = check_python_version()
-    results["python"] = {
-        "status": "✅ OK" if is_ok else "❌ FAIL",
-        "version": version,
-        "error": error
-    }
-    
-    # FFmpeg check
-    is_ok, version, error = check_ffmpeg()
-    results["ffmpeg"] = {
-        "status": "✅ OK" if is_ok else "❌ FAIL",
-        "version": version,
-        "error": error
-    }
-    
-    # FFprobe check
-    is_ok, version, error = check_ffprobe()
-    results["ffprobe"] = {
-        "status": "✅ OK" if is_ok else "❌ FAIL",
-        "version": version,
-        "error": error
-    }
-    
-    # Whisper availability check
-    is_ok, version, error = check_whisper()
-    results["whisper"] = {
-        "status": "✅ OK" if is_ok else "❌ FAIL",
-        "version": version,
-        "error": error
-    }
+    refresh = os.environ.get("AVM_DOCTOR_REFRESH") == "1"
+    stamp = _doctor_stamp(deep)
+    results = None if refresh else _load_doctor_cache(stamp)
     
-    # Playwright Chromium check
-    try:
-        from .slides import check_playwright_installation
-        is_ok, version, error = check_playwright_installation()
-    except ImportError:
-        is_ok, version, error = False, "Not available", "slides module not available"
-    
-    results["playwright"] = {
-        "status": "✅ OK" if is_ok else "❌ FAIL",
-        "version": version,
-        "error": error
-    }
-    
-    # Font availability check
-    is_ok, version, error = check_fonts()
-    results["fonts"] = {
-        "status": "✅ OK" if is_ok else "❌ FAIL",
-        "info": version,
-        "error": error
-    }
-    
-    # YUV420P support check
-    is_ok, version, error = check_yuv420p_support()
-    results["yuv420p"] = {
-        "status": "✅ OK" if is_ok else "❌ FAIL",
-        "info": version,
-        "error": error
-    }
+    if results is None:
+        if refresh:
+            for probe in (_ffmpeg_probe, _ffprobe_probe, _yuv420p_probe):
+                probe.cache_clear()
+        results = _run_checks(deep)
+        _save_doctor_cache(stamp, results)
+    elif logger:
+        logger.info("Using cached doctor results (set AVM_DOCTOR_REFRESH=1 to re-run)")
     
     # Print results
     print_doctor_results(results)
@@ -101,6 +158,100 @@ def doctor(logger=None, project: str = "") -> Dict[str, Dict[str, str]]:
     return results
 
 
+def _run_checks(deep: bool) -> Dict[str, Dict[str, str]]:
+    """Run every check in ``_CHECKS`` and return results in table order."""
+    
+    # Every check is independent and blocks on a subprocess or an import,
+    # so run them concurrently; wall time becomes the slowest single check.
+    with ThreadPoolExecutor(max_workers=len(_CHECKS)) as executor:
+        futures = {}
+        for component, check, value_key in _CHECKS:
+            args = (deep,) if component in _DEEP_CHECKS else ()
+            futures[executor.submit(check, *args)] = (component, value_key)
+        collected = {}
+        for future in as_completed(futures):
+            component, value_key = futures[future]
+            is_ok, value, error = future.result()
+            collected[component] = {
+                "status": _STATUS_SKIPPED if is_ok is None else "✅ OK" if is_ok else "❌ FAIL",
+                value_key: value,
+                "error": error
+            }
+    
+    # Keep the report in check order regardless of completion order
+    return {component: collected[component] for component, _, _ in _CHECKS}
+
+
+def _doctor_stamp(deep: bool) -> List:
+    """
+    Describe the environment the cached results are valid for.
+    
+    Covers everything the checks read: the FFmpeg binaries, the versions of
+    the optional packages, and the directories holding the Chromium builds
+    and fonts (their mtimes change when entries are added or removed).
+    """
+    stamp = [sys.version, _SYSTEM, deep]
+    for binary in ("ffmpeg", "ffprobe"):
+        path = shutil.which(binary)
+        stamp += [path, _mtime_ns(path) if path else None]
+    for dist in _STAMP_DISTS:
+        try:
+            stamp.append(metadata.version(dist))
+        except metadata.PackageNotFoundError:
+            stamp.append(None)
+    browsers_dir = playwright_browsers_dir()
+    stamp.append(_mtime_ns(browsers_dir) if browsers_dir is not None else None)
+    stamp += [_mtime_ns(font_dir) for font_dir in _FONT_DIRS]
+    return stamp
+
+
+def _mtime_ns(path) -> Optional[int]:
+    """Modification time of ``path``, or None if it cannot be stat'ed."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _doctor_cache_path() -> Path:
+    return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "avm" / "doctor.json"
+
+
+def _load_doctor_cache(stamp: List) -> Optional[Dict[str, Dict[str, str]]]:
+    """Return cached results for ``stamp`` from memory or disk, if any."""
+    cached = _DOCTOR_CACHE.get("results")
+    if cached is None or _DOCTOR_CACHE.get("stamp") != stamp:
+        try:
+            with open(_doctor_cache_path(), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("stamp") != stamp:
+            return None
+        cached = data.get("results")
+        if not isinstance(cached, dict) or list(cached) != [c for c, _, _ in _CHECKS]:
+            return None
+        _DOCTOR_CACHE.update(stamp=stamp, results=cached)
+    return {component: dict(info) for component, info in cached.items()}
+
+
+def _save_doctor_cache(stamp: List, results: Dict[str, Dict[str, str]]) -> None:
+    """Remember results in-process; persist them only when every check passed."""
+    _DOCTOR_CACHE.update(stamp=stamp, results={c: dict(info) for c, info in results.items()})
+    
+    # A failing report must be re-checked next run so fixes show up immediately
+    if any("❌ FAIL" in info["status"] for info in results.values()):
+        return
+    
+    cache_path = _doctor_cache_path()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump({"stamp": stamp, "results": results}, f, ensure_ascii=False)
+    except OSError:
+        pass
+
+
 def check_python_version() -> Tuple[bool, str, str]:
     """
     Check if Python version meets requirements (>= 3.11).
@@ -117,27 +268,81 @@ def check_python_version() -> Tuple[bool, str, str]:
         return False, version_str, f"Python {version_str} is too old. AVM requires Python 3.11+"
 
 
-def check_ffmpeg() -> Tuple[bool, str, str]:
+def check_ffmpeg(deep: bool = True) -> Tuple[bool, str, str]:
     """
     Check if FFmpeg is available and get version info.
     
+    Args:
+        deep: Run ``ffmpeg -version``; otherwise only look it up on PATH
+    
     Returns:
         (is_available, version, error_message)
     """
+    if not deep:
+        if shutil.which("ffmpeg") is None:
+            return False, "", "FFmpeg not found in PATH"
+        return True, "present", ""
+    return _ffmpeg_probe()
+
+
+def _read_version_line(binary_path: str) -> str:
+    """
+    Return the first line of ``<binary> -version`` without reading the rest.
+    
+    Args:
+        binary_path: Resolved path to ffmpeg or ffprobe
+        
+    Returns:
+        First line of the version banner
+        
+    Raises:
+        subprocess.TimeoutExpired: No line within _PROBE_TIMEOUT
+        subprocess.CalledProcessError: Binary exited non-zero without output
+    """
+    cmd = [binary_path, "-hide_banner", "-version"]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    
+    # Killing the process closes the pipe, which unblocks readline()
+    timed_out = threading.Event()
+    
+    def _expire() -> None:
+        timed_out.set()
+        proc.kill()
+    
+    watchdog = threading.Timer(_PROBE_TIMEOUT, _expire)
+    watchdog.start()
     try:
-        result = subprocess.run(
-            ["ffmpeg", "-version"], 
-            capture_output=True, 
-            text=True, 
-            timeout=10
-        )
-        if result.returncode == 0:
-            # Extract version from first line
-            version_line = result.stdout.split('\n')[0]
-            version = version_line.replace('ffmpeg version ', '').split(' ')[0]
-            return True, version, ""
-        else:
-            return False, "", f"FFmpeg returned error code {result.returncode}"
+        with proc.stdout:
+            line = proc.stdout.readline()
+    finally:
+        watchdog.cancel()
+        if proc.poll() is None:
+            proc.terminate()
+        proc.wait()
+    
+    if line:
+        return line.rstrip("\n")
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, _PROBE_TIMEOUT)
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+    return ""
+
+
+@lru_cache(maxsize=1)
+def _ffmpeg_probe() -> Tuple[bool, str, str]:
+    """Run ``ffmpeg -version`` once per process."""
+    ffmpeg_path = shutil.which("ffmpeg")
+    if ffmpeg_path is None:
+        return False, "", "FFmpeg not found in PATH"
+    
+    try:
+        # Extract version from first line
+        version_line = _read_version_line(ffmpeg_path)
+        version = version_line.replace('ffmpeg version ', '').split(' ')[0]
+        return True, version, ""
+    except subprocess.CalledProcessError as e:
+        return False, "", f"FFmpeg returned error code {e.returncode}"
     except FileNotFoundError:
         return False, "", "FFmpeg not found in PATH"
     except subprocess.TimeoutExpired:
@@ -146,27 +351,37 @@ def check_ffmpeg() -> Tuple[bool, str, str]:
         return False, "", f"Error checking FFmpeg: {e}"
 
 
-def check_ffprobe() -> Tuple[bool, str, str]:
+def check_ffprobe(deep: bool = True) -> Tuple[bool, str, str]:
     """
     Check if FFprobe is available and get version info.
     
+    Args:
+        deep: Run ``ffprobe -version``; otherwise only look it up on PATH
+    
     Returns:
         (is_available, version, error_message)
     """
+    if not deep:
+        if shutil.which("ffprobe") is None:
+            return False, "", "FFprobe not found in PATH"
+        return True, "present", ""
+    return _ffprobe_probe()
+
+
+@lru_cache(maxsize=1)
+def _ffprobe_probe() -> Tuple[bool, str, str]:
+    """Run ``ffprobe -version`` once per process."""
+    ffprobe_path = shutil.which("ffprobe")
+    if ffprobe_path is None:
+        return False, "", "FFprobe not found in PATH"
+    
     try:
-        result = subprocess.run(
-            ["ffprobe", "-version"], 
-            capture_output=True, 
-            text=True, 
-            timeout=10
-        )
-        if result.returncode == 0:
-            # Extract version from first line
-            version_line = result.stdout.split('\n')[0]
-            version = version_line.replace('ffprobe version ', '').split(' ')[0]
-            return True, version, ""
-        else:
-            return False, "", f"FFprobe returned error code {result.returncode}"
+        # Extract version from first line
+        version_line = _read_version_line(ffprobe_path)
+        version = version_line.replace('ffprobe version ', '').split(' ')[0]
+        return True, version, ""
+    except subprocess.CalledProcessError as e:
+        return False, "", f"FFprobe returned error code {e.returncode}"
     except FileNotFoundError:
         return False, "", "FFprobe not found in PATH"
     except subprocess.TimeoutExpired:
@@ -182,25 +397,22 @@ def check_whisper() -> Tuple[bool, str, str]:
     Returns:
         (is_available, version, error_message)
     """
-    # Check faster-whisper first (preferred)
-    try:
-        import faster_whisper
-        version = getattr(faster_whisper, '__version__', 'unknown')
-        return True, f"faster-whisper {version}", ""
-    except ImportError:
-        pass
-    
-    # Check openai-whisper as fallback
-    try:
-        import whisper
-        version = getattr(whisper, '__version__', 'unknown')
-        return True, f"openai-whisper {version}", ""
-    except ImportError:
-        pass
+    # Locate the packages without importing them; faster-whisper drags in
+    # ctranslate2 and openai-whisper drags in torch
+    for module, dist in (("faster_whisper", "faster-whisper"),  # preferred
+                         ("whisper", "openai-whisper")):
+        if find_spec(module) is not None:
+            return True, f"{dist} {_dist_version(dist)}", ""
     
     return False, "", "Neither faster-whisper nor openai-whisper is installed"
 
 
+def _dist_version(dist: str) -> str:
+    """Read an installed distribution's version from its metadata, not its module."""
+    try:
+        return metadata.version(dist)
+    except metadata.PackageNotFoundError:
+        return "unknown"
 
 
 def check_fonts() -> Tuple[bool, str, str]:
@@ -210,56 +422,75 @@ def check_fonts() -> Tuple[bool, str, str]:
     Returns:
         (is_available, font_info, error_message)
     """
+    # One directory listing per font dir instead of a stat() per candidate
+    found = set()
+    for font_dir, names in _FONT_DIRS.items():
+        try:
+            with os.scandir(font_dir) as entries:
+                found.update(entry.name for entry in entries if entry.name in names)
+        except OSError:
+            continue
+    
+    if found:
+        available_fonts = (
+            name for name in map(os.path.basename, _FONT_CANDIDATES) if name in found
+        )
+        return True, f"Found fonts: {', '.join(available_fonts)}", ""
+    
+    # Only the default-font fallback needs Pillow
     try:
-        from PIL import Image, ImageDraw, ImageFont
-        
-        # Try to load common system fonts for captions
-        font_paths = [
-            "/System/Library/Fonts/Helvetica.ttc",  # macOS
-            "/System/Library/Fonts/Arial.ttf",      # macOS alternative
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",  # Linux
-            "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",  # Linux alternative
-            "C:/Windows/Fonts/arial.ttf",  # Windows
-            "C:/Windows/Fonts/calibri.ttf"  # Windows alternative
-        ]
-        
-        available_fonts = []
-        for font_path in font_paths:
-            if Path(font_path).exists():
-                available_fonts.append(Path(font_path).name)
-        
-        if available_fonts:
-            return True, f"Found fonts: {', '.join(available_fonts)}", ""
-        else:
-            # Try default font as fallback
-            try:
-                font = ImageFont.load_default()
-                return True, "Using default PIL font", ""
-            except Exception:
-                return False, "", "No suitable fonts found for caption rendering"
-                
+        from PIL import ImageFont
     except ImportError:
         return False, "", "Pillow (PIL) not installed for font checking"
+    
+    try:
+        ImageFont.load_default()
+        return True, "Using default PIL font", ""
+    except Exception:
+        return False, "", "No suitable fonts found for caption rendering"
 
 
-def check_yuv420p_support() -> Tuple[bool, str, str]:
+def check_yuv420p_support(deep: bool = True) -> Tuple[Optional[bool], str, str]:
     """
     Check if FFmpeg supports yuv420p pixel format.
     
+    Args:
+        deep: Query FFmpeg's pixel formats; otherwise skip the check
+    
     Returns:
-        (is_supported, info, error_message)
+        (is_supported, info, error_message); is_supported is None when skipped
     """
+    if not deep:
+        if shutil.which("ffmpeg") is None:
+            return False, "", "FFmpeg not found (required for yuv420p check)"
+        return None, "not checked (run doctor without --quick)", ""
+    return _yuv420p_probe()
+
+
+@lru_cache(maxsize=1)
+def _yuv420p_probe() -> Tuple[bool, str, str]:
+    """List pixel formats once instead of encoding a test clip."""
+    ffmpeg_path = shutil.which("ffmpeg")
+    if ffmpeg_path is None:
+        return False, "", "FFmpeg not found (required for yuv420p check)"
+    
     try:
-        # Test yuv420p support by trying to encode a test video
-        result = subprocess.run([
-            "ffmpeg", "-f", "lavfi", "-i", "testsrc=duration=1:size=320x240:rate=1",
-            "-pix_fmt", "yuv420p", "-t", "0.1", "-f", "null", "-"
-        ], capture_output=True, text=True, timeout=15)
+        result = subprocess.run(
+            [ffmpeg_path, "-hide_banner", "-pix_fmts"],
+            capture_output=True, text=True, timeout=_PROBE_TIMEOUT
+        )
         
-        if result.returncode == 0:
-            return True, "yuv420p pixel format supported", ""
-        else:
+        if result.returncode != 0:
             return False, "", f"yuv420p not supported: {result.stderr[:100]}"
+        
+        # Rows look like "IO... yuv420p  3  12  8-8-8"; I = usable as encoder input
+        for line in result.stdout.splitlines():
+            fields = line.split()
+            if len(fields) >= 2 and fields[1] == "yuv420p":
+                if fields[0].startswith("I"):
+                    return True, "yuv420p pixel format supported", ""
+                break
+        return False, "", "yuv420p not supported by this FFmpeg build"
             
     except FileNotFoundError:
         return False, "", "FFmpeg not found (required for yuv420p check)"
@@ -276,8 +507,7 @@ def print_doctor_results(results: Dict[str, Dict[str, str]]) -> None:
     Args:
         results: Results from doctor check
     """
-    print("🏥 AVM Doctor - System Health Check")
-    print("=" * 50)
+    lines = ["🏥 AVM Doctor - System Health Check", "=" * 50]
     
     for component, info in results.items():
         status = info["status"]
@@ -288,13 +518,18 @@ def print_doctor_results(results: Dict[str, Dict[str, str]]) -> None:
         # Format component name
         component_name = component.replace("_", " ").title()
         
-        print(f"\n{status} {component_name}")
+        lines.append(f"\n{status} {component_name}")
         if version:
-            print(f"   Version: {version}")
+            lines.append(f"   Version: {version}")
         if error:
-            print(f"   Error: {error}")
+            lines.append(f"   Error: {error}")
+        elif status == _STATUS_SKIPPED:
+            lines.append(f"   Status: Skipped")
         else:
-            print(f"   Status: Working correctly")
+            lines.append(f"   Status: Working correctly")
+    
+    # One write keeps the report intact if other threads log meanwhile
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def suggest_fixes(results: Dict[str, Dict[str, str]]) -> None:
@@ -311,59 +546,17 @@ def suggest_fixes(results: Dict[str, Dict[str, str]]) -> None:
         print("\n🎉 All checks passed! Your system is ready for AVM.")
         return
     
-    print(f"\n🔧 Installation tips for {len(failed_components)} failed component(s):")
-    print("=" * 60)
-    
-    # Get platform-specific installation commands
-    system = platform.system().lower()
+    lines = [
+        f"\n🔧 Installation tips for {len(failed_components)} failed component(s):",
+        "=" * 60,
+    ]
     
     for component in failed_components:
-        print(f"\n📦 {component.replace('_', ' ').title()}:")
-        
-        if component == "python":
-            print("   Python 3.11+ is required. Install from:")
-            print("   • https://python.org/downloads/")
-            print("   • Use pyenv: pyenv install 3.11.0")
-            
-        elif component == "ffmpeg":
-            if system == "darwin":  # macOS
-                print("   brew install ffmpeg")
-            elif system == "linux":
-                print("   sudo apt update && sudo apt install ffmpeg")
-            elif system == "windows":
-                print("   Download from https://ffmpeg.org/download.html")
-            else:
-                print("   Install FFmpeg from https://ffmpeg.org/download.html")
-                
-        elif component == "ffprobe":
-            print("   FFprobe comes with FFmpeg. Install FFmpeg first.")
-            
-        elif component == "whisper":
-            print("   pip install faster-whisper")
-            print("   # OR")
-            print("   pip install openai-whisper")
-            
-        elif component == "playwright":
-            print("   pip install playwright")
-            print("   playwright install chromium")
-            
-        elif component == "fonts":
-            if system == "darwin":  # macOS
-                print("   Fonts should be available by default.")
-                print("   If missing, install Xcode Command Line Tools:")
-                print("   xcode-select --install")
-            elif system == "linux":
-                print("   sudo apt install fonts-dejavu-core")
-                print("   # OR")
-                print("   sudo apt install fonts-liberation")
-            elif system == "windows":
-                print("   Windows should have fonts by default.")
-                print("   If missing, install Arial/Calibri from Windows Fonts.")
-                
-        elif component == "yuv420p":
-            print("   yuv420p support comes with FFmpeg.")
-            print("   Make sure you have a recent FFmpeg version.")
-            print("   Update FFmpeg if the issue persists.")
+        lines.append(f"\n📦 {component.replace('_', ' ').title()}:")
+        tips = _FIX_SUGGESTIONS.get(component, {})
+        lines.extend(f"   {tip}" for tip in tips.get(_SYSTEM, tips.get("default", ())))
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def get_installation_commands() -> Dict[str, List[str]]:
@@ -373,8 +566,6 @@ def get_installation_commands() -> Dict[str, List[str]]:
     Returns:
         Dictionary mapping component names to installation commands
     """
-    system = platform.system().lower()
-    
     commands = {
         "ffmpeg": {
             "macos": ["brew install ffmpeg"],
@@ -398,13 +589,72 @@ def get_installation_commands() -> Dict[str, List[str]]:
 
 
 # Legacy functions for backward compatibility
-def check_playwright() -> Tuple[bool, str, str]:
+def check_playwright(deep: bool = False) -> Tuple[bool, str, str]:
     """Legacy function for backward compatibility."""
+    # Importing slides imports playwright; bail out early when it is absent
+    if find_spec("playwright") is None:
+        return (False, "Not installed",
+                "Playwright package not installed. Install with: pip install playwright")
+    
     try:
         from .slides import check_playwright_installation
-        return check_playwright_installation()
     except ImportError:
         return False, "Not available", "slides module not available"
+    
+    # A hung driver or browser cannot be abandoned in a thread (the interpreter
+    # joins it at exit), so the check runs in a child process that is killed
+    return _call_with_timeout("avm.pipeline.slides", "check_playwright_installation", [deep],
+                              _CHROMIUM_TIMEOUT, "Chromium check timed out")
+
+
+def _call_with_timeout(module: str, func: str, args: list, timeout: float,
+                       timeout_error: str) -> Tuple[bool, str, str]:
+    """
+    Run a check in a child interpreter and kill its process group if it overruns.
+    
+    The group kill also takes down anything the check started (e.g. the
+    Playwright driver and Chromium).
+    
+    Args:
+        module: Module holding the check
+        func: Check function returning ``(ok, value, error)``
+        args: JSON-serializable arguments for the check
+        timeout: Seconds to wait for the result
+        timeout_error: Error message reported on timeout
+    
+    Returns:
+        The check's result, or a failure when it timed out or crashed
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [_PACKAGE_ROOT, env.get("PYTHONPATH")]))
+    cmd = [sys.executable, "-c", _CHILD_CHECK, module, func, json.dumps(args)]
+    
+    proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                            stderr=subprocess.DEVNULL, text=True, env=env,
+                            start_new_session=not _IS_WINDOWS)
+    try:
+        stdout, _ = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        _kill_process_tree(proc)
+        proc.communicate()
+        return False, "", timeout_error
+    
+    try:
+        is_ok, value, error = json.loads(stdout)
+        return bool(is_ok), value, error
+    except (ValueError, TypeError):
+        return False, "Installation error", "Check process exited without a result"
+
+
+def _kill_process_tree(proc: subprocess.Popen) -> None:
+    """Kill ``proc`` and, on POSIX, every process in its session."""
+    try:
+        if _IS_WINDOWS:
+            proc.kill()
+        else:
+            os.killpg(proc.pid, signal.SIGKILL)
+    except OSError:
+        pass
 
 
 def check_moviepy() -> Tuple[bool, str, str]:
@@ -414,12 +664,9 @@ def check_moviepy() -> Tuple[bool, str, str]:
     Returns:
         (is_available, version, error_message)
     """
-    try:
-        import moviepy
-        version = getattr(moviepy, '__version__', 'unknown')
-        return True, version, ""
-    except ImportError:
+    if find_spec("moviepy") is None:
         return False, "", "MoviePy not installed"
+    return True, _dist_version("moviepy"), ""
 
 
 def check_disk_space(path: Path, required_gb: float = 5.0) -> Tuple[bool, str, str]:
@@ -434,8 +681,6 @@ def check_disk_space(path: Path, required_gb: float = 5.0) -> Tuple[bool, str, s
         (has_space, available_info, error_message)
     """
     try:
-        import shutil
-        
         # Get disk usage
         total, used, free = shutil.disk_usage(path)
         
@@ -456,4 +701,19 @@ def check_disk_space(path: Path, required_gb: float = 5.0) -> Tuple[bool, str, s
 
 def run_doctor_check(project_root: Path, verbose: bool = False) -> Dict[str, Dict[str, str]]:
     """Legacy function for backward compatibility."""
-    return doctor()
\ No newline at end of file
+    return doctor()
+
+
+# (component, check, result key for the check's detail string), in report order
+_CHECKS = (
+    ("python", check_python_version, "version"),
+    ("ffmpeg", check_ffmpeg, "version"),
+    ("ffprobe", check_ffprobe, "version"),
+    ("whisper", check_whisper, "version"),
+    ("playwright", check_playwright, "version"),
+    ("fonts", check_fonts, "info"),
+    ("yuv420p", check_yuv420p_support, "info"),
+)
+
+# Checks that take the ``deep`` flag; the rest are always cheap
+_DEEP_CHECKS = frozenset({"ffmpeg", "ffprobe", "playwright", "yuv420p"})
@@ -2,15 +2,83 @@
 Final export with audio processing and SRT handling.
 """
 
+import copy
+import json
+import logging
+import os
+import shlex
+import shutil
+import struct
 import subprocess
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, List, Tuple
 
 from .errors import MuxError, RenderError
 from .logging import Timer
-from .captions import burn_captions as _burn_captions, attach_soft_subs
+from .captions import (
+    burn_captions as _burn_captions, attach_soft_subs, hw_h264_args,
+    load_captions_srt, save_captions_srt, subtitles_filter,
+)
+from .audio import audio_codec_args, plan_audio_graph, process_audio, two_pass_loudnorm_filter
 from .io_paths import ProjectPaths
-from .mux import mux_audio_video, probe_video_duration, video_has_expected_codecs
+from .mux import build_mux_audio_graph_cmd, mux_audio_graph, mux_audio_video
+
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover - optional speedup
+    _json = json
+
+try:
+    import av
+except ImportError:  # pragma: no cover - optional speedup
+    av = None
+
+logger = logging.getLogger("avm")
+
+# Resolved once at import so each spawn skips the PATH search;
+# AVM_FFMPEG_BIN / AVM_FFPROBE_BIN point at a specific build
+_FFMPEG = os.environ.get("AVM_FFMPEG_BIN") or shutil.which("ffmpeg") or "ffmpeg"
+_FFPROBE = os.environ.get("AVM_FFPROBE_BIN") or shutil.which("ffprobe") or "ffprobe"
+
+# Fixed parts of the final encode/remux commands; only paths and video
+# encoder options vary per call
+_ENCODE_HEAD = (_FFMPEG, "-y", "-threads", "0", "-nostats", "-loglevel", "error", "-i")
+_ENCODE_TAIL = (
+    "-movflags", "+faststart",
+    "-c:a", "aac", "-b:a", "192k", "-ar", "48000", "-ac", "2",
+)
+_REMUX_TAIL = ("-c", "copy", "-movflags", "+faststart")
+
+# libx264 preset when the config sets none: ~3x medium's speed; CRF holds quality
+_DEFAULT_PRESET = "veryfast"
+
+# Concurrent NVENC sessions allowed by consumer GeForce drivers (export_many)
+_NVENC_MAX_SESSIONS = 2
+
+# Lines of ffmpeg stderr kept for error messages
+_STDERR_TAIL_LINES = 200
+
+# ffprobe fields the export checks read; a fraction of the full dump
+_PROBE_ENTRIES = "stream=codec_name,codec_type,pix_fmt,duration:format=duration"
+
+# Containers whose duration can be read straight from the mvhd box
+_MP4_SUFFIXES = frozenset({".mp4", ".m4v", ".mov"})
+
+# export.hw_encode values that pick one hardware encoder (h264_<name>)
+_HW_ENCODER_NAMES = frozenset({"nvenc", "qsv", "videotoolbox"})
+
+# MP4 sample entry tags (and ffprobe's mp4a alias) as ffprobe codec names;
+# mp4a entries carry their esds objectTypeIndication, e.g. "mp4a.40"
+_MP4_CODEC_NAMES = {
+    "avc1": "h264", "avc3": "h264", "mp4a": "aac",
+    "mp4a.40": "aac", "mp4a.66": "aac", "mp4a.67": "aac", "mp4a.68": "aac",
+    "mp4a.69": "mp3", "mp4a.6b": "mp3",
+}
 
 
 def export_complete_video(config: Dict[str, Any], paths: ProjectPaths, 
@@ -29,11 +97,7 @@ def export_complete_video(config: Dict[str, Any], paths: ProjectPaths,
         Duration of the final video in seconds
     """
     
-    if not paths.video_nocap_mp4.exists():
-        raise RenderError(f"Video file not found: {paths.video_nocap_mp4}")
-    
-    if not paths.audio_wav.exists():
-        raise RenderError(f"Audio file not found: {paths.audio_wav}")
+    _require_files(video=paths.video_nocap_mp4, audio=paths.audio_wav)
     
     try:
         with Timer(logger, "export_complete", project, "Exporting complete video"):
@@ -42,49 +106,60 @@ def export_complete_video(config: Dict[str, Any], paths: ProjectPaths,
             if "music" in config:
                 music_path = Path(config["music"]) if config["music"] else None
             
-            # Step 1: Process audio (normalize voice, duck music)
-            from .audio import process_audio
-            process_audio(
-                paths.audio_wav, music_path, 
-                paths.voice_norm_wav, paths.music_ducked_wav, 
-                config, logger, project
-            )
+            # In-process DSP renders the mastered stems up front, and the fused
+            # and streaming graphs have no trim (final_export applies it), so
+            # either takes the two-step path rather than a single ffmpeg graph
+            export_config = config.get("export", {})
+            in_process_dsp = config.get("audio", {}).get("in_process_dsp", False)
+            trimmed = _trim_range(export_config) != (None, None)
+            single_graph = not (in_process_dsp or trimmed)
             
-            # Step 2: Mux audio with video
-            mux_audio_video(
-                paths.video_nocap_mp4, paths.voice_norm_wav,
-                paths.music_ducked_wav if paths.music_ducked_wav.exists() else None,
-                paths.video_audio_mp4, config, logger, project
-            )
-
-            if logger:
-                logger.info("Validating muxed video duration and codecs")
-            try:
-                mux_duration = probe_video_duration(paths.video_audio_mp4)
-            except MuxError as exc:
-                raise RenderError(str(exc)) from exc
+            if export_config.get("fused", False) and single_graph:
+                duration = _fused_export(config, paths, music_path, burn_captions)
+            elif export_config.get("streaming", False) and single_graph:
+                duration = _stream_export(config, paths, music_path, burn_captions)
+            else:
+                # Step 1: Master voice/music and mux with video
+                try:
+                    if in_process_dsp:
+                        voice_wav, music_wav = process_audio(
+                            paths.audio_wav, music_path,
+                            paths.voice_norm_wav, paths.music_ducked_wav,
+                            config, logger, project
+                        )
+                        mux_duration = mux_audio_video(
+                            paths.video_nocap_mp4, voice_wav, music_wav,
+                            paths.video_audio_mp4, config, logger, project
+                        )
+                    else:
+                        mux_duration = mux_audio_graph(
+                            paths.video_nocap_mp4, paths.audio_wav, music_path,
+                            paths.video_audio_mp4, config, logger, project
+                        )
+                except MuxError as exc:
+                    raise RenderError(str(exc)) from exc
+                # Start readahead for the final encode while the checks run
+                _hint_willneed(paths.video_audio_mp4)
 
-            if mux_duration <= 1.0:
-                raise RenderError("Muxed video is too short (< 1s); check timeline and inputs")
+                if mux_duration <= 1.0:
+                    raise RenderError("Muxed video is too short (< 1s); check timeline and inputs")
 
-            if logger:
-                logger.info(f"Muxed video duration: {mux_duration:.2f} seconds")
-                if video_has_expected_codecs(paths.video_audio_mp4):
-                    logger.info("✅ Codec check passed for video_audio.mp4")
-                else:
-                    logger.warning("Codec mismatch detected for video_audio.mp4")
-            
-            # Step 3: Final export with captions and professional encoding
-            final_export(
-                in_video=paths.video_audio_mp4,
-                srt=paths.captions_srt if paths.captions_srt.exists() else None,
-                out_final_mp4=paths.final_mp4,
-                burn=burn_captions,
-                config=config, logger=logger, project=project
-            )
-            
-            # Get final video duration
-            duration = _get_video_duration(paths.final_mp4)
+                if logger:
+                    logger.info("Validating muxed video duration and codecs")
+                    logger.info(f"Muxed video duration: {mux_duration:.2f} seconds")
+                    if video_has_expected_codecs(paths.video_audio_mp4):
+                        logger.info("✅ Codec check passed for video_audio.mp4")
+                    else:
+                        logger.warning("Codec mismatch detected for video_audio.mp4")
+                
+                # Step 2: Final export with captions and professional encoding
+                duration = final_export(
+                    in_video=paths.video_audio_mp4,
+                    srt=paths.captions_srt if paths.captions_srt.exists() else None,
+                    out_final_mp4=paths.final_mp4,
+                    burn=burn_captions,
+                    config=config, logger=logger, project=project
+                )
             
             if logger:
                 logger.info(f"Export complete video finished: {paths.final_mp4}")
@@ -99,6 +174,258 @@ def export_complete_video(config: Dict[str, Any], paths: ProjectPaths,
         raise RenderError(f"Export error: {e}")
 
 
+def export_many(jobs: List[Tuple[Dict[str, Any], ProjectPaths, bool]],
+                max_parallel: Optional[int] = None) -> List[float]:
+    """
+    Export several projects concurrently, one worker process per project.
+    
+    A libx264 encode keeps about four cores busy, so the default runs
+    ``cpu_count // 4`` exports at once. Consumer NVENC cards limit concurrent
+    sessions, so at most ``_NVENC_MAX_SESSIONS`` run when any job uses NVENC.
+    
+    Args:
+        jobs: ``(config, paths, burn_captions)`` per project
+        max_parallel: Concurrent exports (default from the CPU count)
+    
+    Returns:
+        Final video durations, in job order
+    """
+    
+    if not jobs:
+        return []
+    
+    workers = max_parallel or max(1, (os.cpu_count() or 1) // 4)
+    if any("h264_nvenc" in (_hw_encoder_args(config, config.get("crf", 18)) or ())
+           for config, _, _ in jobs):
+        workers = min(workers, _NVENC_MAX_SESSIONS)
+    workers = min(workers, len(jobs))
+    
+    if workers == 1:
+        return [_export_one(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_export_one, jobs))
+
+
+def _export_one(job: Tuple[Dict[str, Any], ProjectPaths, bool]) -> float:
+    """Run one ``export_many`` job (module level so worker processes can import it)."""
+    
+    config, paths, burn = job
+    return export_complete_video(config, paths, burn, logger=logger, project=paths.slug)
+
+
+def _hint_willneed(path: Path) -> None:
+    """Ask the kernel to start reading ``path`` into the page cache (best effort)."""
+    
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _require_files(**paths: Path) -> None:
+    """
+    Stat every required input at once and report all unusable ones together.
+    
+    Args:
+        **paths: Label -> path; ``input_video=p`` reads "Input video file"
+    
+    Raises:
+        RenderError: One line per missing or inaccessible file
+    """
+    
+    def _problem(path: Path) -> Optional[str]:
+        try:
+            os.stat(path)
+            return None
+        except (FileNotFoundError, NotADirectoryError):
+            return "not found"
+        except OSError as e:
+            return f"not accessible ({e.strerror or e})"
+    
+    if len(paths) == 1:
+        problems = [_problem(path) for path in paths.values()]
+    else:
+        # Stats overlap instead of queueing on slow (network) filesystems
+        with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+            problems = list(executor.map(_problem, paths.values()))
+    
+    errors = [
+        f"{label.replace('_', ' ').capitalize()} file {problem}: {path}"
+        for (label, path), problem in zip(paths.items(), problems) if problem
+    ]
+    if errors:
+        raise RenderError("; ".join(errors))
+
+
+def _stream_export(config: Dict[str, Any], paths: ProjectPaths,
+                   music_path: Optional[Path], burn: bool) -> float:
+    """
+    Mux and final-encode as two ffmpeg processes joined by a NUT pipe.
+    
+    ``video_audio.mp4`` is never written. The pipe cannot be replayed, so
+    there is no libx264 retry after a failed hardware encode. Trimmed exports
+    take the two-step path instead (see ``export_complete_video``).
+    
+    Args:
+        config: Project configuration
+        paths: ProjectPaths instance with all file paths
+        music_path: Background music (optional)
+        burn: Whether to burn captions or attach as soft subs
+    
+    Returns:
+        Duration of the final video in seconds
+    """
+    
+    if not (music_path and music_path.exists()):
+        music_path = None
+    srt = paths.captions_srt if paths.captions_srt.exists() else None
+    
+    mux_cmd = build_mux_audio_graph_cmd(
+        paths.video_nocap_mp4, paths.audio_wav, music_path, None, config, stdout_pipe=True
+    )
+    
+    encode_cmd = [_FFMPEG, "-y", "-threads", "0", "-nostats", "-loglevel", "error",
+                  "-f", "nut", "-i", "pipe:0"]
+    if srt and burn:
+        crf = config.get("crf", 18)
+        caption_config = config.get("caption", {})
+        encode_cmd += [
+            "-vf", subtitles_filter(
+                srt,
+                caption_config.get("font", "Arial"),
+                caption_config.get("font_size", 40),
+                caption_config.get("stroke_px", 3),
+                caption_config.get("safe_bottom_pct", 12),
+                _watermark_corner(config)
+            ),
+            "-map", "0:v:0", "-map", "0:a:0?",
+            *_final_video_args(crf, config.get("preset", _DEFAULT_PRESET), config.get("export", {}),
+                               _hw_encoder_args(config, crf)),
+            "-c:a", "copy",
+        ]
+    elif srt:
+        encode_cmd += ["-i", str(srt), "-c", "copy",
+                       "-c:s", "mov_text", "-metadata:s:s:0", "language=eng"]
+    else:
+        encode_cmd += ["-c", "copy"]
+    encode_cmd += ["-movflags", "+faststart", str(paths.final_mp4)]
+    
+    with tempfile.TemporaryFile() as mux_stderr:
+        # close_fds=False keeps both launches on posix_spawn (see _run_ffmpeg)
+        mux_proc = subprocess.Popen(mux_cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                    stderr=mux_stderr, close_fds=False)
+        encode_proc = subprocess.Popen(encode_cmd, stdin=mux_proc.stdout, stdout=subprocess.DEVNULL,
+                                       stderr=subprocess.PIPE, close_fds=False, text=True)
+        # Drop our copy so the muxer sees EPIPE if the encoder exits early
+        mux_proc.stdout.close()
+        _, encode_err = encode_proc.communicate()
+        mux_rc = mux_proc.wait()
+        
+        # A failed encoder makes the muxer die on EPIPE, so the encoder's
+        # stderr holds the root cause; report it first
+        if encode_proc.returncode != 0:
+            stderr_tail = (encode_err or "")[-800:]
+            raise RenderError(f"Streaming final encode failed\n{stderr_tail}")
+        
+        if mux_rc != 0:
+            mux_stderr.seek(0)
+            stderr_tail = mux_stderr.read().decode("utf-8", "replace")[-800:]
+            raise RenderError(f"Streaming mux failed\n{stderr_tail}")
+    
+    duration = _get_video_duration(paths.final_mp4)
+    if duration <= 1.0:
+        raise RenderError("Final video is too short (< 1s); check timeline and inputs")
+    return duration
+
+
+def _fused_export(config: Dict[str, Any], paths: ProjectPaths,
+                  music_path: Optional[Path], burn: bool) -> float:
+    """
+    Mix audio, add captions and encode ``final.mp4`` in a single ffmpeg process.
+    
+    The audio graph from ``plan_audio_graph`` and the ``subtitles`` filter
+    share one ``-filter_complex``, so the source inputs are read once and
+    ``video_audio.mp4`` is never written. Without burn-in the video stream
+    is copied, as in ``_stream_export``. Trimmed exports take the two-step
+    path instead (see ``export_complete_video``).
+    
+    Args:
+        config: Project configuration
+        paths: ProjectPaths instance with all file paths
+        music_path: Background music (optional)
+        burn: Whether to burn captions or attach as soft subs
+    
+    Returns:
+        Duration of the final video in seconds
+    """
+    
+    if not (music_path and music_path.exists()):
+        music_path = None
+    srt = paths.captions_srt if paths.captions_srt.exists() else None
+    
+    filter_complex = plan_audio_graph(paths.audio_wav, music_path, config)
+    inputs = [*_ENCODE_HEAD, str(paths.video_nocap_mp4), "-i", str(paths.audio_wav)]
+    if music_path is not None:
+        inputs += ["-i", str(music_path)]
+    
+    def run(cmd: List[str]) -> None:
+        try:
+            _run_ffmpeg([*cmd, *_ENCODE_TAIL, str(paths.final_mp4)])
+        except subprocess.CalledProcessError as e:
+            stderr_tail = (e.stderr or "")[-800:]
+            raise RenderError(f"Fused export failed\n{stderr_tail}")
+    
+    if srt and burn:
+        caption_config = config.get("caption", {})
+        filter_complex += ";[0:v]" + subtitles_filter(
+            srt,
+            caption_config.get("font", "Arial"),
+            caption_config.get("font_size", 40),
+            caption_config.get("stroke_px", 3),
+            caption_config.get("safe_bottom_pct", 12),
+            _watermark_corner(config)
+        ) + "[vout]"
+        cmd = [*inputs, "-filter_complex", filter_complex, "-map", "[vout]", "-map", "[aout]"]
+        
+        crf = config.get("crf", 18)
+        preset = config.get("preset", _DEFAULT_PRESET)
+        export_config = config.get("export", {})
+        candidates = [_final_video_args(crf, preset, export_config)]
+        hw_args = _hw_encoder_args(config, crf)
+        if hw_args:
+            candidates.insert(0, _final_video_args(crf, preset, export_config, hw_args))
+        _with_encoder_fallback(candidates, lambda video_args: run([*cmd, *video_args]))
+    elif srt:
+        srt_input = 3 if music_path is not None else 2
+        run([*inputs, "-i", str(srt), "-filter_complex", filter_complex,
+             "-map", "0:v:0", "-map", "[aout]", "-map", f"{srt_input}:s:0", "-c:v", "copy",
+             "-c:s", "mov_text", "-metadata:s:s:0", "language=eng"])
+    else:
+        run([*inputs, "-filter_complex", filter_complex,
+             "-map", "0:v:0", "-map", "[aout]", "-c:v", "copy"])
+    
+    duration = _get_video_duration(paths.final_mp4)
+    if duration <= 1.0:
+        raise RenderError("Final video is too short (< 1s); check timeline and inputs")
+    return duration
+
+
+def _watermark_corner(config: Dict[str, Any]) -> Optional[str]:
+    """Return the watermark corner captions must clear, if a watermark is enabled."""
+    watermark_cfg = config.get("watermark", {})
+    if isinstance(watermark_cfg, dict) and watermark_cfg.get("enabled", False):
+        return watermark_cfg.get("position", "bottom-right")
+    return None
+
+
 def final_export(in_video: Path, srt: Optional[Path], out_final_mp4: Path,
                 burn: bool = False, config: Optional[Dict[str, Any]] = None,
                 logger=None, project: str = "") -> float:
@@ -118,50 +445,71 @@ def final_export(in_video: Path, srt: Optional[Path], out_final_mp4: Path,
         Duration of the final video in seconds
     """
     
-    if not in_video.exists():
-        raise RenderError(f"Input video file not found: {in_video}")
+    _require_files(input_video=in_video)
     
     config = config or {}
-    temp_outputs = []
 
     try:
         with Timer(logger, "final_export", project, "Final video export"):
             crf = config.get("crf", 18)
-            preset = config.get("preset", "medium")
+            preset = config.get("preset", _DEFAULT_PRESET)
+            export_config = config.get("export", {})
 
             caption_config = config.get("caption", {})
-            font_size = caption_config.get("font_size", 40)
-            stroke_px = caption_config.get("stroke_px", 3)
-            safe_bottom_pct = caption_config.get("safe_bottom_pct", 12)
-            watermark_corner = None
-            watermark_cfg = config.get("watermark", {})
-            if watermark_cfg.get("enabled", False):
-                watermark_corner = watermark_cfg.get("position", "bottom-right")
-
-            working_video = in_video
-
-            if srt and srt.exists():
-                if burn:
-                    temp_burned = out_final_mp4.with_suffix('.burn_temp.mp4')
-                    _burn_captions(
-                        in_video,
-                        srt,
-                        temp_burned,
-                        font=caption_config.get("font", "Arial"),
-                        size=font_size,
-                        outline=stroke_px,
-                        safe_bottom_pct=safe_bottom_pct,
-                        watermark_corner=watermark_corner
-                    )
-                    working_video = temp_burned
-                    temp_outputs.append(temp_burned)
-                else:
-                    temp_subs = out_final_mp4.with_suffix('.subs_temp.mp4')
-                    attach_soft_subs(in_video, srt, temp_subs)
-                    working_video = temp_subs
-                    temp_outputs.append(temp_subs)
-
-            _encode_final_video(working_video, out_final_mp4, crf, preset)
+            watermark_corner = _watermark_corner(config)
+
+            # One ffmpeg pass per branch: captions are burned inside the final
+            # encode and soft subs are muxed straight into the output
+            # Hardware encoders can be compiled in yet unusable, so libx264
+            # stays as the last candidate
+            candidates = [_final_video_args(crf, preset, export_config)]
+            hw_args = _hw_encoder_args(config, crf)
+            if hw_args:
+                candidates.insert(0, _final_video_args(crf, preset, export_config, hw_args))
+            start, end = _trim_range(export_config)
+            trimmed = start is not None or end is not None
+
+            if srt and srt.exists() and burn:
+                _with_encoder_fallback(candidates, lambda video_args: _burn_captions(
+                    in_video,
+                    srt,
+                    out_final_mp4,
+                    font=caption_config.get("font", "Arial"),
+                    size=caption_config.get("font_size", 40),
+                    outline=caption_config.get("stroke_px", 3),
+                    safe_bottom_pct=caption_config.get("safe_bottom_pct", 12),
+                    watermark_corner=watermark_corner,
+                    encoder_args=video_args,
+                    start=start,
+                    end=end
+                ))
+            elif srt and srt.exists() and trimmed:
+                # Soft subs are stream-copied, so trim in the encode first and
+                # rebase the cues to the trimmed timeline
+                with tempfile.TemporaryDirectory(dir=out_final_mp4.parent) as tmp:
+                    trimmed_mp4 = Path(tmp) / "trimmed.mp4"
+                    trimmed_srt = Path(tmp) / "trimmed.srt"
+                    _with_encoder_fallback(candidates, lambda video_args: _encode_final_video(
+                        in_video, trimmed_mp4, crf, preset,
+                        video_args=video_args, start=start, end=end
+                    ))
+                    _shift_srt(srt, start, end, trimmed_srt)
+                    attach_soft_subs(trimmed_mp4, trimmed_srt, out_final_mp4)
+            elif srt and srt.exists():
+                attach_soft_subs(in_video, srt, out_final_mp4)
+            else:
+                # Chunked encoding splits libx264 work only; hardware encoders
+                # already run at many times realtime
+                chunks = 1 if hw_args or trimmed else _parallel_chunk_count(in_video, export_config)
+                _with_encoder_fallback(candidates, lambda video_args: _encode_final_video(
+                    in_video, out_final_mp4, crf, preset,
+                    reencode=export_config.get("reencode_final", False),
+                    video_args=video_args,
+                    chunks=chunks,
+                    export_config=export_config,
+                    start=start,
+                    end=end
+                ))
 
             duration = _get_video_duration(out_final_mp4)
 
@@ -173,45 +521,151 @@ def final_export(in_video: Path, srt: Optional[Path], out_final_mp4: Path,
 
     except Exception as e:
         raise RenderError(f"Final export failed: {e}")
-    finally:
-        for temp_path in temp_outputs:
-            try:
-                temp_path.unlink(missing_ok=True)
-            except Exception:
-                pass
 
 
-def _encode_final_video(in_video: Path, out_video: Path, crf: int, preset: str) -> None:
+def _hw_encoder_args(config: Dict[str, Any], crf: int) -> Optional[Tuple[str, ...]]:
     """
-    Encode final video with professional settings.
+    Resolve ``export.hw_encode`` (auto/on/off) to hardware encoder options.
+    
+    Without an ``export.hw_encode`` key the top-level ``hw_encode`` flag
+    applies, with True meaning "auto". An encoder name (``nvenc``, ``qsv``,
+    ``videotoolbox``) requires that specific encoder.
+    
+    Args:
+        config: Project configuration
+        crf: Constant Rate Factor to translate to the encoder's quality scale
+    
+    Returns:
+        Encoder options, or None to use libx264
+    """
+    
+    mode = config.get("export", {}).get("hw_encode")
+    if mode is None:
+        mode = "auto" if config.get("hw_encode", False) else "off"
+    if mode in (False, "off"):
+        return None
+    
+    if mode in _HW_ENCODER_NAMES:
+        hw_args = hw_h264_args(crf, f"h264_{mode}")
+        if hw_args is None:
+            raise RenderError(f"export.hw_encode is '{mode}' but FFmpeg does not offer h264_{mode}")
+        return hw_args
+    
+    hw_args = hw_h264_args(crf)
+    if hw_args is None and mode in (True, "on"):
+        raise RenderError("export.hw_encode is 'on' but FFmpeg offers no hardware H.264 encoder")
+    return hw_args
+
+
+def _with_encoder_fallback(candidates: List[List[str]],
+                           encode: Callable[[List[str]], None]) -> None:
+    """
+    Run ``encode`` with each encoder option set until one succeeds.
+    
+    Args:
+        candidates: Encoder option lists, preferred first
+        encode: Callable running the encode with one option list
+    """
+    
+    for video_args in candidates[:-1]:
+        try:
+            encode(video_args)
+            return
+        except RenderError:
+            continue
+    encode(candidates[-1])
+
+
+def _final_video_args(crf: int, preset: str,
+                      export_config: Optional[Dict[str, Any]] = None,
+                      hw_args: Optional[Tuple[str, ...]] = None) -> List[str]:
+    """
+    Video encoder options for the final deliverable.
     
     Args:
-        in_video: Input video file
-        out_video: Output video file
         crf: Constant Rate Factor
         preset: Encoding preset
-    """
+        export_config: ``export`` config section (threads, tune)
+        hw_args: Hardware encoder options replacing libx264 (optional)
     
-    cmd = [
-        "ffmpeg", "-y",
-        "-i", str(in_video),
-        "-c:v", "libx264",
-        "-crf", str(crf),
-        "-preset", preset,
+    Returns:
+        FFmpeg output options for libx264 (or ``hw_args``) with BT.709 tagging
+    """
+    export_config = export_config or {}
+    tail = [
         "-pix_fmt", "yuv420p",
-        "-movflags", "+faststart",
         "-colorspace", "bt709",
         "-color_primaries", "bt709",
         "-color_trc", "bt709",
-        "-c:a", "aac",
-        "-b:a", "192k",
-        "-ar", "48000",
-        "-ac", "2",
-        str(out_video)
     ]
+    if hw_args:
+        return [*hw_args, *tail]
+    
+    # export.threads=0 means one x264 thread per CPU; frame threading only,
+    # since sliced threads trade compression for latency we do not need
+    threads = export_config.get("threads") or os.cpu_count() or 1
+    args = [
+        "-c:v", "libx264",
+        "-crf", str(crf),
+        "-preset", preset,
+        "-profile:v", "high",
+        "-x264-params", f"threads={threads}:lookahead-threads=2:sliced-threads=0",
+    ]
+    
+    tune = export_config.get("tune")
+    if tune:
+        args += ["-tune", tune]
+    
+    return args + tail
+
+
+def _encode_final_video(in_video: Path, out_video: Path, crf: int, preset: str,
+                        reencode: bool = False,
+                        video_args: Optional[List[str]] = None,
+                        chunks: int = 1,
+                        export_config: Optional[Dict[str, Any]] = None,
+                        start: Optional[float] = None,
+                        end: Optional[float] = None) -> None:
+    """
+    Encode final video with professional settings.
+    
+    Inputs that are already H.264/yuv420p + AAC (the mux stage output) are
+    remuxed with stream copy unless ``reencode`` is set or the video is
+    trimmed (stream copy can only cut on keyframes).
+    
+    Args:
+        in_video: Input video file
+        out_video: Output video file
+        crf: Constant Rate Factor
+        preset: Encoding preset
+        reencode: Always re-encode, even when a remux would do
+        video_args: Video encoder options (defaults to ``_final_video_args``)
+        chunks: Encode this many keyframe-aligned segments in parallel
+        export_config: ``export`` config section, for the per-chunk encoder options
+        start: Drop input before this time (seconds)
+        end: Drop input after this time (seconds)
+    """
+    
+    dry_run = os.environ.get("AVM_FFMPEG_DRYRUN") == "1"
+    trimmed = start is not None or end is not None
+    
+    if not (reencode or trimmed) and _is_delivery_format(in_video):
+        cmd = [*_ENCODE_HEAD, str(in_video), *_REMUX_TAIL, str(out_video)]
+    elif chunks > 1 and not (dry_run or trimmed):
+        _parallel_encode(in_video, out_video, crf, preset, chunks, export_config)
+        return
+    else:
+        video_args = video_args or _final_video_args(crf, preset)
+        # Input-side seeking: the trimmed regions are never decoded
+        cmd = [*_ENCODE_HEAD[:-1], *_seek_args(start, end), "-i", str(in_video),
+               *video_args, *_ENCODE_TAIL, str(out_video)]
+    
+    if dry_run:
+        logger.info(f"AVM_FFMPEG_DRYRUN: {shlex.join(cmd)}")
+        return
     
     try:
-        subprocess.run(cmd, check=True, capture_output=True, text=True)
+        _run_ffmpeg(cmd)
     except subprocess.CalledProcessError as e:
         stderr_tail = (e.stderr or "")[-800:]
         raise RenderError(f"Video encoding failed\n{stderr_tail}")
@@ -219,31 +673,458 @@ def _encode_final_video(in_video: Path, out_video: Path, crf: int, preset: str)
         raise RenderError(f"Video encoding error: {e}")
 
 
-def _get_video_duration(video_path: Path) -> float:
+def _trim_range(export_config: Dict[str, Any]) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Read ``export.trim`` as a ``(start, end)`` pair of seconds.
+    
+    Args:
+        export_config: ``export`` config section
+    
+    Returns:
+        Trim start and end; either is None when not set
+    """
+    
+    trim = export_config.get("trim") or {}
+    start, end = trim.get("start"), trim.get("end")
+    start = float(start) if start else None
+    end = float(end) if end is not None else None
+    if end is not None and end <= (start or 0.0):
+        raise RenderError(f"Invalid export.trim: end ({end}) must be after start ({start or 0.0})")
+    return start, end
+
+
+def _seek_args(start: Optional[float], end: Optional[float]) -> Tuple[str, ...]:
+    """Input options that limit decoding to ``start``..``end`` (source timeline)."""
+    
+    args = ()
+    if start is not None:
+        args += ("-ss", f"{start:.3f}")
+    if end is not None:
+        args += ("-to", f"{end:.3f}")
+    return args
+
+
+def _shift_srt(srt_path: Path, start: Optional[float], end: Optional[float],
+               out_path: Path) -> None:
+    """
+    Write the cues of ``srt_path`` that fall inside a trim, rebased to zero.
+    
+    Args:
+        srt_path: Source SRT (source timeline)
+        start: Trim start in seconds, or None
+        end: Trim end in seconds, or None
+        out_path: Output SRT path
+    """
+    
+    offset = start or 0.0
+    limit = None if end is None else end - offset
+    kept = []
+    for cue in load_captions_srt(srt_path):
+        cue_start = max(cue["start"] - offset, 0.0)
+        cue_end = cue["end"] - offset
+        if limit is not None:
+            cue_end = min(cue_end, limit)
+        if cue_end > cue_start:
+            kept.append({**cue, "index": len(kept) + 1, "start": cue_start, "end": cue_end})
+    save_captions_srt(kept, out_path)
+
+
+def _parallel_chunk_count(in_video: Path, export_config: Dict[str, Any]) -> int:
     """
-    Get video duration using ffprobe.
+    Decide how many segments ``_parallel_encode`` should split a video into.
+    
+    Args:
+        in_video: Input video file
+        export_config: ``export`` config section
+    
+    Returns:
+        Segment count; 1 disables chunked encoding
+    """
+    
+    chunks = export_config.get("parallel_chunks", 0) or (os.cpu_count() or 1) // 4
+    if chunks < 2:
+        return 1
+    try:
+        duration = _get_video_duration(in_video)
+    except RenderError:
+        return 1
+    return chunks if duration >= export_config.get("parallel_min_sec", 60.0) else 1
+
+
+def _keyframe_times(video_path: Path) -> List[float]:
+    """
+    List video keyframe timestamps from packet flags (no decoding).
     
     Args:
         video_path: Path to video file
     
     Returns:
-        Duration in seconds
+        Keyframe presentation times in seconds, ascending
     """
     
     cmd = [
-        "ffprobe", "-v", "quiet", "-show_entries", "format=duration",
-        "-of", "csv=p=0", str(video_path)
+        _FFPROBE, "-v", "error", "-select_streams", "v:0",
+        "-show_entries", "packet=pts_time,flags", "-of", "csv=p=0", str(video_path)
     ]
-    
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        duration_str = result.stdout.strip()
-        if not duration_str:
-            raise ValueError("Empty duration output")
-        return float(duration_str)
+        output = _run_ffmpeg(cmd, capture_stdout=True)
     except subprocess.CalledProcessError as e:
         stderr_tail = (e.stderr or "")[-800:]
-        raise RenderError(f"Failed to get video duration\n{stderr_tail}")
+        raise RenderError(f"Failed to list keyframes\n{stderr_tail}")
+    
+    times = []
+    for line in output.splitlines():
+        pts_time, _, flags = line.partition(b",")
+        if b"K" in flags and pts_time not in (b"", b"N/A"):
+            times.append(float(pts_time))
+    return sorted(times)
+
+
+def _parallel_encode(in_video: Path, out_video: Path, crf: int, preset: str,
+                     chunks: int, export_config: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Encode keyframe-aligned segments concurrently, then concat them losslessly.
+    
+    x264 stops scaling well past ~8 threads, so several narrower encoders
+    beat one wide one on many-core machines. Segments are video-only; the
+    audio is taken from ``in_video`` in the concat pass.
+    
+    Args:
+        in_video: Input video file
+        out_video: Output video file
+        crf: Constant Rate Factor
+        preset: Encoding preset
+        chunks: Number of segments to aim for
+        export_config: ``export`` config section
+    """
+    
+    duration = _get_video_duration(in_video)
+    keyframes = _keyframe_times(in_video)
+    
+    # Snap each even split point to the next keyframe at or after it
+    bounds = [0.0]
+    for i in range(1, chunks):
+        target = duration * i / chunks
+        cut = next((t for t in keyframes if t >= target), None)
+        if cut is not None and cut > bounds[-1] and cut < duration:
+            bounds.append(cut)
+    
+    if len(bounds) < 2:
+        _encode_final_video(in_video, out_video, crf, preset, reencode=True,
+                            video_args=_final_video_args(crf, preset, export_config))
+        return
+    
+    threads = max((os.cpu_count() or 1) // len(bounds), 1)
+    video_args = _final_video_args(crf, preset, {**(export_config or {}), "threads": threads})
+    
+    with tempfile.TemporaryDirectory(prefix="avm_chunks_", dir=out_video.parent) as tmp:
+        tmp_dir = Path(tmp)
+        segments = []
+        for i, start in enumerate(bounds):
+            seek = ["-ss", f"{start:.6f}"]
+            if i + 1 < len(bounds):
+                seek += ["-to", f"{bounds[i + 1]:.6f}"]
+            segment = tmp_dir / f"chunk_{i:03d}.mp4"
+            segments.append((segment, [
+                *_ENCODE_HEAD[:-1], *seek, "-i", str(in_video),
+                "-map", "0:v:0", "-an", *video_args, str(segment)
+            ]))
+        
+        concat_list = tmp_dir / "segments.txt"
+        concat_list.write_text(
+            "".join(f"file '{_concat_quote(segment)}'\n" for segment, _ in segments),
+            encoding="utf-8"
+        )
+        
+        try:
+            # Each worker only waits on its ffmpeg, so threads are enough
+            with ThreadPoolExecutor(max_workers=len(segments)) as executor:
+                list(executor.map(_run_ffmpeg, [cmd for _, cmd in segments]))
+            
+            _run_ffmpeg([
+                *_ENCODE_HEAD[:-1], "-f", "concat", "-safe", "0", "-i", str(concat_list),
+                "-i", str(in_video), "-map", "0:v:0", "-map", "1:a:0?",
+                "-c:v", "copy", *_ENCODE_TAIL, str(out_video)
+            ])
+        except subprocess.CalledProcessError as e:
+            stderr_tail = (e.stderr or "")[-800:]
+            raise RenderError(f"Parallel video encoding failed\n{stderr_tail}")
+
+
+def _concat_quote(path: Path) -> str:
+    """Escape a path for a single-quoted concat demuxer ``file`` line."""
+    return os.fspath(path).replace("'", "'\\''")
+
+
+def _run_ffmpeg(cmd: List[str], capture_stdout: bool = False) -> Optional[bytes]:
+    """
+    Run an ffmpeg/ffprobe command keeping only the tail of its stderr.
+    
+    A daemon thread drains stderr into a bounded deque, so long verbose
+    encodes neither fill the pipe nor accumulate their whole log in memory.
+    Pipes are binary; stderr is only decoded when the command fails.
+    
+    Args:
+        cmd: Command to run
+        capture_stdout: Return stdout instead of discarding it
+    
+    Returns:
+        Captured stdout bytes, or None
+    
+    Raises:
+        subprocess.CalledProcessError: Non-zero exit; ``stderr`` holds the tail
+    """
+    
+    # With an absolute executable and close_fds=False, subprocess launches via
+    # posix_spawn instead of fork+exec, which stays cheap however large this
+    # process has grown. Our own descriptors are non-inheritable (PEP 446).
+    proc = subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        close_fds=False
+    )
+    stderr_tail = deque(maxlen=_STDERR_TAIL_LINES)
+    drain = threading.Thread(target=stderr_tail.extend, args=(proc.stderr,), daemon=True)
+    drain.start()
+    
+    stdout = proc.stdout.read() if capture_stdout else None
+    proc.wait()
+    drain.join()
+    proc.stderr.close()
+    if capture_stdout:
+        proc.stdout.close()
+    
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, output=stdout,
+                                            stderr=b"".join(stderr_tail).decode("utf-8", "replace"))
+    return stdout
+
+
+def _is_delivery_format(video_path: Path) -> bool:
+    """
+    Check whether a video can be delivered without re-encoding.
+    
+    Args:
+        video_path: Path to video file
+    
+    Returns:
+        True if the video is H.264 yuv420p with AAC audio
+    """
+    
+    try:
+        info = _probe_info(video_path)
+    except RenderError:
+        return False
+    
+    streams = info.get("streams", [])
+    video_ok = any(
+        stream.get("codec_type") == "video"
+        and stream.get("codec_name") == "h264"
+        and stream.get("pix_fmt") == "yuv420p"
+        for stream in streams
+    )
+    audio_ok = any(
+        stream.get("codec_type") == "audio" and stream.get("codec_name") in ["aac", "mp4a"]
+        for stream in streams
+    )
+    return video_ok and audio_ok
+
+
+def _mp4_boxes(f, pos: int, end: int):
+    """
+    Yield ``(kind, payload_start, box_end)`` for the boxes between ``pos`` and ``end``.
+    
+    Only box headers are read; payloads are skipped by seeking.
+    """
+    
+    while pos + 8 <= end:
+        f.seek(pos)
+        size, kind = struct.unpack(">I4s", f.read(8))
+        header = 8
+        if size == 1:
+            size = struct.unpack(">Q", f.read(8))[0]
+            header = 16
+        elif size == 0:
+            size = end - pos
+        if size < header:
+            return
+        yield kind, pos + header, min(pos + size, end)
+        pos += size
+
+
+def _mp4_find(f, pos: int, end: int, *path: bytes) -> Optional[Tuple[int, int]]:
+    """Follow a chain of box types from ``pos``; returns the last box's payload span."""
+    
+    for wanted in path:
+        for kind, payload, box_end in _mp4_boxes(f, pos, end):
+            if kind == wanted:
+                pos, end = payload, box_end
+                break
+        else:
+            return None
+    return pos, end
+
+
+def _mp4_duration(video_path: Path) -> Optional[float]:
+    """
+    Read the movie duration from an MP4/MOV ``mvhd`` box without ffprobe.
+    
+    Args:
+        video_path: Path to video file
+    
+    Returns:
+        Duration in seconds, or None if the box cannot be found or parsed
+    """
+    
+    try:
+        with open(video_path, "rb") as f:
+            mvhd = _mp4_find(f, 0, os.fstat(f.fileno()).st_size, b"moov", b"mvhd")
+            if mvhd is None:
+                return None
+            f.seek(mvhd[0])
+            
+            version = f.read(4)[0]  # version byte + 3 flag bytes
+            if version == 1:
+                f.seek(16, os.SEEK_CUR)  # 64-bit creation/modification times
+                timescale, duration = struct.unpack(">IQ", f.read(12))
+                unknown = 0xFFFFFFFFFFFFFFFF
+            else:
+                f.seek(8, os.SEEK_CUR)
+                timescale, duration = struct.unpack(">II", f.read(8))
+                unknown = 0xFFFFFFFF
+    except (OSError, struct.error, IndexError):
+        return None
+    
+    if not timescale or duration in (0, unknown):
+        return None
+    return duration / timescale
+
+
+def _mp4_codec_tags(video_path: Path) -> Optional[List[Tuple[str, str]]]:
+    """
+    Read each track's handler and sample entry tag from the MP4 ``moov`` box.
+    
+    Args:
+        video_path: Path to video file
+    
+    Returns:
+        ``(handler, codec tag)`` per track, e.g. ``("vide", "avc1")`` and
+        ``("soun", "mp4a.40")``, or None if the file cannot be parsed
+    """
+    
+    tracks = []
+    try:
+        with open(video_path, "rb") as f:
+            moov = _mp4_find(f, 0, os.fstat(f.fileno()).st_size, b"moov")
+            if moov is None:
+                return None
+            traks = [(start, stop) for kind, start, stop in _mp4_boxes(f, *moov) if kind == b"trak"]
+            for trak in traks:
+                mdia = _mp4_find(f, *trak, b"mdia")
+                hdlr = mdia and _mp4_find(f, *mdia, b"hdlr")
+                stsd = mdia and _mp4_find(f, *mdia, b"minf", b"stbl", b"stsd")
+                if not (hdlr and stsd):
+                    return None
+                f.seek(hdlr[0] + 8)  # version/flags, pre_defined
+                handler = f.read(4)
+                f.seek(stsd[0] + 8)  # version/flags, entry count
+                entry_size, tag = struct.unpack(">I4s", f.read(8))
+                if len(handler) < 4:
+                    return None
+                tag = tag.decode("latin-1")
+                if tag == "mp4a":
+                    # mp4a covers AAC and MP3 alike; only the esds tells them apart
+                    entry_end = min(stsd[0] + 8 + entry_size, stsd[1])
+                    object_type = _mp4a_object_type(f, stsd[0] + 8, entry_end)
+                    if object_type is None:
+                        return None
+                    tag = f"mp4a.{object_type:02x}"
+                tracks.append((handler.decode("latin-1"), tag))
+    except (OSError, struct.error):
+        return None
+    
+    return tracks
+
+
+def _mp4a_object_type(f, entry_start: int, entry_end: int) -> Optional[int]:
+    """
+    Read the objectTypeIndication from an ``mp4a`` sample entry's ``esds`` box.
+    
+    Args:
+        f: Open MP4 file
+        entry_start: Offset of the sample entry (its size field)
+        entry_end: End offset of the sample entry
+    
+    Returns:
+        The objectTypeIndication (0x40 for AAC, 0x6B for MP3), or None
+    """
+    
+    # QuickTime sound entry versions 1 and 2 extend the fixed fields
+    f.seek(entry_start + 16)
+    version = struct.unpack(">H", f.read(2))[0]
+    children = entry_start + 36 + {0: 0, 1: 16, 2: 36}.get(version, 0)
+    esds = (_mp4_find(f, children, entry_end, b"esds")
+            or _mp4_find(f, children, entry_end, b"wave", b"esds"))
+    if esds is None:
+        return None
+    
+    f.seek(esds[0] + 4)  # version/flags
+    data = f.read(min(esds[1] - esds[0] - 4, 512))
+    pos = 0
+    
+    def descriptor(expected: int) -> bool:
+        nonlocal pos
+        if pos >= len(data) or data[pos] != expected:
+            return False
+        pos += 1
+        for _ in range(4):  # expandable size: 7 bits per byte
+            if pos >= len(data):
+                return False
+            pos += 1
+            if not data[pos - 1] & 0x80:
+                break
+        return True
+    
+    if not descriptor(0x03) or pos + 3 > len(data):  # ES_Descriptor
+        return None
+    flags = data[pos + 2]
+    pos += 3  # ES_ID, flags
+    if flags & 0x80:  # streamDependenceFlag
+        pos += 2
+    if flags & 0x40:  # URL_Flag
+        if pos >= len(data):
+            return None
+        pos += 1 + data[pos]
+    if flags & 0x20:  # OCRstreamFlag
+        pos += 2
+    if not descriptor(0x04) or pos >= len(data):  # DecoderConfigDescriptor
+        return None
+    return data[pos]
+
+
+def _get_video_duration(video_path: Path) -> float:
+    """
+    Get video duration, from the MP4 header when possible, else using ffprobe.
+    
+    Args:
+        video_path: Path to video file
+    
+    Returns:
+        Duration in seconds
+    """
+    
+    if video_path.suffix.lower() in _MP4_SUFFIXES:
+        duration = _mp4_duration(video_path)
+        if duration is not None:
+            return duration
+    
+    try:
+        duration_value = _probe_info(video_path).get("format", {}).get("duration")
+        if duration_value is None:
+            raise ValueError("Duration missing from ffprobe output")
+        return float(duration_value)
     except (ValueError, TypeError) as e:
         raise RenderError(f"Invalid duration value: {e}")
 
@@ -259,15 +1140,49 @@ def get_video_info(video_path: Path) -> Dict[str, Any]:
         Dictionary with video information
     """
     
-    cmd = [
-        "ffprobe", "-v", "quiet", "-print_format", "json",
-        "-show_format", "-show_streams", str(video_path)
-    ]
+    return copy.deepcopy(_probe_info(video_path, full=True))
+
+
+def _probe_info(video_path: Path, full: bool = False) -> Dict[str, Any]:
+    """
+    Return ffprobe's format/stream JSON, shared until the file changes.
+    
+    The reduced field set is read with PyAV when it is installed.
+    
+    Callers must treat the result as read-only; ``get_video_info`` hands out copies.
+    
+    Args:
+        video_path: Path to video file
+        full: Every format/stream field instead of only ``_PROBE_ENTRIES``
+    
+    Returns:
+        Parsed ffprobe output
+    """
+    
+    try:
+        st = os.stat(video_path)
+    except OSError as e:
+        raise RenderError(f"ffprobe failed\n{e}")
+    return _probe_cached(os.fspath(video_path), st.st_mtime_ns, st.st_size, full)
+
+
+@lru_cache(maxsize=64)
+def _probe_cached(path_str: str, mtime_ns: int, size: int, full: bool) -> Dict[str, Any]:
+    """Run ffprobe once per (path, mtime, size, full); errors are not cached."""
+    
+    if not full and av is not None:
+        info = _av_probe(path_str)
+        if info is not None:
+            return info
+    
+    if full:
+        entries = ["-show_format", "-show_streams"]
+    else:
+        entries = ["-show_entries", _PROBE_ENTRIES]
+    cmd = [_FFPROBE, "-v", "quiet", "-of", "json=c=1", *entries, path_str]
     
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        import json
-        return json.loads(result.stdout)
+        return _json.loads(_run_ffmpeg(cmd, capture_stdout=True))
     except subprocess.CalledProcessError as e:
         stderr_tail = (e.stderr or "")[-800:]
         raise RenderError(f"ffprobe failed\n{stderr_tail}")
@@ -277,6 +1192,71 @@ def get_video_info(video_path: Path) -> Dict[str, Any]:
         raise RenderError("ffprobe not found. Please install FFmpeg.")
 
 
+def _av_probe(path_str: str) -> Optional[Dict[str, Any]]:
+    """
+    Read the ``_PROBE_ENTRIES`` fields in-process with PyAV.
+    
+    Values are shaped like ffprobe's JSON (durations as strings) so callers
+    cannot tell the two apart.
+    
+    Args:
+        path_str: Path to video file
+    
+    Returns:
+        ffprobe-style info, or None to fall back to ffprobe
+    """
+    
+    try:
+        with av.open(path_str) as container:
+            streams = []
+            for stream in container.streams:
+                entry = {"codec_name": stream.codec_context.name, "codec_type": stream.type}
+                if stream.type == "video" and stream.codec_context.pix_fmt:
+                    entry["pix_fmt"] = stream.codec_context.pix_fmt
+                if stream.duration is not None and stream.time_base is not None:
+                    entry["duration"] = f"{float(stream.duration * stream.time_base):.6f}"
+                streams.append(entry)
+            info = {"streams": streams, "format": {}}
+            if container.duration is not None:
+                info["format"]["duration"] = f"{container.duration / av.time_base:.6f}"
+            return info
+    except Exception:
+        # Anything PyAV cannot open is left for ffprobe to report
+        return None
+
+
+def _stream_codecs(video_path: Path) -> Optional[Tuple[List[str], List[str]]]:
+    """
+    List the video and audio codecs of a file, named as ffprobe names them.
+    
+    MP4 sample entries are read directly; other containers are probed.
+    
+    Args:
+        video_path: Path to video file
+    
+    Returns:
+        (video codecs, audio codecs), or None if the file cannot be read
+    """
+    
+    if Path(video_path).suffix.lower() in _MP4_SUFFIXES:
+        tracks = _mp4_codec_tags(video_path)
+        if tracks is not None:
+            return ([_MP4_CODEC_NAMES.get(t, t) for h, t in tracks if h == "vide"],
+                    [_MP4_CODEC_NAMES.get(t, t) for h, t in tracks if h == "soun"])
+    
+    try:
+        streams = _probe_info(video_path).get("streams", [])
+    except RenderError:
+        return None
+    codecs = {"video": [], "audio": []}
+    for stream in streams:
+        kind = stream.get("codec_type")
+        if kind in codecs:
+            name = stream.get("codec_name", "").lower()
+            codecs[kind].append(_MP4_CODEC_NAMES.get(name, name))
+    return codecs["video"], codecs["audio"]
+
+
 def video_has_expected_codecs(video_path: Path) -> bool:
     """
     Check if video has expected codecs (h264 + aac).
@@ -288,26 +1268,8 @@ def video_has_expected_codecs(video_path: Path) -> bool:
         True if video has h264 video and aac audio codecs
     """
     
-    try:
-        info = get_video_info(video_path)
-        
-        # Check for video and audio streams with expected codecs
-        has_h264_video = False
-        has_aac_audio = False
-        
-        for stream in info.get("streams", []):
-            codec_name = stream.get("codec_name", "").lower()
-            codec_type = stream.get("codec_type", "")
-            
-            if codec_type == "video" and codec_name == "h264":
-                has_h264_video = True
-            elif codec_type == "audio" and codec_name in ["aac", "mp4a"]:
-                has_aac_audio = True
-        
-        return has_h264_video and has_aac_audio
-        
-    except Exception:
-        return False
+    codecs = _stream_codecs(video_path)
+    return codecs is not None and "h264" in codecs[0] and "aac" in codecs[1]
 
 
 def validate_output(video_path: Path) -> bool:
@@ -321,29 +1283,13 @@ def validate_output(video_path: Path) -> bool:
         True if video is valid, False otherwise
     """
     
-    try:
-        info = get_video_info(video_path)
-        
-        # Check for video and audio streams
-        has_video = False
-        has_audio = False
-        
-        for stream in info.get("streams", []):
-            if stream.get("codec_type") == "video":
-                has_video = True
-                # Check codec
-                if stream.get("codec_name") != "h264":
-                    return False
-            elif stream.get("codec_type") == "audio":
-                has_audio = True
-                # Check codec
-                if stream.get("codec_name") not in ["aac", "mp4a"]:
-                    return False
-        
-        return has_video and has_audio
-        
-    except Exception:
+    codecs = _stream_codecs(video_path)
+    if codecs is None:
         return False
+    video, audio = codecs
+    return (bool(video) and bool(audio)
+            and all(c == "h264" for c in video)
+            and all(c == "aac" for c in audio))
 
 
 # Legacy functions for backward compatibility
@@ -357,19 +1303,19 @@ def process_voice_audio(voice_path: Path, output_path: Path,
         output_path: Path to output normalized audio
         target_dbfs: Target dBFS level
     """
-    if not voice_path.exists():
-        raise RenderError(f"Voice audio file not found: {voice_path}")
+    _require_files(voice_audio=voice_path)
     
-    # Use FFmpeg for normalization
-    cmd = [
-        "ffmpeg", "-y", "-i", str(voice_path),
-        "-af", f"loudnorm=I={target_dbfs}:TP=-1.0:LRA=11",
-        "-c:a", "pcm_s24le",
-        str(output_path)
-    ]
+    # Two-pass loudnorm; the measurement is cached beside the voice file
+    config = {"audio": {"target_lufs": target_dbfs, "target_tp": -1.0, "target_lra": 11.0}}
     
     try:
-        subprocess.run(cmd, check=True, capture_output=True, text=True)
+        cmd = [
+            _FFMPEG, "-y", "-threads", "0", "-nostats", "-loglevel", "error", "-i", str(voice_path),
+            "-af", two_pass_loudnorm_filter(voice_path, config),
+            *audio_codec_args(output_path, "pcm_s24le"),
+            str(output_path)
+        ]
+        _run_ffmpeg(cmd)
     except subprocess.CalledProcessError as e:
         stderr_tail = (e.stderr or "")[-800:]
         raise RenderError(f"Voice audio processing failed\n{stderr_tail}")
@@ -396,7 +1342,7 @@ def mix_audio_tracks(voice_path: Path, music_path: Path, output_path: Path,
     )
     
     cmd = [
-        "ffmpeg", "-y",
+        _FFMPEG, "-y", "-threads", "0", "-nostats", "-loglevel", "error",
         "-i", str(voice_path),
         "-i", str(music_path),
         "-filter_complex", filter_complex,
@@ -406,7 +1352,7 @@ def mix_audio_tracks(voice_path: Path, music_path: Path, output_path: Path,
     ]
     
     try:
-        subprocess.run(cmd, check=True, capture_output=True, text=True)
+        _run_ffmpeg(cmd)
     except subprocess.CalledProcessError as e:
         stderr_tail = (e.stderr or "")[-800:]
         raise RenderError(f"Audio mixing failed\n{stderr_tail}")
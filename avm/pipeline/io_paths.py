@@ -4,15 +4,39 @@ Path helpers and cache management for AVM pipeline.
 
 import hashlib
 import json
+import mmap
 import os
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Tuple, Union
 from datetime import datetime
 
+try:
+    import blake3
+except ImportError:  # pragma: no cover - optional speedup
+    blake3 = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# Files at least this large are hashed through mmap instead of buffered reads
+_HASH_MMAP_THRESHOLD = 8 * 1024 * 1024
+
+# Concurrent file hashes in _hash_many
+_HASH_WORKERS = os.cpu_count() or 8
+
+# (path, st_mtime_ns, st_size) -> content hash; seeded from each loaded
+# manifest's "stat_hash_cache" so unchanged files are hashed once ever
+_HASH_CACHE: Dict[Tuple[str, int, int], str] = {}
+
 
 class ProjectPaths:
-    """Manages file paths for a project."""
+    """Manages file paths for a project (each path is built once, on first use)."""
     
     def __init__(self, project_root: Path, slug: str):
         self.project_root = project_root
@@ -36,82 +60,82 @@ class ProjectPaths:
         for directory in directories:
             directory.mkdir(parents=True, exist_ok=True)
     
-    @property
+    @cached_property
     def audio_wav(self) -> Path:
         """Path to input audio file."""
         return self.project_dir / "audio.wav"
     
-    @property
+    @cached_property
     def slides_md(self) -> Path:
         """Path to slides markdown file."""
         return self.project_dir / "slides.md"
     
-    @property
+    @cached_property
     def config_yml(self) -> Path:
         """Path to project config file."""
         return self.project_dir / "config.yml"
     
-    @property
+    @cached_property
     def captions_srt(self) -> Path:
         """Path to captions SRT file."""
         return self.build_dir / "captions.srt"
     
-    @property
+    @cached_property
     def captions_words_json(self) -> Path:
         """Path to word-level captions JSON."""
         return self.build_dir / "captions_words.json"
     
-    @property
+    @cached_property
     def slides_dir(self) -> Path:
         """Path to slides directory."""
         return self._slides_dir
     
-    @property
+    @cached_property
     def timeline_json(self) -> Path:
         """Path to timeline JSON."""
         return self.build_dir / "timeline.json"
     
-    @property
+    @cached_property
     def video_nocap_mp4(self) -> Path:
         """Path to video without captions."""
         return self.build_dir / "video_nocap.mp4"
     
-    @property
+    @cached_property
     def video_audio_mp4(self) -> Path:
         """Path to video with audio (no captions)."""
         return self.build_dir / "video_audio.mp4"
     
-    @property
+    @cached_property
     def voice_norm_wav(self) -> Path:
         """Path to normalized voice audio."""
         return self.build_dir / "voice_norm.wav"
     
-    @property
+    @cached_property
     def music_ducked_wav(self) -> Path:
         """Path to ducked music audio."""
         return self.build_dir / "music_ducked.wav"
     
-    @property
+    @cached_property
     def final_mp4(self) -> Path:
         """Path to final video output."""
         return self.build_dir / "final.mp4"
     
-    @property
+    @cached_property
     def thumb_png(self) -> Path:
         """Path to thumbnail."""
         return self.build_dir / "thumb.png"
     
-    @property
+    @cached_property
     def manifest_json(self) -> Path:
         """Path to build manifest."""
         return self.build_dir / "manifest.json"
     
-    @property
+    @cached_property
     def temp_dir(self) -> Path:
         """Path to temporary files directory."""
         return self.build_dir / "temp"
     
-    @property
+    @cached_property
     def cache_dir(self) -> Path:
         """Path to cache directory."""
         return self.build_dir / "cache"
@@ -129,21 +153,85 @@ class ProjectPaths:
         return self.cache_dir / name
 
 
-def file_hash(file_path: Path) -> str:
-    """Calculate SHA256 hash of a file."""
-    if not file_path.exists():
-        return ""
+def _stat_or_none(file_path: Path) -> Optional[os.stat_result]:
+    """Stat a file, returning None if it does not exist or cannot be read."""
+    try:
+        return os.stat(file_path)
+    except OSError:
+        return None
+
+
+def file_hash(file_path: Path, st: Optional[os.stat_result] = None) -> str:
+    """
+    Calculate a content hash of a file (BLAKE3 if installed, else SHA256).
+    
+    Args:
+        file_path: File to hash
+        st: Stat result already taken for ``file_path``, to avoid another stat
+        
+    Returns:
+        Hex digest, or an empty string if the file is missing or unreadable
+    """
+    if st is None:
+        st = _stat_or_none(file_path)
+        if st is None:
+            return ""
     
-    sha256_hash = hashlib.sha256()
     try:
+        if blake3 is not None:
+            # Memory-mapped and hashed across all cores
+            hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            hasher.update_mmap(file_path)
+            return hasher.hexdigest()
+        
         with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
-    except (IOError, OSError):
+            if st.st_size >= _HASH_MMAP_THRESHOLD:
+                # Large media: hash straight from the page cache in one update
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                        return hashlib.sha256(data).hexdigest()
+                except (ValueError, OSError):
+                    pass  # not mappable (e.g. some network filesystems)
+            # Read/update loop runs in C with a large buffer and the GIL released
+            return hashlib.file_digest(f, "sha256").hexdigest()
+    except (IOError, OSError, ValueError):
         return ""
 
 
+def _cached_file_hash(file_path: Path, st: Optional[os.stat_result] = None) -> str:
+    """``file_hash`` memoized on the file's (path, mtime_ns, size)."""
+    if st is None:
+        st = _stat_or_none(file_path)
+        if st is None:
+            return ""
+    
+    key = (str(file_path), st.st_mtime_ns, st.st_size)
+    digest = _HASH_CACHE.get(key)
+    if digest is None:
+        digest = file_hash(file_path, st)
+        if digest:
+            _HASH_CACHE[key] = digest
+    return digest
+
+
+def _hash_many(stats: Dict[Path, os.stat_result]) -> Dict[str, str]:
+    """
+    Hash several files concurrently; hashlib releases the GIL while digesting.
+    
+    Args:
+        stats: Mapping of file paths to their current stat results
+        
+    Returns:
+        Mapping of path strings to content hashes
+    """
+    if not stats:
+        return {}
+    paths = list(stats)
+    with ThreadPoolExecutor(max_workers=min(_HASH_WORKERS, len(paths))) as executor:
+        digests = executor.map(_cached_file_hash, paths, stats.values())
+        return {str(p): digest for p, digest in zip(paths, digests)}
+
+
 def config_hash(config: Dict[str, Any]) -> str:
     """Calculate hash of configuration for caching purposes."""
     # Create a deterministic string representation of config
@@ -159,6 +247,34 @@ def file_mtime(file_path: Path) -> float:
         return 0.0
 
 
+def playwright_browsers_dir() -> Optional[Path]:
+    """Return Playwright's browser cache directory, or None when browsers live in the package."""
+    override = os.environ.get("PLAYWRIGHT_BROWSERS_PATH")
+    if override:
+        return None if override == "0" else Path(override)
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "ms-playwright"
+    if sys.platform.startswith("win"):
+        local_app_data = os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local")
+        return Path(local_app_data) / "ms-playwright"
+    return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "ms-playwright"
+
+
+def _stat_key(st: os.stat_result) -> List[int]:
+    """Identity of a file version: (mtime_ns, size, inode), JSON-friendly."""
+    return [st.st_mtime_ns, st.st_size, st.st_ino]
+
+
+def _existing_stats(paths: List[Path]) -> Dict[Path, os.stat_result]:
+    """Stat each path, skipping files that do not exist."""
+    stats = {}
+    for path in paths:
+        st = _stat_or_none(path)
+        if st is not None:
+            stats[path] = st
+    return stats
+
+
 def is_file_newer(file_path: Path, reference_time: float) -> bool:
     """Check if file is newer than reference time."""
     return file_mtime(file_path) > reference_time
@@ -174,10 +290,18 @@ def load_manifest(build_dir: Path) -> Dict[str, Any]:
     manifest_path = build_dir / "manifest.json"
     if manifest_path.exists():
         try:
-            with open(manifest_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            data = manifest_path.read_bytes()
+            manifest = orjson.loads(data) if orjson is not None else json.loads(data)
         except (json.JSONDecodeError, IOError, UnicodeDecodeError):
             pass
+        else:
+            for path_str, entry in manifest.get("stat_hash_cache", {}).items():
+                try:
+                    mtime_ns, size, digest = entry
+                except (TypeError, ValueError):
+                    continue
+                _HASH_CACHE[(path_str, mtime_ns, size)] = digest
+            return manifest
     return {
         "created_at": datetime.now().isoformat(),
         "version": "1.0.0",
@@ -202,20 +326,35 @@ def save_manifest(build_dir: Path, manifest: Dict[str, Any]) -> None:
     manifest["updated_at"] = datetime.now().isoformat()
     manifest["version"] = manifest.get("version", "1.0.0")
     
+    # Write beside the manifest and swap it in, so a crash mid-write leaves
+    # the previous manifest intact instead of a truncated one
+    tmp_path = manifest_path.with_suffix(".json.tmp")
     try:
-        with open(manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            data = orjson.dumps(manifest, option=orjson.OPT_SORT_KEYS)
+        else:
+            data = json.dumps(manifest, separators=(',', ':'), ensure_ascii=False,
+                              sort_keys=True).encode('utf-8')
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, manifest_path)
     except (IOError, OSError) as e:
+        tmp_path.unlink(missing_ok=True)
         raise IOError(f"Failed to save manifest: {e}")
 
 
 def should_skip_step(step_name: str, manifest: Dict[str, Any], 
                     input_files: List[Path], output_files: List[Path] = None,
-                    config_hash: str = None, force: bool = False) -> bool:
+                    config_hash: str = None, force: bool = False,
+                    strict: bool = False) -> bool:
     """
     Determine if a pipeline step should be skipped due to caching.
     
-    Uses file modification times and content hashing (SHA256) for cache validation.
+    Inputs whose mtime and size match the manifest are accepted without
+    reading them; content hashes (see ``file_hash``) are only compared for
+    files whose stat changed, or for every input with ``strict``.
     
     Args:
         step_name: Name of the pipeline step
@@ -224,6 +363,7 @@ def should_skip_step(step_name: str, manifest: Dict[str, Any],
         output_files: List of output file paths (optional)
         config_hash: Configuration hash for this step (optional)
         force: Force recomputation even if cached
+        strict: Verify every input's content hash, even with unchanged stat
         
     Returns:
         True if step should be skipped, False if it should run
@@ -240,23 +380,32 @@ def should_skip_step(step_name: str, manifest: Dict[str, Any],
     # Check if any input files are missing or newer than cached versions
     cached_input_hashes = step_info.get("input_hashes", {})
     cached_input_mtimes = step_info.get("input_mtimes", {})
+    cached_input_stats = step_info.get("input_stats", {})
+    latest_input_mtime = 0.0
     
     for file_path in input_files:
         file_str = str(file_path)
         
-        # Check if file exists
-        if not file_path.exists():
+        # One stat per input covers existence, mtime and size
+        st = _stat_or_none(file_path)
+        if st is None:
             return False
+        latest_input_mtime = max(latest_input_mtime, st.st_mtime)
+        
+        # Same mtime and size as when hashed: accept without reading the file
+        cached_stat = cached_input_stats.get(file_str)
+        if not strict and cached_stat and cached_stat[:2] == _stat_key(st)[:2]:
+            continue
         
         # Check modification time (fast check)
-        current_mtime = file_mtime(file_path)
+        current_mtime = st.st_mtime
         cached_mtime = cached_input_mtimes.get(file_str, 0.0)
         
         if current_mtime > cached_mtime:
             return False
         
         # Check content hash (thorough check)
-        current_hash = file_hash(file_path)
+        current_hash = file_hash(file_path, st) if strict else _cached_file_hash(file_path, st)
         cached_hash = cached_input_hashes.get(file_str, "")
         
         if current_hash != cached_hash:
@@ -264,14 +413,13 @@ def should_skip_step(step_name: str, manifest: Dict[str, Any],
     
     # Check if all output files exist and are newer than inputs
     if output_files:
-        latest_input_mtime = max((file_mtime(f) for f in input_files if f.exists()), default=0.0)
-        
         for output_file in output_files:
-            if not output_file.exists():
+            st = _stat_or_none(output_file)
+            if st is None:
                 return False
             
             # Output should be newer than all inputs
-            if file_mtime(output_file) <= latest_input_mtime:
+            if st.st_mtime <= latest_input_mtime:
                 return False
     
     # Check configuration hash if provided
@@ -297,23 +445,25 @@ def update_manifest_step(manifest: Dict[str, Any], step_name: str,
         duration_ms: Duration of the step in milliseconds
         config_hash: Configuration hash for this step (optional)
     """
-    # Calculate hashes and modification times for input files
-    input_hashes = {}
-    input_mtimes = {}
-    for file_path in input_files:
-        if file_path.exists():
-            file_str = str(file_path)
-            input_hashes[file_str] = file_hash(file_path)
-            input_mtimes[file_str] = file_mtime(file_path)
-    
-    # Calculate hashes and modification times for output files
-    output_hashes = {}
-    output_mtimes = {}
-    for file_path in output_files:
-        if file_path.exists():
-            file_str = str(file_path)
-            output_hashes[file_str] = file_hash(file_path)
-            output_mtimes[file_str] = file_mtime(file_path)
+    # Stat every file up front; missing files are left out of the maps
+    input_stats = _existing_stats(input_files)
+    output_stats = _existing_stats(output_files)
+    
+    # Hash all files concurrently so their reads overlap
+    stats = {**input_stats, **output_stats}
+    hashes = _hash_many(stats)
+    
+    # Persist the stat -> hash pairs so the next run can skip these files
+    stat_hash_cache = manifest.setdefault("stat_hash_cache", {})
+    for path, st in stats.items():
+        digest = hashes[str(path)]
+        if digest:
+            stat_hash_cache[str(path)] = [st.st_mtime_ns, st.st_size, digest]
+    
+    input_hashes = {str(p): hashes[str(p)] for p in input_stats}
+    input_mtimes = {str(p): st.st_mtime for p, st in input_stats.items()}
+    output_hashes = {str(p): hashes[str(p)] for p in output_stats}
+    output_mtimes = {str(p): st.st_mtime for p, st in output_stats.items()}
     
     # Ensure steps dictionary exists
     if "steps" not in manifest:
@@ -328,6 +478,8 @@ def update_manifest_step(manifest: Dict[str, Any], step_name: str,
         "output_hashes": output_hashes,
         "input_mtimes": input_mtimes,
         "output_mtimes": output_mtimes,
+        "input_stats": {str(p): _stat_key(st) for p, st in input_stats.items()},
+        "output_stats": {str(p): _stat_key(st) for p, st in output_stats.items()},
         "duration_ms": duration_ms,
         "config_hash": config_hash or "",
         "status": "completed"
@@ -412,6 +564,10 @@ def validate_build_artifacts(build_dir: Path) -> Dict[str, List[str]]:
         "stale_files": []
     }
     
+    # Outputs whose stat changed, with the hash recorded for them
+    to_verify = {}
+    expected = {}
+    
     for step_name, step_info in steps.items():
         if step_info.get("status") != "completed":
             continue
@@ -419,20 +575,28 @@ def validate_build_artifacts(build_dir: Path) -> Dict[str, List[str]]:
         # Check output files
         output_files = step_info.get("output_files", [])
         cached_hashes = step_info.get("output_hashes", {})
+        cached_stats = step_info.get("output_stats", {})
         
         for file_str in output_files:
             file_path = Path(file_str)
             
             # Check if file exists
-            if not file_path.exists():
+            try:
+                st = file_path.stat()
+            except OSError:
                 results["missing_files"].append(file_str)
                 continue
             
-            # Check if file hash matches
-            current_hash = file_hash(file_path)
-            cached_hash = cached_hashes.get(file_str, "")
+            # Untouched since the manifest was written
+            if _stat_key(st) == cached_stats.get(file_str):
+                continue
             
-            if current_hash != cached_hash:
-                results["corrupted_files"].append(file_str)
+            to_verify[file_path] = st
+            expected[file_str] = cached_hashes.get(file_str, "")
+    
+    # Check if file hashes match
+    for file_str, current_hash in _hash_many(to_verify).items():
+        if current_hash != expected[file_str]:
+            results["corrupted_files"].append(file_str)
     
     return results
\ No newline at end of file
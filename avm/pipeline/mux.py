@@ -3,8 +3,9 @@
 import json
 import logging
 import subprocess
+import tempfile
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
 from .errors import MuxError
 from .logging import Timer
@@ -42,7 +43,7 @@ def mux_audio_video(video_nocap: Path, voice_norm_wav: Path, music_ducked_wav: O
     try:
         with Timer(logger, "mux_audio", project, "Muxing audio and video"):
             # Build FFmpeg command
-            cmd = ["ffmpeg", "-y"]
+            cmd = ["ffmpeg", "-y", "-threads", "0", "-nostats", "-loglevel", "error"]
             
             # Input files
             cmd.extend(["-i", str(video_nocap)])
@@ -87,7 +88,8 @@ def mux_audio_video(video_nocap: Path, voice_norm_wav: Path, music_ducked_wav: O
             cmd.append(str(out_no_subs_mp4))
             
             # Execute command
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+            subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL,
+                           stderr=subprocess.PIPE, text=True)
             
             duration = probe_video_duration(out_no_subs_mp4)
             
@@ -106,6 +108,104 @@ def mux_audio_video(video_nocap: Path, voice_norm_wav: Path, music_ducked_wav: O
         raise MuxError(f"Audio/video muxing error: {e}")
 
 
+def mux_audio_graph(video_nocap: Path, voice_wav: Path, music_wav: Optional[Path],
+                    out_no_subs_mp4: Path, config: Optional[Dict[str, Any]] = None,
+                    logger=None, project: str = "") -> float:
+    """
+    Master the raw voice/music and mux them with the video in one ffmpeg run.
+    
+    Replaces ``process_audio`` + ``mux_audio_video``: loudnorm, ducking, mix
+    and limiter run as a single filter_complex, so no intermediate WAVs are
+    written.
+    
+    Args:
+        video_nocap: Path to video without audio
+        voice_wav: Path to raw voice audio
+        music_wav: Path to raw background music (optional)
+        out_no_subs_mp4: Path to output video without subtitles
+        config: Project configuration
+        logger: Logger instance
+        project: Project name for logging
+    
+    Returns:
+        Duration of the final video in seconds
+    """
+    
+    if not video_nocap.exists():
+        raise MuxError(f"Video file not found: {video_nocap}")
+    
+    if not voice_wav.exists():
+        raise MuxError(f"Voice audio file not found: {voice_wav}")
+    
+    config = config or {}
+    if not (music_wav and music_wav.exists()):
+        music_wav = None
+    
+    try:
+        with Timer(logger, "mux_audio", project, "Mastering audio and muxing with video"):
+            cmd = build_mux_audio_graph_cmd(video_nocap, voice_wav, music_wav,
+                                            out_no_subs_mp4, config)
+            subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL,
+                           stderr=subprocess.PIPE, text=True)
+            
+            duration = probe_video_duration(out_no_subs_mp4)
+            
+            if logger:
+                logger.info(f"Successfully muxed audio and video: {out_no_subs_mp4}")
+                logger.info(f"Video duration: {duration:.2f} seconds")
+            
+            return duration
+            
+    except subprocess.CalledProcessError as e:
+        stderr_tail = (e.stderr or "")[-800:]
+        raise MuxError(f"FFmpeg muxing failed\n{stderr_tail}")
+    except FileNotFoundError:
+        raise MuxError("FFmpeg not found. Please install FFmpeg.")
+    except MuxError:
+        raise
+    except Exception as e:
+        raise MuxError(f"Audio/video muxing error: {e}")
+
+
+def build_mux_audio_graph_cmd(video_nocap: Path, voice_wav: Path, music_wav: Optional[Path],
+                              out_no_subs_mp4: Optional[Path], config: Dict[str, Any],
+                              stdout_pipe: bool = False) -> List[str]:
+    """
+    Build the ``mux_audio_graph`` ffmpeg command (runs the loudness measurement).
+    
+    Args:
+        video_nocap: Path to video without audio
+        voice_wav: Path to raw voice audio
+        music_wav: Path to raw background music, or None
+        out_no_subs_mp4: Path to output video (ignored with ``stdout_pipe``)
+        config: Project configuration
+        stdout_pipe: Emit NUT on stdout for a downstream ffmpeg instead of a file
+    
+    Returns:
+        FFmpeg argument list
+    """
+    
+    from .audio import plan_audio_graph
+    filter_complex = plan_audio_graph(voice_wav, music_wav, config)
+    
+    cmd = ["ffmpeg", "-y", "-threads", "0", "-nostats", "-loglevel", "error",
+           "-i", str(video_nocap), "-i", str(voice_wav)]
+    if music_wav is not None:
+        cmd.extend(["-i", str(music_wav)])
+    cmd.extend([
+        "-filter_complex", filter_complex,
+        "-map", "0:v:0",
+        "-map", "[aout]",
+        "-c:v", "copy",
+        "-c:a", "aac",
+        "-b:a", "192k",
+        "-ar", "48000",
+        "-ac", "2",
+    ])
+    cmd.extend(["-f", "nut", "pipe:1"] if stdout_pipe else [str(out_no_subs_mp4)])
+    return cmd
+
+
 def probe_video_duration(video_path: Path) -> float:
     """
     Get video duration using ffprobe.
@@ -202,7 +302,6 @@ def get_video_info(video_path: Path) -> Dict[str, Any]:
     
     try:
         result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        import json
         return json.loads(result.stdout)
     except subprocess.CalledProcessError as e:
         stderr_tail = (e.stderr or "")[-800:]
@@ -275,7 +374,6 @@ def create_chapter_markers(video_path: Path, timeline: Dict[str, Any],
         chapters_content += f"title=Slide {index + 1}\n"
     
     # Write chapter file
-    import tempfile
     with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
         f.write(chapters_content)
         chapter_file = f.name
@@ -283,7 +381,7 @@ def create_chapter_markers(video_path: Path, timeline: Dict[str, Any],
     try:
         # Apply chapters to video
         cmd = [
-            "ffmpeg", "-y",
+            "ffmpeg", "-y", "-threads", "0", "-nostats", "-loglevel", "error",
             "-i", str(video_path),
             "-i", chapter_file,
             "-map_metadata", "1",
@@ -291,7 +389,8 @@ def create_chapter_markers(video_path: Path, timeline: Dict[str, Any],
             str(output_path)
         ]
         
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.PIPE, text=True)
         
     except subprocess.CalledProcessError as e:
         stderr_tail = (e.stderr or "")[-800:]
@@ -315,7 +414,7 @@ def extract_thumbnail(video_path: Path, output_path: Path,
     """
     
     cmd = [
-        "ffmpeg", "-y",
+        "ffmpeg", "-y", "-threads", "0", "-nostats", "-loglevel", "error",
         "-i", str(video_path),
         "-ss", str(time_sec),
         "-vframes", "1",
@@ -324,7 +423,8 @@ def extract_thumbnail(video_path: Path, output_path: Path,
     ]
     
     try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.PIPE, text=True)
     except subprocess.CalledProcessError as e:
         stderr_tail = (e.stderr or "")[-800:]
         raise MuxError(f"Failed to extract thumbnail\n{stderr_tail}")
@@ -344,7 +444,7 @@ def create_preview_video(video_path: Path, output_path: Path,
     """
     
     cmd = [
-        "ffmpeg", "-y",
+        "ffmpeg", "-y", "-threads", "0", "-nostats", "-loglevel", "error",
         "-i", str(video_path),
         "-t", str(duration_sec),
         "-c", "copy",
@@ -352,7 +452,8 @@ def create_preview_video(video_path: Path, output_path: Path,
     ]
     
     try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.PIPE, text=True)
     except subprocess.CalledProcessError as e:
         stderr_tail = (e.stderr or "")[-800:]
         raise MuxError(f"Failed to create preview\n{stderr_tail}")
@@ -391,7 +492,7 @@ def add_watermark_overlay(video_path: Path, watermark_path: Path,
     filter_str = f"[0:v][1:v]overlay={pos}:format=auto:alpha={opacity}"
     
     cmd = [
-        "ffmpeg", "-y",
+        "ffmpeg", "-y", "-threads", "0", "-nostats", "-loglevel", "error",
         "-i", str(video_path),
         "-i", str(watermark_path),
         "-filter_complex", filter_str,
@@ -401,7 +502,8 @@ def add_watermark_overlay(video_path: Path, watermark_path: Path,
     ]
     
     try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.PIPE, text=True)
     except subprocess.CalledProcessError as e:
         stderr_tail = (e.stderr or "")[-800:]
         raise MuxError(f"Failed to add watermark\n{stderr_tail}")
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import json
 import re
 import subprocess
 import sys
 import time
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -30,19 +32,80 @@ except ImportError:  # pragma: no cover - handled at runtime
 import yaml
 
 from .errors import RenderError
+from .io_paths import playwright_browsers_dir
 from .logging import Timer
 
 _BULLET_WRAP_PATTERN = re.compile(r"<li>([^<]{80,})</li>", re.DOTALL)
 
 
-def check_playwright_installation() -> tuple[bool, str, str]:
-    """Verify that Playwright and Chromium are available."""
+def _expected_chromium_revision() -> Optional[str]:
+    """Return the Chromium revision the installed Playwright package pins, if readable."""
+
+    spec = find_spec("playwright")
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    package_dir = Path(spec.submodule_search_locations[0])
+    browsers_json = package_dir / "driver" / "package" / "browsers.json"
+    try:
+        with open(browsers_json, "r", encoding="utf-8") as f:
+            browsers = json.load(f).get("browsers", [])
+    except (OSError, ValueError, AttributeError):
+        return None
+    for browser in browsers:
+        if isinstance(browser, dict) and browser.get("name") == "chromium":
+            revision = browser.get("revision")
+            return str(revision) if revision else None
+    return None
+
+
+def _installed_chromium_build() -> Optional[Path]:
+    """Find a completely installed Chromium build in Playwright's browser cache.
+
+    Playwright writes ``INSTALLATION_COMPLETE`` into a build directory once its
+    download is unpacked. When the package's pinned revision is known only that
+    build counts; otherwise the highest installed revision is reported.
+    """
+
+    browsers_dir = playwright_browsers_dir()
+    if browsers_dir is None or not browsers_dir.is_dir():
+        return None
+
+    revision = _expected_chromium_revision()
+    if revision is not None:
+        build = browsers_dir / f"chromium-{revision}"
+        return build if (build / "INSTALLATION_COMPLETE").is_file() else None
+
+    builds = []
+    for build in browsers_dir.glob("chromium-*"):
+        suffix = build.name[len("chromium-"):]
+        if suffix.isdigit() and (build / "INSTALLATION_COMPLETE").is_file():
+            builds.append((int(suffix), build))
+    return max(builds)[1] if builds else None
+
+
+def check_playwright_installation(deep: bool = False) -> tuple[bool, str, str]:
+    """Verify that Playwright and Chromium are available.
+
+    By default this only looks for an installed Chromium build on disk;
+    ``deep=True`` launches the browser to prove it actually starts.
+    """
 
     if not PLAYWRIGHT_AVAILABLE:
         return False, "Not installed", "Playwright package not installed. Install with: pip install playwright"
 
+    if not deep:
+        build = _installed_chromium_build()
+        if build is not None:
+            return True, f"Chromium ({build.name})", ""
+
     try:
         with sync_playwright() as playwright:
+            if not deep:
+                # Resolving the path starts only the driver, not a browser
+                if Path(playwright.chromium.executable_path).exists():
+                    return True, "Chromium (installed)", ""
+                return (False, "Chromium not installed",
+                        "Chromium browser not found. Run: playwright install chromium")
             browser = playwright.chromium.launch(headless=True)
             version = browser.version()
             browser.close()
@@ -8,6 +8,12 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import timedelta
 
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover - optional speedup
+    _json = json
+
+from .captions import iter_captions_srt
 from .errors import RenderError
 
 
@@ -78,8 +84,8 @@ def _load_transcripts_from_words(words_path: Path) -> tuple[List[Dict[str, Any]]
     """
     
     try:
-        with open(words_path, 'r', encoding='utf-8') as f:
-            words_data = json.load(f)
+        with open(words_path, 'rb') as f:
+            words_data = _json.loads(f.read())
         
         if not isinstance(words_data, list):
             raise RenderError("Invalid words JSON format: expected array")
@@ -138,12 +144,8 @@ def _load_transcripts_from_srt(srt_path: Path) -> tuple[List[Dict[str, Any]], fl
     """
     
     try:
-        from .captions import load_captions_srt
-        
-        captions = load_captions_srt(srt_path)
-        
         segments = []
-        for caption in captions:
+        for caption in iter_captions_srt(srt_path):
             segments.append({
                 "text": caption["content"],
                 "start": caption["start"],
@@ -4,9 +4,12 @@ Testing utilities and golden file comparison for AVM pipeline.
 
 import json
 import hashlib
+import subprocess
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
+import yaml
+
 try:
     import cv2
     import numpy as np
@@ -213,8 +216,6 @@ def create_test_fixtures(test_dir: Path, audio_duration: float = 10.0,
 def _create_silent_audio(audio_path: Path, duration: float) -> None:
     """Create silent audio file for testing."""
     
-    import subprocess
-    
     cmd = [
         "ffmpeg", "-y", "-f", "lavfi",
         "-i", f"anullsrc=channel_layout=stereo:sample_rate=48000",
@@ -267,7 +268,6 @@ def _create_test_config(config_path: Path) -> None:
         }
     }
     
-    import yaml
     with open(config_path, 'w') as f:
         yaml.dump(config, f, default_flow_style=False)
 
@@ -296,8 +296,6 @@ def validate_video_output(video_path: Path) -> Dict[str, Any]:
         return {"valid": False, "error": "File not found"}
     
     try:
-        import subprocess
-        
         cmd = [
             "ffprobe", "-v", "quiet", "-print_format", "json",
             "-show_format", "-show_streams", str(video_path)
@@ -2,6 +2,7 @@
 Thumbnail generation using HTML templates and Playwright/Pillow.
 """
 
+import subprocess
 import tempfile
 from pathlib import Path
 from typing import Dict, Any, Optional
@@ -483,8 +484,6 @@ def create_thumbnail_from_video(video_path: Path, output_path: Path,
         time_sec: Time position in seconds
     """
     
-    import subprocess
-    
     if not video_path.exists():
         raise RenderError(f"Video file not found: {video_path}")
     
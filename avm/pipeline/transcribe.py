@@ -3,6 +3,7 @@ Audio transcription using Whisper/faster-whisper.
 """
 
 import json
+import re
 import subprocess
 import sys
 from pathlib import Path
@@ -300,7 +301,6 @@ except Exception as e:
 
 def _synthesize_word_timings(srt_path: Path, words_json_path: Path) -> None:
     """Synthesize word-level timings from SRT segments."""
-    import re
     
     word_data = []
     
@@ -0,0 +1,128 @@
+"""
+Test the in-process audio DSP path and its wiring into the export.
+"""
+
+import logging
+from pathlib import Path
+from unittest import mock
+import sys
+
+import numpy as np
+import pytest
+
+# Add the avm package to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from avm.pipeline import audio, export
+from avm.pipeline.io_paths import ProjectPaths
+
+
+def _tone(seconds: float, amplitude: float, rate: int = 48000) -> np.ndarray:
+    """Stereo 440 Hz sine as a (samples, 2) float32 array."""
+    t = np.arange(int(seconds * rate), dtype=np.float32) / rate
+    mono = (amplitude * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+    return np.stack([mono, mono], axis=1)
+
+
+def _run_process_audio(tmp_path, voice, music, config):
+    """Run process_audio with ffmpeg decode/encode replaced by in-memory arrays."""
+    voice_wav = tmp_path / "voice.wav"
+    voice_wav.write_bytes(b"")
+    music_wav = None
+    if music is not None:
+        music_wav = tmp_path / "music.wav"
+        music_wav.write_bytes(b"")
+    
+    decoded = {voice_wav: voice, music_wav: music}
+    encoded = {}
+    
+    with mock.patch.object(audio, "_decode_f32", lambda path, *args: decoded[path].copy()), \
+         mock.patch.object(audio, "_encode_f32",
+                           lambda samples, path: encoded.__setitem__(path, samples)), \
+         mock.patch.object(audio, "_get_audio_duration", lambda path: len(voice) / 48000), \
+         mock.patch.object(audio, "_measure_and_probe_voice") as measure:
+        audio.process_audio(voice_wav, music_wav, tmp_path / "voice_norm.wav",
+                            tmp_path / "music_ducked.wav", config)
+    
+    measure.assert_not_called()
+    return encoded[tmp_path / "voice_norm.wav"], encoded[tmp_path / "music_ducked.wav"]
+
+
+def test_in_process_dsp_normalizes_and_limits_voice(tmp_path):
+    """Voice is brought to the target loudness with peaks under target_tp."""
+    config = {"audio": {"in_process_dsp": True, "target_lufs": -14.0, "target_tp": -1.0}}
+    
+    voice, music = _run_process_audio(tmp_path, _tone(5.0, 0.05), None, config)
+    
+    loudness = audio._gated_loudness(voice)
+    assert loudness == pytest.approx(-14.0, abs=0.5)
+    assert np.abs(voice).max() <= 10 ** (-1.0 / 20) + 1e-6
+    
+    # No music: a silent bed of the voice length
+    assert music.shape == voice.shape
+    assert not music.any()
+
+
+def test_in_process_dsp_ducks_music_under_voice(tmp_path):
+    """Music is quieter where the voice is active than where it is silent."""
+    config = {"audio": {"in_process_dsp": True, "music_db": -6.0,
+                        "ducking": {"threshold": -30.0, "ratio": 8.0}}}
+    voice = _tone(4.0, 0.3)
+    voice[96000:] = 0.0  # voice only in the first two seconds
+    
+    _, music = _run_process_audio(tmp_path, voice, _tone(4.0, 0.3), config)
+    
+    assert len(music) == len(voice)
+    ducked_rms = np.sqrt(np.mean(np.square(music[48000:90000])))
+    open_rms = np.sqrt(np.mean(np.square(music[150000:190000])))
+    assert ducked_rms < open_rms / 2
+
+
+@pytest.mark.parametrize("in_process_dsp", [True, False])
+def test_export_routes_in_process_dsp(tmp_path, in_process_dsp):
+    """audio.in_process_dsp renders stems and muxes them; otherwise one audio graph."""
+    paths = ProjectPaths(tmp_path, "demo")
+    paths.video_nocap_mp4.write_bytes(b"")
+    paths.audio_wav.write_bytes(b"")
+    config = {"audio": {"in_process_dsp": in_process_dsp},
+              "export": {"fused": True, "streaming": True}}
+    
+    stems = (paths.voice_norm_wav, paths.music_ducked_wav)
+    with mock.patch.object(export, "process_audio", return_value=stems) as process, \
+         mock.patch.object(export, "mux_audio_video", return_value=10.0) as mux_stems, \
+         mock.patch.object(export, "mux_audio_graph", return_value=10.0) as mux_graph, \
+         mock.patch.object(export, "_fused_export", return_value=10.0) as fused, \
+         mock.patch.object(export, "final_export", return_value=10.0), \
+         mock.patch.object(export, "video_has_expected_codecs", return_value=True):
+        duration = export.export_complete_video(
+            config, paths, False, logger=logging.getLogger("avm.test")
+        )
+    
+    assert duration == 10.0
+    if in_process_dsp:
+        process.assert_called_once()
+        assert mux_stems.call_args[0][1:3] == stems
+        mux_graph.assert_not_called()
+        fused.assert_not_called()
+    else:
+        process.assert_not_called()
+        mux_stems.assert_not_called()
+        fused.assert_called_once()
+
+
+@pytest.mark.parametrize("input_i, input_tp, expect_static_gain", [
+    (-14.2, -3.0, True),    # in tolerance, peak stays under the ceiling
+    (-14.4, -1.2, False),   # +0.4 dB of gain would push the peak over -1 dBTP
+    (-13.8, -1.1, True),    # negative gain lowers the peak
+    (-16.0, -6.0, False),   # out of tolerance
+])
+def test_static_gain_respects_true_peak(input_i, input_tp, expect_static_gain):
+    """The static-gain shortcut is only taken when the gained peak stays under target_tp."""
+    config = {"audio": {"target_lufs": -14.0, "target_tp": -1.0, "loudnorm_tolerance_lu": 0.5}}
+    measure_data = {"input_i": input_i, "input_tp": input_tp, "input_lra": 5.0,
+                    "input_thresh": -24.0, "target_offset": 0.0}
+    
+    chain = audio._voice_loudnorm_filter(config, measure_data)
+    
+    assert chain.startswith("volume=") == expect_static_gain
+    assert chain.startswith("loudnorm=") != expect_static_gain
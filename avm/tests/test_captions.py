@@ -13,7 +13,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from avm.pipeline.captions import (
     load_captions_srt, save_captions_srt, wrap_captions_by_pixel_width,
-    burn_captions, attach_soft_subs, _seconds_to_srt_time
+    burn_captions, attach_soft_subs, _seconds_to_srt_time,
+    adjust_caption_timing, iter_captions_srt
 )
 
 
@@ -201,7 +202,7 @@ def test_seconds_to_srt_time():
     
     # Test large values
     srt_time = _seconds_to_srt_time(3661.999)
-    assert srt_time == "01:01:01,998"  # Floating point precision
+    assert srt_time == "01:01:01,999"  # Integer ms math avoids the float % 1 drift
     
     # Test fractional seconds
     srt_time = _seconds_to_srt_time(1.001)
@@ -382,4 +383,171 @@ Caption number {i+1} with some content.
         # Clean up
         for file_path in [original_file, roundtrip_file]:
             if os.path.exists(file_path):
-                os.unlink(file_path)
\ No newline at end of file
+                os.unlink(file_path)
+
+def test_srt_parse_crlf_falls_back_to_srt_library():
+    """CRLF files skip the fast parser and still load via python-srt."""
+    crlf_content = "1\r\n00:00:01,000 --> 00:00:02,500\r\nWindows line endings\r\n\r\n"
+
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.srt', delete=False, newline='') as f:
+        original_file = f.name
+        f.write(crlf_content)
+
+    try:
+        captions = load_captions_srt(Path(original_file))
+        assert len(captions) == 1
+        assert captions[0]["start"] == 1.0
+        assert captions[0]["end"] == 2.5
+        assert captions[0]["content"] == "Windows line endings"
+    finally:
+        os.unlink(original_file)
+
+
+def test_adjust_caption_timing_avoids_transitions():
+    """Captions are pulled away from nearby slide transitions."""
+    captions = [
+        {"index": 1, "start": 0.0, "end": 4.0, "content": "Trim end"},
+        {"index": 2, "start": 4.2, "end": 8.0, "content": "Delay start"},
+        {"index": 3, "start": 10.0, "end": 12.0, "content": "Untouched"},
+    ]
+
+    adjusted = adjust_caption_timing(captions, [8.0, 4.0], margin=0.5)
+
+    assert adjusted[0]["start"] == 0.0
+    assert adjusted[0]["end"] == 3.5
+    assert adjusted[1]["start"] == 4.5
+    assert adjusted[1]["end"] == 7.5
+    assert adjusted[2]["start"] == 10.0
+    assert adjusted[2]["end"] == 12.0
+    assert captions[0]["end"] == 4.0  # input is not mutated
+
+
+def test_iter_captions_srt_is_lazy():
+    """iter_captions_srt yields the same cues as load_captions_srt."""
+    srt_content = """1
+00:00:01,000 --> 00:00:02,000
+One
+
+2
+00:00:02,000 --> 00:00:03,000
+Two
+"""
+
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.srt', delete=False) as f:
+        original_file = f.name
+        f.write(srt_content)
+
+    try:
+        iterator = iter_captions_srt(Path(original_file))
+        first = next(iterator)
+        assert first["content"] == "One"
+        assert [first, *iterator] == load_captions_srt(Path(original_file))
+    finally:
+        os.unlink(original_file)
+
+
+def test_wrap_captions_overflow_marks_ellipsis():
+    """Text that does not fit in two lines ends with an ellipsis."""
+    text = " ".join(["word"] * 40)
+
+    wrapped = wrap_captions_by_pixel_width(text, font_size=40, max_width_px=400)
+
+    max_chars = int(400 / (40 * 0.6))
+    assert len(wrapped) == 2
+    assert wrapped[-1].endswith("...")
+    assert all(len(line) <= max_chars for line in wrapped)
+
+
+def _wrap_two_line_reference(text, max_chars):
+    """The original word-by-word greedy wrap, without the two-line cap."""
+    lines = []
+    current = ""
+    for word in text.split():
+        trial = f"{current} {word}".strip()
+        if len(trial) <= max_chars:
+            current = trial
+        elif current:
+            lines.append(current)
+            current = word
+        else:
+            lines.append(word[:max_chars])
+            current = word[max_chars:]
+    if current:
+        lines.append(current)
+    return lines or [""]
+
+
+def test_wrap_captions_matches_word_wrap_when_text_fits():
+    """Text that fits in two lines wraps exactly as the word-by-word greedy wrap did."""
+    import random
+    
+    rng = random.Random(1234)
+    font_size = 40
+    compared = 0
+    for max_width_px in (120, 240, 400, 800):
+        max_chars = int(max_width_px / (font_size * 0.6))
+        for _ in range(300):
+            words = ["x" * rng.randint(1, max_chars) for _ in range(rng.randint(1, 12))]
+            text = rng.choice([" ", "  ", "\n", " \t "]).join(words)
+            expected = _wrap_two_line_reference(text, max_chars)
+            if len(expected) > 2:
+                continue
+            assert wrap_captions_by_pixel_width(text, font_size, max_width_px) == expected
+            compared += 1
+    assert compared > 100
+
+
+@pytest.mark.parametrize("max_width_px", [24, 48, 72])
+def test_wrap_captions_ellipsis_fits_narrow_lines(max_width_px):
+    """The overflow marker never makes a line wider than max_chars."""
+    max_chars = int(max_width_px / (40 * 0.6))
+    
+    wrapped = wrap_captions_by_pixel_width("aaa bbb ccc ddd eee", font_size=40,
+                                           max_width_px=max_width_px)
+    
+    assert len(wrapped) == 2
+    assert wrapped[-1].endswith("." * min(max_chars, 3))
+    assert all(len(line) <= max_chars for line in wrapped)
+
+
+@pytest.mark.parametrize("crop, scale_to", [("1280:720:0:0", None), (None, (640, 360)),
+                                            ("1280:720:0:0", (640, 360))])
+def test_burn_and_encode_empty_srt_keeps_crop_and_scale(tmp_path, crop, scale_to):
+    """A cue-less SRT still applies crop/scale instead of stream-copying the input."""
+    from unittest import mock
+    from avm.pipeline import captions as captions_module
+
+    video_in = tmp_path / "in.mp4"
+    video_in.write_bytes(b"")
+    srt_path = tmp_path / "empty.srt"
+    srt_path.write_text("")
+
+    with mock.patch.object(captions_module, "_run_burn") as run_burn:
+        captions_module.burn_and_encode(video_in, srt_path, tmp_path / "out.mp4", {},
+                                        scale_to=scale_to, crop=crop)
+
+    cmd = run_burn.call_args[0][0]
+    assert "-vf" in cmd
+    video_filter = cmd[cmd.index("-vf") + 1]
+    assert ("crop=1280:720:0:0" in video_filter) == bool(crop)
+    assert ("scale=640:360" in video_filter) == bool(scale_to)
+    assert "subtitles=" not in video_filter
+    assert "-c" not in cmd  # not a stream copy of the whole file
+
+
+def test_burn_captions_empty_srt_without_filters_remuxes(tmp_path):
+    """A cue-less SRT with nothing else to do is a plain remux."""
+    from unittest import mock
+    from avm.pipeline import captions as captions_module
+
+    video_in = tmp_path / "in.mp4"
+    video_in.write_bytes(b"")
+    srt_path = tmp_path / "empty.srt"
+    srt_path.write_text("")
+
+    with mock.patch.object(captions_module, "_run_burn") as run_burn:
+        burn_captions(video_in, srt_path, tmp_path / "out.mp4", "Arial", 40, 3, 12)
+
+    cmd = run_burn.call_args[0][0]
+    assert "-vf" not in cmd
+    assert cmd[cmd.index("-c") + 1] == "copy"
@@ -0,0 +1,75 @@
+"""
+Test configuration validation with and without fastjsonschema.
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add the avm package to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from avm.pipeline import config as config_module
+from avm.pipeline.config import load_default_config
+from avm.pipeline.errors import ConfigError
+
+
+def _schema_validate(config):
+    """Run the fastjsonschema path of validate_config."""
+    if config_module._VALIDATE is None:
+        pytest.skip("fastjsonschema not installed")
+    config_module.validate_config(config)
+
+
+VALIDATORS = [
+    pytest.param(_schema_validate, id="schema"),
+    pytest.param(config_module._validate_config_manual, id="manual"),
+]
+
+VALID_CONFIGS = [
+    {},
+    {"theme": "light", "fps": 30, "crf": 18, "zoom": 1},
+    {"fps": 30.0},
+    {"zoom": 1.5, "crf": 0},
+    {"audio": {"target_lufs": -14, "ducking": {"threshold": 0.5, "ratio": 1}}},
+    {"audio": {}},
+]
+
+INVALID_CONFIGS = [
+    {"theme": "blue"},
+    {"fps": True},
+    {"fps": 0},
+    {"fps": 30.5},
+    {"fps": "30"},
+    {"crf": 52},
+    {"crf": False},
+    {"zoom": True},
+    {"zoom": 3.5},
+    {"audio": None},
+    {"audio": {"target_lufs": 1.0}},
+    {"audio": {"target_lufs": True}},
+    {"audio": {"ducking": None}},
+    {"audio": {"ducking": {"threshold": 1.5}}},
+    {"audio": {"ducking": {"ratio": 0.5}}},
+]
+
+
+@pytest.mark.parametrize("validate", VALIDATORS)
+@pytest.mark.parametrize("config", VALID_CONFIGS)
+def test_validators_accept_same_configs(validate, config):
+    """Both validators accept the same valid configurations."""
+    validate(config)
+
+
+@pytest.mark.parametrize("validate", VALIDATORS)
+@pytest.mark.parametrize("config", INVALID_CONFIGS)
+def test_validators_reject_same_configs(validate, config):
+    """Both validators reject the same invalid configurations with ConfigError."""
+    with pytest.raises(ConfigError):
+        validate(config)
+
+
+@pytest.mark.parametrize("validate", VALIDATORS)
+def test_validators_accept_defaults(validate):
+    """The built-in defaults pass validation."""
+    validate(load_default_config())
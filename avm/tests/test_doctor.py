@@ -0,0 +1,106 @@
+"""
+Test doctor check isolation and result caching.
+"""
+
+import time
+import pytest
+from pathlib import Path
+import sys
+from unittest import mock
+
+# Add the avm package to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from avm.pipeline import doctor
+
+
+def test_call_with_timeout_kills_hung_check():
+    """A check that hangs is killed at the timeout instead of blocking the process."""
+    started = time.monotonic()
+
+    result = doctor._call_with_timeout("time", "sleep", [30], 0.5, "Chromium check timed out")
+
+    assert result == (False, "", "Chromium check timed out")
+    assert time.monotonic() - started < 5
+
+
+def test_call_with_timeout_returns_child_result():
+    """A check that finishes returns its own result from the child process."""
+    result = doctor._call_with_timeout("avm.pipeline.doctor", "check_python_version", [], 30, "")
+
+    assert result == doctor.check_python_version()
+
+
+def test_shallow_yuv420p_check_is_skipped_not_ok():
+    """Without deep probes the yuv420p check reports SKIPPED instead of OK."""
+    with mock.patch.object(doctor.shutil, "which", return_value="/usr/bin/ffmpeg"):
+        results = doctor._run_checks(deep=False)
+
+    assert results["yuv420p"]["status"] == doctor._STATUS_SKIPPED
+    assert "✅" not in results["yuv420p"]["status"]
+
+
+def _report(status="✅ OK"):
+    return {component: {"status": status, value_key: "x", "error": ""}
+            for component, _, value_key in doctor._CHECKS}
+
+
+@pytest.fixture
+def cached_doctor(tmp_path, monkeypatch):
+    """doctor() with a fixed stamp, a stubbed run and its cache under tmp_path."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.delenv("AVM_DOCTOR_REFRESH", raising=False)
+    monkeypatch.setattr(doctor, "_DOCTOR_CACHE", {})
+    monkeypatch.setattr(doctor, "print_doctor_results", lambda results: None)
+    monkeypatch.setattr(doctor, "suggest_fixes", lambda results: None)
+    stamp = ["env-1"]
+    monkeypatch.setattr(doctor, "_doctor_stamp", lambda deep: list(stamp))
+    run = mock.Mock(return_value=_report())
+    monkeypatch.setattr(doctor, "_run_checks", run)
+    return run, stamp, tmp_path / "avm" / "doctor.json"
+
+
+def test_doctor_reuses_cached_results(cached_doctor):
+    run, _, cache_file = cached_doctor
+
+    first = doctor.doctor()
+    doctor._DOCTOR_CACHE.clear()  # a new process only has the file on disk
+    second = doctor.doctor()
+
+    assert run.call_count == 1
+    assert cache_file.exists()
+    assert second == first
+
+
+def test_doctor_stamp_mismatch_reruns(cached_doctor):
+    run, stamp, _ = cached_doctor
+
+    doctor.doctor()
+    stamp[0] = "env-2"  # e.g. FFmpeg upgraded
+    doctor.doctor()
+    doctor._DOCTOR_CACHE.clear()
+    doctor.doctor()
+
+    assert run.call_count == 2
+
+
+def test_doctor_refresh_env_reruns(cached_doctor, monkeypatch):
+    run, _, _ = cached_doctor
+
+    doctor.doctor()
+    monkeypatch.setenv("AVM_DOCTOR_REFRESH", "1")
+    doctor.doctor()
+
+    assert run.call_count == 2
+
+
+def test_doctor_failing_report_is_not_persisted(cached_doctor):
+    run, _, cache_file = cached_doctor
+    run.return_value = _report("❌ FAIL")
+
+    doctor.doctor()
+    doctor._DOCTOR_CACHE.clear()
+    doctor.doctor()
+
+    assert not cache_file.exists()
+    assert run.call_count == 2
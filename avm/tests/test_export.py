@@ -0,0 +1,183 @@
+"""
+Test export routing and the MP4 header parsing used by the export checks.
+"""
+
+import logging
+import struct
+from pathlib import Path
+from unittest import mock
+import sys
+
+import pytest
+
+# Add the avm package to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from avm.pipeline import export
+from avm.pipeline.io_paths import ProjectPaths
+
+
+def _box(kind: bytes, payload: bytes) -> bytes:
+    return struct.pack(">I4s", 8 + len(payload), kind) + payload
+
+
+def _descriptor(tag: int, payload: bytes) -> bytes:
+    # Four-byte expandable size, as most muxers write it
+    size = len(payload)
+    return bytes([tag, 0x80 | (size >> 21) & 0x7F, 0x80 | (size >> 14) & 0x7F,
+                  0x80 | (size >> 7) & 0x7F, size & 0x7F]) + payload
+
+
+def _trak(handler: bytes, entry: bytes) -> bytes:
+    hdlr = _box(b"hdlr", b"\0" * 8 + handler + b"\0" * 12)
+    stsd = _box(b"stsd", b"\0" * 4 + struct.pack(">I", 1) + entry)
+    stbl = _box(b"stbl", stsd)
+    return _box(b"trak", _box(b"mdia", hdlr + _box(b"minf", stbl)))
+
+
+def _mp4a_entry(object_type) -> bytes:
+    fields = (b"\0" * 6 + struct.pack(">H", 1) + b"\0" * 8
+              + struct.pack(">HHHHI", 2, 16, 0, 0, 48000 << 16))
+    if object_type is None:
+        return _box(b"mp4a", fields)
+    decoder_config = _descriptor(0x04, bytes([object_type, 0x15]) + b"\0" * 11)
+    es = _descriptor(0x03, struct.pack(">HB", 1, 0) + decoder_config)
+    return _box(b"mp4a", fields + _box(b"esds", b"\0" * 4 + es))
+
+
+def _write_mp4(path: Path, audio_entry: bytes) -> Path:
+    video = _trak(b"vide", _box(b"avc1", b"\0" * 78))
+    audio = _trak(b"soun", audio_entry)
+    path.write_bytes(_box(b"ftyp", b"isom\0\0\0\0") + _box(b"moov", video + audio))
+    return path
+
+
+@pytest.mark.parametrize("object_type, expected", [
+    (0x40, "aac"),
+    (0x67, "aac"),
+    (0x6B, "mp3"),
+    (0x69, "mp3"),
+])
+def test_stream_codecs_reads_mp4a_object_type(tmp_path, object_type, expected):
+    """mp4a tracks are named by their esds objectTypeIndication, not assumed AAC."""
+    video_path = _write_mp4(tmp_path / "out.mp4", _mp4a_entry(object_type))
+    
+    assert export._stream_codecs(video_path) == (["h264"], [expected])
+    assert export.video_has_expected_codecs(video_path) == (expected == "aac")
+
+
+def test_mp4_codec_tags_without_esds_defers_to_probe(tmp_path):
+    """An mp4a entry without a readable esds is not parsed as AAC."""
+    video_path = _write_mp4(tmp_path / "out.mp4", _mp4a_entry(None))
+    
+    assert export._mp4_codec_tags(video_path) is None
+
+
+def _route(tmp_path, export_config):
+    """Run export_complete_video with every encode path mocked; return the one taken."""
+    paths = ProjectPaths(tmp_path, "demo")
+    paths.video_nocap_mp4.write_bytes(b"")
+    paths.audio_wav.write_bytes(b"")
+
+    with mock.patch.object(export, "_fused_export", return_value=10.0) as fused, \
+         mock.patch.object(export, "_stream_export", return_value=10.0) as streaming, \
+         mock.patch.object(export, "mux_audio_graph", return_value=10.0), \
+         mock.patch.object(export, "final_export", return_value=10.0) as final, \
+         mock.patch.object(export, "video_has_expected_codecs", return_value=True):
+        export.export_complete_video({"export": export_config}, paths, True,
+                                     logger=logging.getLogger("avm.test"))
+
+    taken = [name for name, m in (("fused", fused), ("streaming", streaming), ("two-step", final))
+             if m.called]
+    assert len(taken) == 1
+    return taken[0]
+
+
+@pytest.mark.parametrize("export_config, expected", [
+    ({"fused": True}, "fused"),
+    ({"fused": True, "trim": {"start": 5.0}}, "two-step"),
+    ({"fused": True, "trim": {"end": 30.0}}, "two-step"),
+    ({"streaming": True}, "streaming"),
+    ({"streaming": True, "trim": {"start": 5.0, "end": 30.0}}, "two-step"),
+    ({"streaming": True, "trim": {"end": 30.0}}, "two-step"),
+    ({"fused": True, "streaming": True, "trim": {"start": 2.0}}, "two-step"),
+])
+def test_trimmed_exports_take_the_two_step_path(tmp_path, export_config, expected):
+    """export.trim is never dropped by an export path that cannot apply it."""
+    assert _route(tmp_path, export_config) == expected
+
+
+def _chunk_plan(tmp_path, keyframes, chunks, duration=100.0):
+    """Run _parallel_encode with ffmpeg mocked; return segment (start, end) pairs or 'single'."""
+    in_video = tmp_path / "in.mp4"
+    in_video.write_bytes(b"")
+    commands = []
+
+    with mock.patch.object(export, "_get_video_duration", return_value=duration), \
+         mock.patch.object(export, "_keyframe_times", return_value=keyframes), \
+         mock.patch.object(export, "_run_ffmpeg", side_effect=commands.append), \
+         mock.patch.object(export, "_encode_final_video") as single:
+        export._parallel_encode(in_video, tmp_path / "out.mp4", 18, "veryfast", chunks)
+
+    if single.called:
+        assert not commands
+        return "single"
+
+    segments = [cmd for cmd in commands if "-an" in cmd]
+    concat = [cmd for cmd in commands if "concat" in cmd]
+    assert len(concat) == 1 and len(segments) + 1 == len(commands)
+
+    def option(cmd, name):
+        return float(cmd[cmd.index(name) + 1]) if name in cmd else None
+
+    return [(option(cmd, "-ss"), option(cmd, "-to")) for cmd in segments]
+
+
+def test_parallel_encode_snaps_cuts_to_next_keyframe(tmp_path):
+    """Even split points move forward to the next keyframe."""
+    keyframes = [float(t) for t in range(0, 100, 2)]  # every 2 s
+
+    plan = _chunk_plan(tmp_path, keyframes, chunks=4)
+
+    assert plan == [(0.0, 26.0), (26.0, 50.0), (50.0, 76.0), (76.0, None)]
+
+
+def test_parallel_encode_deduplicates_cuts(tmp_path):
+    """Split points that snap to the same keyframe produce one cut."""
+    plan = _chunk_plan(tmp_path, [0.0, 60.0], chunks=4)
+
+    assert plan == [(0.0, 60.0), (60.0, None)]
+
+
+@pytest.mark.parametrize("keyframes", [
+    [],             # no keyframes listed
+    [0.0],          # only the first frame
+    [0.0, 100.0],   # the only later keyframe is at the end
+    [0.0, 120.0],   # ... or past it
+])
+def test_parallel_encode_without_usable_cuts_encodes_once(tmp_path, keyframes):
+    """Without a keyframe strictly inside the video, a single encode runs instead."""
+    assert _chunk_plan(tmp_path, keyframes, chunks=4) == "single"
+
+
+@pytest.mark.parametrize("export_config, cpu_count, duration, expected", [
+    ({"parallel_chunks": 4}, 8, 120.0, 4),
+    ({"parallel_chunks": 4}, 8, 59.9, 1),                            # under parallel_min_sec
+    ({"parallel_chunks": 4, "parallel_min_sec": 30.0}, 8, 45.0, 4),
+    ({"parallel_chunks": 1}, 64, 600.0, 1),                          # explicitly disabled
+    ({"parallel_chunks": 0}, 16, 120.0, 4),                          # default: cpu_count // 4
+    ({}, 8, 60.0, 2),
+    ({}, 7, 600.0, 1),                                               # too few cores to split
+    ({}, None, 600.0, 1),
+])
+def test_parallel_chunk_count(tmp_path, export_config, cpu_count, duration, expected):
+    """Chunking needs at least two chunks and a long enough input."""
+    with mock.patch.object(export.os, "cpu_count", return_value=cpu_count), \
+         mock.patch.object(export, "_get_video_duration", return_value=duration):
+        assert export._parallel_chunk_count(tmp_path / "in.mp4", export_config) == expected
+
+
+def test_parallel_chunk_count_unreadable_duration(tmp_path):
+    """A video whose duration cannot be read is encoded in one piece."""
+    with mock.patch.object(export, "_get_video_duration", side_effect=export.RenderError("bad")):
+        assert export._parallel_chunk_count(tmp_path / "in.mp4", {"parallel_chunks": 4}) == 1
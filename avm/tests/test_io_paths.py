@@ -0,0 +1,93 @@
+"""
+Test stat-first cache validation in should_skip_step.
+"""
+
+import os
+import pytest
+from pathlib import Path
+import sys
+from unittest import mock
+
+# Add the avm package to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from avm.pipeline import io_paths
+from avm.pipeline.io_paths import should_skip_step, update_manifest_step
+
+
+@pytest.fixture(autouse=True)
+def _clear_hash_cache():
+    io_paths._HASH_CACHE.clear()
+    yield
+    io_paths._HASH_CACHE.clear()
+
+
+@pytest.fixture
+def built(tmp_path):
+    """A completed 'render' step with one input and one newer output."""
+    src = tmp_path / "slides.md"
+    src.write_text("# One\n")
+    out = tmp_path / "slides.png"
+    out.write_bytes(b"png")
+    st = src.stat()
+    os.utime(out, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    manifest = {"steps": {}}
+    update_manifest_step(manifest, "render", [src], [out], 12.0)
+    io_paths._HASH_CACHE.clear()
+    return manifest, src, out
+
+
+def _skip(manifest, src, out, **kwargs):
+    return should_skip_step("render", manifest, [src], [out], **kwargs)
+
+
+def test_unchanged_stat_skips_without_hashing(built):
+    manifest, src, out = built
+    with mock.patch.object(io_paths, "file_hash") as file_hash:
+        assert _skip(manifest, src, out)
+    file_hash.assert_not_called()
+
+
+def test_same_size_new_mtime_reruns(built):
+    manifest, src, out = built
+    st = src.stat()
+    src.write_text("# Two\n")  # same length, different content
+    os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + 5 * 10**8))
+
+    assert src.stat().st_size == st.st_size
+    assert not _skip(manifest, src, out)
+
+
+def test_strict_rehashes_unchanged_inputs(built):
+    manifest, src, out = built
+    with mock.patch.object(io_paths, "file_hash", wraps=io_paths.file_hash) as file_hash:
+        assert _skip(manifest, src, out, strict=True)
+    file_hash.assert_called_once()
+
+
+def test_strict_catches_edit_that_kept_stat(built):
+    manifest, src, out = built
+    st = src.stat()
+    src.write_text("# Two\n")
+    os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    assert _skip(manifest, src, out)
+    assert not _skip(manifest, src, out, strict=True)
+
+
+def test_manifest_without_input_stats_falls_back_to_hashes(built):
+    manifest, src, out = built
+    # Manifests written before stat tracking carry only hashes and mtimes
+    del manifest["stat_hash_cache"]
+    del manifest["steps"]["render"]["input_stats"]
+
+    with mock.patch.object(io_paths, "file_hash", wraps=io_paths.file_hash) as file_hash:
+        assert _skip(manifest, src, out)
+    file_hash.assert_called_once()
+
+    io_paths._HASH_CACHE.clear()
+    st = src.stat()
+    src.write_text("# Two\n")
+    os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert not _skip(manifest, src, out)